@@ -4,24 +4,38 @@ Command line tool to validate Office document XML files against XSD schemas and
 
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <packed_file> --original <original_file>
+    python validate.py <dir> --original <original_file> --format json
+    python validate.py <dir> --original <original_file> --max-errors 20 --time-budget 10
+
+Exit status: 0 if valid, 1 if invalid, 2 if no errors were found but checks
+were skipped by --max-errors/--fail-fast/--time-budget.
+
+    # Keep schemas and baselines warm for the rest of the session (optional);
+    # validate.py uses the service while it runs
+    python validate.py --serve &
+    python validate.py --stop-service
 """
 
 import argparse
+import contextlib
+import io
+import json
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation.client import request_validation, stop_service
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        nargs="?",
+        help="Path to unpacked Office document directory, or a packed .docx/.pptx/.xlsx file",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
     parser.add_argument(
@@ -30,39 +44,156 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the persisted original-file baseline cache",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format: text messages (default) or a JSON report of every check",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Check every part, including parts unchanged from the original",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        help="Skip the remaining checks once this many errors have been found",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Skip the remaining checks after the first failing one",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Skip the checks (and XSD parts) still pending after this many seconds",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the validation service on a local socket "
+        "($OOXML_VALIDATION_SOCKET) until idle for --idle-timeout seconds",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=1800,
+        help="Seconds without requests before the service exits (default: 1800)",
+    )
+    parser.add_argument(
+        "--stop-service",
+        action="store_true",
+        help="Stop a running validation service",
+    )
+    parser.add_argument(
+        "--no-service",
+        action="store_true",
+        help="Validate in this process even if the validation service is running",
+    )
     args = parser.parse_args()
 
+    if args.serve:
+        from validation.service import ValidationService
+
+        try:
+            ValidationService(idle_timeout=args.idle_timeout).serve()
+        except RuntimeError as e:
+            sys.exit(f"Error: {e}")
+        except KeyboardInterrupt:
+            pass
+        return
+    if args.stop_service:
+        if not stop_service():
+            sys.exit("Error: No validation service is running")
+        print("Validation service stopped")
+        return
+    if args.unpacked_dir is None or args.original is None:
+        parser.error("the following arguments are required: unpacked_dir, --original")
+
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or (
+        unpacked_dir.is_file() and unpacked_dir.suffix.lower() == file_extension
+    ), f"Error: {unpacked_dir} is not a directory or a {file_extension} file"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
-    # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
-
-    # Run validators
-    success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
-
-    if success:
+    options = {
+        "verbose": args.verbose,
+        "use_cache": not args.no_cache,
+        "jobs": args.jobs,
+        "incremental": not args.full,
+        "max_errors": args.max_errors,
+        "fail_fast": args.fail_fast,
+        "time_budget": args.time_budget,
+    }
+
+    # Use the validation service if one is running, otherwise validate here
+    result = None
+    if not args.no_service:
+        result = request_validation(unpacked_dir, original_file, **options)
+
+    if result is not None:
+        success, reports, text = (
+            result["passed"],
+            result["validators"],
+            result["output"],
+        )
+        if args.format == "text":
+            print(text, end="")
+    else:
+        from validation.service import run_validators
+
+        # In JSON mode the validators' text output is captured, not printed
+        output = io.StringIO()
+        with contextlib.redirect_stdout(
+            output if args.format == "json" else sys.stdout
+        ):
+            success, reports = run_validators(unpacked_dir, original_file, **options)
+        text = output.getvalue()
+
+    # Checks skipped by a budget leave a passing result unconfirmed
+    incomplete = any(r["incomplete"] for r in reports)
+
+    if args.format == "json":
+        result = {
+            "passed": success,
+            "incomplete": incomplete,
+            "document": str(unpacked_dir),
+            "original": str(original_file),
+            "duration_seconds": round(sum(r["duration_seconds"] for r in reports), 6),
+            "validators": reports,
+            "output": text,
+        }
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    elif success and incomplete:
+        print("Validation INCOMPLETE - some checks were skipped (see SKIPPED above)")
+    elif success:
         print("All validations PASSED!")
 
-    sys.exit(0 if success else 1)
+    if not success:
+        sys.exit(1)
+    sys.exit(2 if incomplete else 0)
 
 
 if __name__ == "__main__":
@@ -2,11 +2,26 @@
 Base validator with common validation logic for document files.
 """
 
+import concurrent.futures
+import os
+import posixpath
 import re
 from pathlib import Path
 
 import lxml.etree
 
+from .baseline import OriginalBaseline
+from .graph import CONTENT_TYPES_PART, PackageGraph
+from .package import open_package
+from .results import ValidationReport
+from .rules import RelationshipIdRule, RuleEngine, UniqueIdRule
+from .schemas import SCHEMA_REGISTRY
+from .trees import TreeRegistry, canonical_digest
+
+# Template tags such as {{ name }}, removed from text before XSD validation
+_TEMPLATE_TAG = re.compile(r"\{\{[^}]*\}\}")
+_TEMPLATE_TEXT = lxml.etree.XPath('//text()[contains(., "{{")]')
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,18 +118,68 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        use_cache=True,
+        jobs=1,
+        incremental=True,
+        budget=None,
+    ):
+        # Unpacked directory, or a packed file whose members are read from the zip
+        self.package_path = Path(unpacked_dir)
+        self.unpacked_dir = open_package(unpacked_dir)
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Number of worker processes for XSD validation (0 or None: one per CPU)
+        self.jobs = jobs if jobs else os.cpu_count() or 1
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # Compiled schemas are shared process-wide
+        self.schema_registry = SCHEMA_REGISTRY
+
+        # Original parts are read from the zip once per run; their XSD errors
+        # are computed lazily and persisted between runs unless use_cache=False
+        self.baseline = OriginalBaseline(self.original_file, self, use_cache=use_cache)
+
+        # Each part is parsed once per run and shared by all checks
+        self.trees = TreeRegistry()
+
+        # Element/attribute rules share one walk per part, run on first use
+        self._rule_results = None
+        self._rule_parts = {}
+
+        # Schema/baseline counters of the last validate_against_xsd() run
+        self.xsd_stats = {}
+
+        # Parts identical to the original (ignoring formatting) skip per-part checks
+        self.incremental = incremental
+        self._unchanged = {}
+
+        # Structured results of each check run through run_check(); checks stop
+        # early once the (optional) ValidationBudget is used up
+        self.report = ValidationReport(
+            type(self).__name__,
+            trees=self.trees,
+            stats=self.collect_stats,
+            budget=budget,
+        )
+
+        # Parts, content types and relationships, listed once and shared by the
+        # reference and content-type checks
+        self.package_graph = PackageGraph(self.unpacked_dir, self.trees)
+
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            self.package_graph.path(part)
+            for suffix in (".xml", ".rels")
+            for part in self.package_graph.parts
+            if part.endswith(suffix)
         ]
 
         if not self.xml_files:
@@ -124,6 +189,100 @@ class BaseSchemaValidator:
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def run_check(self, check):
+        """Run a validate_* method, recording its timing and errors in self.report.
+
+        The check is named after the method without its "validate_" prefix.
+        """
+        return self.report.run_check(check.__name__.removeprefix("validate_"), check)
+
+    def collect_stats(self):
+        """Return run-wide parsing, cache and incremental-validation counters."""
+        stats = dict(self.trees.stats())
+        stats.update(self.xsd_stats)
+        stats["parts_total"] = len(self.xml_files)
+        stats["parts_unchanged"] = sum(self._unchanged.values())
+
+        schema_lookups = stats.get("schema_cache_hits", 0) + stats.get(
+            "schemas_compiled", 0
+        )
+        baseline_lookups = stats.get("baseline_cache_hits", 0) + stats.get(
+            "baseline_cache_misses", 0
+        )
+        stats["schema_cache_hit_rate"] = (
+            stats["schema_cache_hits"] / schema_lookups if schema_lookups else None
+        )
+        stats["baseline_cache_hit_rate"] = (
+            stats["baseline_cache_hits"] / baseline_lookups
+            if baseline_lookups
+            else None
+        )
+        return stats
+
+    def create_rules(self):
+        """Create the rules run by the shared per-part tree walk.
+
+        Subclasses extend this list with format-specific rules.
+        """
+        return [UniqueIdRule(self), RelationshipIdRule(self)]
+
+    def _rule_errors(self, name):
+        """Return errors found by the named rule, walking all parts on first use."""
+        if self._rule_results is None:
+            engine = RuleEngine(self, self.create_rules())
+            self._rule_results = engine.run(self.xml_files)
+            self._rule_parts = engine.parts_examined
+        if self.report.current is not None:
+            self.report.current.parts_examined = self._rule_parts[name]
+        return self._rule_results[name]
+
+    def is_unchanged(self, xml_file):
+        """Return True if xml_file matches the same part in the original document.
+
+        Parts are compared by canonical digest, so the pretty-printing applied by
+        unpack.py does not count as a change. Always False when incremental
+        validation is disabled or the part cannot be parsed.
+        """
+        if not self.incremental:
+            return False
+
+        key = str(xml_file)
+        if key not in self._unchanged:
+            name = xml_file.relative_to(self.unpacked_dir).as_posix()
+            original_digest = self.baseline.digest_for(name)
+            # Comparing digests does not count as examining the part for the
+            # running check's parts_examined
+            accessed = key in self.trees.accessed
+            try:
+                self._unchanged[key] = bool(original_digest) and (
+                    canonical_digest(self.trees.getroot(xml_file)) == original_digest
+                )
+            except Exception:
+                self._unchanged[key] = False
+            if not accessed:
+                self.trees.accessed.discard(key)
+        return self._unchanged[key]
+
+    def print_parse_stats(self):
+        """Print how many times parts were parsed during this run (verbose mode)."""
+        if not self.verbose:
+            return
+        stats = self.trees.stats()
+        print(
+            f"Parsed {stats['parts_parsed']} parts ({stats['bytes_parsed']:,} bytes) "
+            f"with {stats['parses']} parses and {stats['copies']} tree copies"
+        )
+        for path, count in sorted(self.trees.parse_counts.items()):
+            if count > 1:
+                relative_path = Path(path).relative_to(str(self.unpacked_dir))
+                print(f"  - {relative_path}: parsed {count} times")
+        if self.incremental:
+            unchanged = sum(self._unchanged.values())
+            print(
+                f"Skipped {unchanged} of {len(self.xml_files)} parts unchanged from "
+                "the original (XSD, namespace and ID checks)"
+            )
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
@@ -131,7 +290,7 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self.trees.get(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -144,6 +303,7 @@ class BaseSchemaValidator:
                 )
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} XML violations:")
             for error in errors:
                 print(error)
@@ -158,8 +318,10 @@ class BaseSchemaValidator:
         errors = []
 
         for xml_file in self.xml_files:
+            if self.is_unchanged(xml_file):
+                continue
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.getroot(xml_file)
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -175,6 +337,7 @@ class BaseSchemaValidator:
                 continue
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - {len(errors)} namespace issues:")
             for error in errors:
                 print(error)
@@ -185,86 +348,10 @@ class BaseSchemaValidator:
 
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
-        errors = []
-        global_ids = {}  # Track globally unique IDs across all files
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = self._rule_errors(UniqueIdRule.name)
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
             for error in errors:
                 print(error)
@@ -279,96 +366,51 @@ class BaseSchemaValidator:
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        graph = self.package_graph
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_parts = graph.rels_parts
 
-        if not rels_files:
+        if not rels_parts:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
+        # Get all files in the package (excluding reference files)
+        target_parts = [
+            part
+            for part in graph.parts
+            if posixpath.basename(part) != CONTENT_TYPES_PART
+            and not part.endswith(".rels")
+        ]  # This file is not referenced by .rels
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(rels_parts)} .rels files and {len(target_parts)} target files"
             )
 
-        # Check each .rels file
-        for rels_file in rels_files:
+        # Check each .rels file; targets are resolved once, in the package graph
+        for rels_part in rels_parts:
             try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
-
+                relationships = graph.relationships(rels_part)
             except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                errors.append(f"  Error parsing {rels_part}: {e}")
+                continue
 
-        # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
+            for rel in relationships:
+                # External URLs have no target part
+                if rel.target_part is not None and not graph.has_part(rel.target_part):
+                    errors.append(
+                        f"  {rels_part}: Line {rel.line}: Broken reference to {rel.target}"
+                    )
 
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+        # Check for unreferenced files (files that exist but are not referenced anywhere)
+        unreferenced_parts = [part for part in target_parts if not graph.incoming(part)]
+        for part in sorted(unreferenced_parts, key=lambda part: part.split("/")):
+            errors.append(f"  Unreferenced file: {part}")
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
             for error in errors:
                 print(error)
@@ -390,89 +432,10 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
-        errors = []
-
-        # Process each XML file that might contain r:id references
-        for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
-
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
-                continue
-
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+        errors = self._rule_errors(RelationshipIdRule.name)
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
             for error in errors:
                 print(error)
@@ -524,32 +487,17 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        graph = self.package_graph
+        if not graph.has_part(CONTENT_TYPES_PART):
+            self.report.add_error("[Content_Types].xml file not found")
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Get all declared parts (Override) and extensions (Default)
+            defaults, overrides = graph.content_types()
+            declared_parts = set(overrides)
+            declared_extensions = set(defaults)
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,15 +523,9 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
+                path_str = graph.part_name(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -593,7 +535,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self.trees.getroot(xml_file).tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -605,28 +547,27 @@ class BaseSchemaValidator:
                     continue  # Skip unparseable files
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for part in graph.parts:
+                name = posixpath.basename(part)
+                extension = posixpath.splitext(name)[1].lstrip(".").lower()
                 # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
-                    continue
-                if file_path.name == "[Content_Types].xml":
+                if extension in {"xml", "rels"} or name == CONTENT_TYPES_PART:
                     continue
-                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                if {"_rels", "docProps"} & set(part.split("/")):
                     continue
 
-                extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {part}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
 
         except Exception as e:
             errors.append(f"  Error parsing [Content_Types].xml: {e}")
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} content type declaration errors:")
             for error in errors:
                 print(error)
@@ -649,7 +590,9 @@ class BaseSchemaValidator:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
         # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
+        if isinstance(xml_file, str):
+            xml_file = Path(xml_file)
+        xml_file = xml_file.resolve()
         unpacked_dir = self.unpacked_dir.resolve()
 
         # Validate current file
@@ -673,7 +616,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,12 +635,39 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
+        # Unchanged parts have exactly the original's errors, so none are new
+        xml_files = [f for f in self.xml_files if not self.is_unchanged(f)]
+        unchanged_count = len(self.xml_files) - len(xml_files)
+
+        if self.jobs > 1 and len(xml_files) > 1:
+            results, stats = self._validate_xsd_in_workers(xml_files)
+        else:
+            stats_before = self._xsd_stats()
+            results = []
+            pending_errors = 0
+            for xml_file in xml_files:
+                if self.report.stop_reason(pending_errors):
+                    break
+                result = self.validate_file_against_xsd(xml_file, verbose=False)
+                results.append(result)
+                pending_errors += len(result[1])
+            stats = _stats_delta(self._xsd_stats(), stats_before)
+
+        # Parts left when the budget ran out are reported, not validated
+        budget_skipped = len(xml_files) - len(results)
+        if budget_skipped:
+            reason = self.report.stop_reason(sum(len(errors) for _, errors in results))
+            if self.report.current is not None:
+                self.report.current.stopped_early = reason
+            print(
+                f"SKIPPED - {budget_skipped} of {len(xml_files)} parts not validated "
+                f"against XSD: {reason}"
             )
 
+        # Results are in self.xml_files order, so output matches serial mode
+        for xml_file, (is_valid, new_file_errors) in zip(xml_files, results):
+            relative_path = str(xml_file.relative_to(self.unpacked_dir))
+
             if is_valid is None:
                 skipped_count += 1
                 continue
@@ -711,22 +681,53 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
+            for error in sorted(new_file_errors):
+                self.report.add_error(error, part=relative_path)
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
+        self.xsd_stats = stats
+        if self.report.current is not None:
+            self.report.current.parts_examined = len(xml_files) - skipped_count
+            self.report.current.details = {
+                "valid": valid_count,
+                "skipped_no_schema": skipped_count,
+                "skipped_unchanged": unchanged_count,
+                "skipped_budget": budget_skipped,
+                "with_original_errors": original_error_count,
+                **stats,
+            }
+
         # Print summary
         if self.verbose:
             print(f"Validated {len(self.xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
+            if self.incremental:
+                print(f"  - Skipped (unchanged from original): {unchanged_count}")
+            if budget_skipped:
+                print(f"  - Skipped (budget used up): {budget_skipped}")
             if original_error_count:
                 print(f"  - With original errors (ignored): {original_error_count}")
             print(
                 f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
             )
+            print(
+                f"  - Schema compile: {stats['compile_seconds']:.2f}s "
+                f"({stats['schemas_compiled']} schemas), "
+                f"validate: {stats['validate_seconds']:.2f}s "
+                f"({stats['parts_validated']} parts)"
+            )
+            print(
+                f"  - Original baseline: {stats['baseline_cache_hits']} cached, "
+                f"{stats['baseline_cache_misses']} computed"
+            )
+
+        # Persist any original-file errors computed during this run
+        self.baseline.save()
 
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
@@ -738,6 +739,57 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _xsd_stats(self):
+        """Return schema registry and baseline counters for this process."""
+        stats = self.schema_registry.stats()
+        stats["baseline_cache_hits"] = self.baseline.cache_hits
+        stats["baseline_cache_misses"] = self.baseline.cache_misses
+        return stats
+
+    def _validate_xsd_in_workers(self, xml_files):
+        """Validate xml_files against XSD schemas in a pool of worker processes.
+
+        Each worker builds its own validator once and keeps its compiled schemas
+        warm for every part it handles. Original-file errors computed by workers
+        are merged back into this process's baseline so they are persisted once.
+
+        Returns:
+            tuple: (results, stats) where results holds (is_valid, new_errors) per
+                   file in xml_files order (cut short if the budget is used up)
+                   and stats sums the workers' counters
+        """
+        # Workers open the package themselves, so send package-relative names
+        names = [f.relative_to(self.unpacked_dir).as_posix() for f in xml_files]
+        chunksize = max(1, len(names) // (self.jobs * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                self.package_path,
+                self.original_file,
+                self.baseline.use_cache,
+            ),
+        ) as executor:
+            results = []
+            stats = {}
+            pending_errors = 0
+            worker_results = executor.map(
+                _validate_xsd_in_worker, names, chunksize=chunksize
+            )
+            for is_valid, new_errors, part_stats, computed in worker_results:
+                results.append((is_valid, new_errors))
+                for key, value in part_stats.items():
+                    stats[key] = stats.get(key, 0) + value
+                self.baseline.merge(computed)
+
+                # Parts not yet handed to a worker are dropped once the budget is used up
+                pending_errors += len(new_errors)
+                if self.report.stop_reason(pending_errors):
+                    executor.shutdown(cancel_futures=True)
+                    break
+        return results, stats
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -762,67 +814,6 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
-
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
-
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
-
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
-
-        return lxml.etree.ElementTree(xml_copy)
-
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
-        elements_to_remove = []
-
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
-
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
-
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
-
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
-
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
-
-        return xml_doc
-
     def _validate_single_file_xsd(self, xml_file, base_path):
         """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
         schema_path = self._get_schema_path(xml_file)
@@ -830,38 +821,27 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
-
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
-
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
-
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
-
-            # Validate
-            if schema.validate(xml_doc):
-                return True, set()
-            else:
-                errors = set()
-                for error in schema.error_log:
-                    # Store normalized error message (without line numbers for comparison)
-                    errors.add(error.message)
-                return False, errors
+            # Preprocessing modifies the tree, so work on a copy of the shared one
+            xml_doc = self.trees.copy(xml_file)
+        except Exception as e:
+            return False, {str(e)}
+
+        return self._validate_xml_doc_xsd(
+            xml_doc, xml_file.relative_to(base_path), schema_path
+        )
+
+    def _validate_xml_doc_xsd(self, xml_doc, relative_path, schema_path):
+        """Preprocess a parsed XML document in place and validate it.
+
+        Returns:
+            tuple: (is_valid, errors_set)
+        """
+        try:
+            self._preprocess_for_xsd(xml_doc, relative_path)
+
+            # Validate against the shared compiled schema. Errors are normalized
+            # messages (without line numbers) so they can be compared with the original.
+            return self.schema_registry.validate(schema_path, xml_doc)
 
         except Exception as e:
             return False, {str(e)}
@@ -875,76 +855,108 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
+        if isinstance(xml_file, str):
+            xml_file = Path(xml_file)
+        xml_file = xml_file.resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        return self.baseline.errors_for(relative_path.as_posix())
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+    def _preprocess_for_xsd(self, xml_doc, relative_path):
+        """Prepare a parsed part for XSD validation, modifying it in place.
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
-
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
+        - Template tags ({{ ... }}, placeholders for content replacement) are
+          removed from text and tails, except those of w:t elements
+        - mc:Ignorable is removed from the root element
+        - In main content folders (word/, ppt/, xl/), attributes and elements
+          outside OOXML_NAMESPACES are removed
 
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+        Text holding template tags is found with one XPath query, and namespaces
+        are cleaned in a single walk over the elements. Callers holding a shared
+        tree must pass a copy (see TreeRegistry.copy).
 
         Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
+            list: Warnings for the template tags that were removed
         """
         warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
+        root = xml_doc.getroot()
 
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
+        for text in _TEMPLATE_TEXT(root):
+            owner = text.getparent()
+            # Comments keep their tails, w:t elements their text and tails
+            if owner is None or callable(owner.tag):
+                continue
+            if owner.tag == "t" or owner.tag.endswith("}t"):
                 continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
+            matches = _TEMPLATE_TAG.findall(text)
+            if not matches:
+                continue
+            content_type = "tail content" if text.is_tail else "text content"
+            warnings.extend(
+                f"Found template tag in {content_type}: {match}" for match in matches
+            )
+            if text.is_tail:
+                owner.tail = _TEMPLATE_TAG.sub("", owner.tail)
+            else:
+                owner.text = _TEMPLATE_TAG.sub("", owner.text)
+
+        root.attrib.pop(f"{{{self.MC_NAMESPACE}}}Ignorable", None)
+
+        if not (
+            relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        ):
+            return warnings
+
+        allowed = {}  # Clark name -> whether it is in an allowed namespace
+        foreign_elements = []
+        for elem in root.iter(lxml.etree.Element):
+            for name in (elem.tag, *elem.keys()):
+                if name not in allowed:
+                    allowed[name] = (
+                        not name.startswith("{")
+                        or name[1 : name.index("}")] in self.OOXML_NAMESPACES
+                    )
+            if not allowed[elem.tag]:
+                foreign_elements.append(elem)
                 continue
+            for attr in elem.keys():
+                if not allowed[attr]:
+                    del elem.attrib[attr]
+
+        # Removing an element drops its subtree (and tail); the root always stays
+        for elem in foreign_elements:
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
+
+        return warnings
+
+
+def _stats_delta(after, before):
+    """Subtract two counter snapshots key by key."""
+    return {key: after[key] - before.get(key, 0) for key in after}
+
+
+# Validator owned by an XSD worker process (see _validate_xsd_in_workers)
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_cls, unpacked_dir, original_file, use_cache):
+    global _worker_validator
+    _worker_validator = validator_cls(
+        unpacked_dir, original_file, verbose=False, use_cache=use_cache
+    )
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+def _validate_xsd_in_worker(name):
+    validator = _worker_validator
+    xml_file = validator.unpacked_dir / name
+    stats_before = validator._xsd_stats()
+    is_valid, new_errors = validator.validate_file_against_xsd(xml_file, verbose=False)
+    stats = _stats_delta(validator._xsd_stats(), stats_before)
+    return is_valid, new_errors, stats, validator.baseline.take_computed()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,289 @@
+"""
+Baseline index of XSD errors already present in the original document.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+
+import lxml.etree
+
+from .trees import canonical_digest
+
+# Bump when a change to preprocessing or error normalization invalidates cached baselines
+BASELINE_FORMAT_VERSION = 2
+
+
+def default_cache_dir():
+    """Return the directory used to persist baselines between runs."""
+    env_dir = os.environ.get("OOXML_VALIDATION_CACHE")
+    if env_dir:
+        return Path(env_dir)
+    return Path.home() / ".cache" / "ooxml-validation"
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_schema_versions = {}
+
+
+def schema_version(schemas_dir):
+    """Return a digest identifying the XSD files under schemas_dir (memoized per process)."""
+    schemas_dir = Path(schemas_dir).resolve()
+    if schemas_dir not in _schema_versions:
+        digest = hashlib.sha256(str(BASELINE_FORMAT_VERSION).encode())
+        for xsd_file in sorted(schemas_dir.rglob("*.xsd")):
+            digest.update(xsd_file.relative_to(schemas_dir).as_posix().encode())
+            digest.update(xsd_file.read_bytes())
+        _schema_versions[schemas_dir] = digest.hexdigest()
+    return _schema_versions[schemas_dir]
+
+
+class BaselineMemory:
+    """Baselines of recently seen originals, kept in memory by long-lived processes.
+
+    Disabled (capacity 0) unless a process opts in, as the validation service
+    does. Entries are keyed by the original's path, size and modification time
+    and the validator type, so a replaced original is never matched, and the
+    least recently used entry is dropped once capacity is reached.
+    """
+
+    def __init__(self, capacity=0):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+
+    def key(self, original_file, validator_name):
+        stat = original_file.stat()
+        return (
+            str(original_file.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            validator_name,
+        )
+
+    def get(self, key):
+        """Return the (errors, digests) entry for key, or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        if self.capacity <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Shared by every baseline in this process
+BASELINE_MEMORY = BaselineMemory()
+
+
+class OriginalBaseline:
+    """Reads parts of the original document straight from its zip, once per run.
+
+    XSD error sets for original parts are computed lazily (only for parts whose
+    current version has errors) and persisted in a content-addressed cache keyed
+    by the original file hash and schema version, so repeated validations against
+    the same original skip the baseline entirely. Canonical digests of original
+    parts (used to detect unchanged parts) are cached the same way. Processes
+    that enable BASELINE_MEMORY also keep both in memory between runs.
+    """
+
+    def __init__(self, original_file, validator, cache_dir=None, use_cache=True):
+        """
+        Args:
+            original_file: Path to the original .docx/.pptx/.xlsx file
+            validator: BaseSchemaValidator used to compute XSD errors for original parts
+            cache_dir: Directory for persisted baselines (default: default_cache_dir())
+            use_cache: If False, never read or write the persisted cache
+        """
+        self.original_file = Path(original_file)
+        self.validator = validator
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.use_cache = use_cache
+
+        self._zip = None
+        self._cache_file = None
+        self._errors = None
+        self._digests = {}
+        self._computed = {}
+        self._dirty = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def read(self, name):
+        """Return the bytes of a part in the original, or None if it does not exist."""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.original_file, "r")
+        try:
+            return self._zip.read(name)
+        except KeyError:
+            return None
+
+    def errors_for(self, name):
+        """Return the set of XSD errors for a part of the original document.
+
+        Args:
+            name: Part name relative to the package root (e.g., "word/document.xml")
+        """
+        errors = self._load()
+        if name in errors:
+            self.cache_hits += 1
+            return errors[name]
+
+        self.cache_misses += 1
+        errors[name] = self._compute_errors(name)
+        self._computed[name] = errors[name]
+        self._dirty = True
+        return errors[name]
+
+    def digest_for(self, name):
+        """Return the canonical digest of a part of the original document.
+
+        Returns:
+            str: Digest (see trees.canonical_digest), or "" if the part does not
+                 exist in the original or is not well-formed
+        """
+        self._load()
+        digest = self._digests.get(name)
+        if digest is not None:
+            return digest
+
+        data = self.read(name)
+        digest = ""
+        if data is not None:
+            try:
+                digest = canonical_digest(lxml.etree.fromstring(data))
+            except lxml.etree.XMLSyntaxError:
+                pass
+        self._digests[name] = digest
+        self._dirty = True
+        return digest
+
+    def take_computed(self):
+        """Return and forget the error sets computed since the last call."""
+        computed, self._computed = self._computed, {}
+        return computed
+
+    def merge(self, computed):
+        """Add error sets computed elsewhere (e.g. in a worker process)."""
+        if computed:
+            self._load().update(computed)
+            self._dirty = True
+
+    def _compute_errors(self, name):
+        data = self.read(name)
+        if data is None:
+            # File didn't exist in original, so no original errors
+            return set()
+
+        relative_path = Path(name)
+        schema_path = self.validator._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
+
+        try:
+            xml_doc = lxml.etree.ElementTree(lxml.etree.fromstring(data))
+        except Exception as e:
+            return {str(e)}
+
+        is_valid, errors = self.validator._validate_xml_doc_xsd(
+            xml_doc, relative_path, schema_path
+        )
+        return errors if errors else set()
+
+    @property
+    def cache_file(self):
+        """Cache path keyed by original file hash, schema version and validator type."""
+        if self._cache_file is not None:
+            return self._cache_file
+        key = hashlib.sha256(
+            "|".join(
+                [
+                    file_digest(self.original_file),
+                    schema_version(self.validator.schemas_dir),
+                    type(self.validator).__name__,
+                ]
+            ).encode()
+        ).hexdigest()
+        self._cache_file = self.cache_dir / f"baseline-{key}.json"
+        return self._cache_file
+
+    def _load(self):
+        if self._errors is not None:
+            return self._errors
+
+        self._errors = {}
+        if not self.use_cache:
+            return self._errors
+
+        # Entries share these dicts, so parts computed later in the run are kept too
+        memory_key = None
+        if BASELINE_MEMORY.capacity:
+            memory_key = BASELINE_MEMORY.key(
+                self.original_file, type(self.validator).__name__
+            )
+            entry = BASELINE_MEMORY.get(memory_key)
+            if entry is not None:
+                self._errors, self._digests = entry
+                return self._errors
+
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            if data.get("version") == BASELINE_FORMAT_VERSION:
+                self._errors = {
+                    name: set(errors) for name, errors in data["errors"].items()
+                }
+                self._digests = dict(data["digests"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        if memory_key is not None:
+            BASELINE_MEMORY.put(memory_key, (self._errors, self._digests))
+        return self._errors
+
+    def save(self):
+        """Persist newly computed error sets to the cache (no-op if nothing changed)."""
+        if not self.use_cache or not self._dirty:
+            return
+
+        data = {
+            "version": BASELINE_FORMAT_VERSION,
+            "original": self.original_file.name,
+            "errors": {name: sorted(errors) for name, errors in self._errors.items()},
+            "digests": self._digests,
+        }
+        cache_file = self.cache_file
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_name, cache_file)
+            self._dirty = False
+        except OSError:
+            # Cache is an optimization only; an unwritable cache dir is not an error
+            pass
+
+    def close(self):
+        """Persist pending results and release the original zip."""
+        self.save()
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
@@ -0,0 +1,48 @@
+"""
+Limits that stop a validation run early: error count, first failure and wall time.
+"""
+
+import time
+
+
+class ValidationBudget:
+    """Limits shared by every validator in one run.
+
+    Validators consult stop_reason() before each check (and between parts of
+    the XSD check); once it returns a reason, the remaining work is skipped and
+    reported as such. A single part is never interrupted, so the time budget
+    can be overrun by the slowest part being validated when it runs out.
+    """
+
+    def __init__(self, max_errors=None, fail_fast=False, time_budget=None):
+        """
+        Args:
+            max_errors: Stop once this many errors have been found
+            fail_fast: Stop at the first error
+            time_budget: Stop starting new work after this many seconds
+        """
+        self.max_errors = max_errors
+        self.fail_fast = fail_fast
+        self.time_budget = time_budget
+        self.deadline = time.monotonic() + time_budget if time_budget else None
+        self.errors = 0
+        self.time_exceeded = False
+
+    def add_errors(self, count):
+        self.errors += count
+
+    def stop_reason(self, pending_errors=0):
+        """Return why remaining work should be skipped, or None to carry on.
+
+        Args:
+            pending_errors: Errors found by the running check but not yet added
+        """
+        errors = self.errors + pending_errors
+        if self.fail_fast and errors:
+            return "fail-fast: an error was found"
+        if self.max_errors is not None and errors >= self.max_errors:
+            return f"reached the limit of {self.max_errors} errors"
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.time_exceeded = True
+            return f"exceeded the time budget of {self.time_budget:g}s"
+        return None
@@ -0,0 +1,187 @@
+"""
+Read-only access to packed Office files, so they can be validated without unpacking.
+"""
+
+import fnmatch
+import posixpath
+import zipfile
+from pathlib import Path, PurePosixPath
+
+OFFICE_EXTENSIONS = {".docx", ".pptx", ".xlsx"}
+
+
+def open_package(path):
+    """Return the root of a document package as a path-like object.
+
+    Args:
+        path: Unpacked document directory, or a packed .docx/.pptx/.xlsx file
+
+    Returns:
+        Path for directories, or the root PackagePath of a ZipPackage for
+        packed files. Both support the subset of pathlib the validators use.
+
+    Raises:
+        ValueError: If path is neither a directory nor a readable zip file
+    """
+    path = Path(path)
+    if path.is_dir():
+        return path.resolve()
+    if path.is_file() and zipfile.is_zipfile(path):
+        return ZipPackage(path).root
+    raise ValueError(f"{path} is not a directory or an Office file")
+
+
+class ZipPackage:
+    """Members of an Office zip file, read straight from the archive on demand."""
+
+    def __init__(self, zip_path):
+        self.zip_path = Path(zip_path).resolve()
+        self._zip = zipfile.ZipFile(self.zip_path, "r")
+
+        self.files = set()
+        self.dirs = {""}
+        for info in self._zip.infolist():
+            name = info.filename.rstrip("/")
+            if info.is_dir():
+                self.dirs.add(name)
+                continue
+            self.files.add(name)
+            # Zips rarely store directory entries, so derive them from member names
+            parent = posixpath.dirname(name)
+            while parent not in self.dirs:
+                self.dirs.add(parent)
+                parent = posixpath.dirname(parent)
+
+        self.root = PackagePath(self, "")
+
+    def read(self, name):
+        """Return the bytes of a member."""
+        return self._zip.read(name)
+
+    def open(self, name):
+        """Return a binary file object streaming a member from the archive."""
+        return self._zip.open(name)
+
+    def close(self):
+        self._zip.close()
+
+
+class PackagePath:
+    """A member (or directory) of a ZipPackage with a pathlib-like interface.
+
+    Only the operations the validators rely on are provided: joining, parent,
+    name/suffix, relative_to, resolve, exists/is_file/is_dir, read_bytes, open,
+    glob and rglob. str() gives "<zip path>/<member>" so messages and cache keys
+    stay readable and unique.
+    """
+
+    def __init__(self, package, member):
+        self.package = package
+        self.member = member
+
+    def __truediv__(self, other):
+        return PackagePath(self.package, posixpath.join(self.member, str(other)))
+
+    def __str__(self):
+        if not self.member:
+            return str(self.package.zip_path)
+        return f"{self.package.zip_path}/{self.member}"
+
+    def __repr__(self):
+        return f"PackagePath({str(self)!r})"
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, PackagePath)
+            and other.package is self.package
+            and other.member == self.member
+        )
+
+    def __hash__(self):
+        return hash((id(self.package), self.member))
+
+    def __lt__(self, other):
+        return str(self) < str(other)
+
+    @property
+    def name(self):
+        return PurePosixPath(self.member).name or self.package.zip_path.name
+
+    @property
+    def suffix(self):
+        return PurePosixPath(self.member).suffix
+
+    @property
+    def stem(self):
+        return PurePosixPath(self.member).stem
+
+    @property
+    def parts(self):
+        return self.package.zip_path.parts + PurePosixPath(self.member).parts
+
+    @property
+    def parent(self):
+        return PackagePath(self.package, posixpath.dirname(self.member))
+
+    def relative_to(self, other):
+        """Return the member path relative to another PackagePath as a PurePosixPath."""
+        if not isinstance(other, PackagePath) or other.package is not self.package:
+            raise ValueError(f"{self} is not in the subpath of {other}")
+        return PurePosixPath(self.member).relative_to(other.member or ".")
+
+    def as_posix(self):
+        return str(self)
+
+    def resolve(self):
+        """Return the path with "." and ".." segments collapsed."""
+        member = posixpath.normpath(self.member) if self.member else ""
+        return PackagePath(self.package, "" if member == "." else member)
+
+    def exists(self):
+        return self.is_file() or self.is_dir()
+
+    def is_file(self):
+        return self.member in self.package.files
+
+    def is_dir(self):
+        return self.member in self.package.dirs
+
+    def read_bytes(self):
+        if not self.is_file():
+            raise FileNotFoundError(f"No such member: {self}")
+        return self.package.read(self.member)
+
+    def open(self, mode="rb"):
+        """Open the member for streaming reads (binary mode only)."""
+        if mode != "rb":
+            raise ValueError(
+                f"Package members are read-only; unsupported mode {mode!r}"
+            )
+        if not self.is_file():
+            raise FileNotFoundError(f"No such member: {self}")
+        return self.package.open(self.member)
+
+    def glob(self, pattern):
+        """Yield members matching a relative pattern; "*" does not cross "/"."""
+        depth = len(PurePosixPath(pattern).parts)
+        for member in sorted(self._members_below()):
+            relative = self._relative_member(member)
+            if len(PurePosixPath(relative).parts) == depth and PurePosixPath(
+                relative
+            ).match(pattern):
+                yield PackagePath(self.package, member)
+
+    def rglob(self, pattern):
+        """Yield members at any depth whose name matches pattern."""
+        for member in sorted(self._members_below()):
+            if fnmatch.fnmatchcase(posixpath.basename(member), pattern):
+                yield PackagePath(self.package, member)
+
+    def _members_below(self):
+        prefix = f"{self.member}/" if self.member else ""
+        for member in self.package.files | self.package.dirs:
+            if member and member.startswith(prefix):
+                yield member
+
+    def _relative_member(self, member):
+        return member[len(self.member) + 1 :] if self.member else member
@@ -0,0 +1,173 @@
+"""
+Structured validation results: per-check timing, parts examined and error records.
+"""
+
+import re
+import time
+
+# "  word/document.xml: Line 12: message" or "  word/document.xml: message"
+ERROR_PATTERN = re.compile(
+    r"^\s*(?P<part>[^\s:]+): (?:Line (?P<line>\d+): )?(?P<message>.*)$", re.DOTALL
+)
+
+
+class ErrorRecord:
+    """A single validation error, located by part and line where known."""
+
+    def __init__(self, code, message, part=None, line=None):
+        self.code = code
+        self.message = message
+        self.part = part
+        self.line = line
+
+    @classmethod
+    def from_message(cls, code, text):
+        """Build a record from a printed error line ("  part: Line N: message")."""
+        match = ERROR_PATTERN.match(text)
+        if not match:
+            return cls(code, text.strip())
+        line = match.group("line")
+        return cls(
+            code,
+            match.group("message"),
+            part=match.group("part"),
+            line=int(line) if line else None,
+        )
+
+    def to_dict(self):
+        return {
+            "code": self.code,
+            "part": self.part,
+            "line": self.line,
+            "message": self.message,
+        }
+
+
+class CheckResult:
+    """Outcome of one validation check."""
+
+    def __init__(self, name):
+        self.name = name
+        self.passed = None
+        self.duration = 0.0
+        self.parts_examined = 0
+        self.errors = []
+        self.details = {}
+        # Why the check did not run at all, or stopped before examining every part
+        self.skipped = None
+        self.stopped_early = None
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "skipped": self.skipped,
+            "stopped_early": self.stopped_early,
+            "duration_seconds": round(self.duration, 6),
+            "parts_examined": self.parts_examined,
+            "errors": [error.to_dict() for error in self.errors],
+            "details": self.details,
+        }
+
+
+class ValidationReport:
+    """Collects a CheckResult for every check a validator runs.
+
+    Validators run each check through run_check() and call record_errors()
+    with the error lines they print, so the same errors are available as
+    text on stdout and as records in to_dict(). With a ValidationBudget,
+    checks are skipped once the budget is used up.
+    """
+
+    def __init__(self, validator_name, trees=None, stats=None, budget=None):
+        """
+        Args:
+            validator_name: Name reported for the validator (usually its class name)
+            trees: TreeRegistry whose accessed parts are counted per check
+            stats: Callable returning run-wide counters (caches, parsing)
+            budget: ValidationBudget shared with the run's other validators
+        """
+        self.validator_name = validator_name
+        self.trees = trees
+        self.stats = stats
+        self.budget = budget
+        self.checks = []
+        self.current = None
+
+    def run_check(self, name, check):
+        """Run check() as the named check, timing it. Returns check()'s result.
+
+        A check skipped because the budget is used up returns True; it is
+        reported through skipped and incomplete rather than as a failure.
+        """
+        result = CheckResult(name)
+        self.checks.append(result)
+
+        reason = self.stop_reason()
+        if reason:
+            result.skipped = reason
+            print(f"SKIPPED - {name}: {reason}")
+            return True
+
+        previous, self.current = self.current, result
+
+        if self.trees is not None:
+            self.trees.accessed = set()
+        start = time.perf_counter()
+        try:
+            result.passed = bool(check())
+        finally:
+            result.duration = time.perf_counter() - start
+            # Checks that know better (e.g. shared walks) set parts_examined themselves
+            if self.trees is not None and not result.parts_examined:
+                result.parts_examined = len(self.trees.accessed)
+            self.current = previous
+            if self.budget is not None:
+                # A failed check counts against the budget even without error records
+                failed = result.passed is False
+                self.budget.add_errors(len(result.errors) or int(failed))
+        return result.passed
+
+    def stop_reason(self, pending_errors=0):
+        """Return why remaining work should be skipped, or None (see ValidationBudget)."""
+        if self.budget is None:
+            return None
+        if self.current is not None:
+            pending_errors += len(self.current.errors)
+        return self.budget.stop_reason(pending_errors)
+
+    def record_errors(self, errors, code=None):
+        """Attach printed error lines to the running check."""
+        if self.current is None:
+            return
+        code = code or self.current.name
+        self.current.errors.extend(
+            ErrorRecord.from_message(code, error) for error in errors
+        )
+
+    def add_error(self, message, part=None, line=None, code=None):
+        """Attach a single structured error to the running check."""
+        if self.current is None:
+            return
+        self.current.errors.append(
+            ErrorRecord(code or self.current.name, message, part=part, line=line)
+        )
+
+    @property
+    def passed(self):
+        return all(check.passed is not False for check in self.checks)
+
+    @property
+    def incomplete(self):
+        """True if any check was skipped or stopped before examining every part."""
+        return any(check.skipped or check.stopped_early for check in self.checks)
+
+    def to_dict(self):
+        return {
+            "validator": self.validator_name,
+            "passed": self.passed,
+            "incomplete": self.incomplete,
+            "duration_seconds": round(sum(c.duration for c in self.checks), 6),
+            "checks": [check.to_dict() for check in self.checks],
+            "stats": self.stats() if self.stats else {},
+        }
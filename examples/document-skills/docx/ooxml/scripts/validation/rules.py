@@ -0,0 +1,378 @@
+"""
+Rule engine that runs element- and attribute-level checks in one tree walk per part.
+"""
+
+import re
+
+from .graph import rels_part_for
+
+# Clark name -> local name, shared by every walk in the process
+_local_names = {}
+
+
+def local_name(clark_name):
+    """Return the local part of a Clark name ({namespace}name -> name), memoized."""
+    name = _local_names.get(clark_name)
+    if name is None:
+        name = clark_name.split("}")[-1] if "}" in clark_name else clark_name
+        _local_names[clark_name] = name
+    return name
+
+
+class Rule:
+    """A check that registers interest in tags/attributes of the shared tree walk.
+
+    Subclasses set `name` (the key its errors are reported under) and override
+    the wants_* methods to declare interest; the engine calls those once per
+    distinct Clark name and caches the answer, so rules never see elements or
+    attributes they did not ask for.
+    """
+
+    name = None
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.errors = []
+
+    def applies_to(self, xml_file):
+        """Return True if this rule should run on xml_file."""
+        return True
+
+    def skips_unchanged(self, xml_file):
+        """Return True if this rule can skip xml_file when it matches the original.
+
+        Rules whose result depends on other parts override this.
+        """
+        return True
+
+    def wants_element(self, tag, local):
+        """Return True to receive element() calls for elements with this tag."""
+        return False
+
+    def wants_attribute(self, attr, local):
+        """Return True to receive attribute() calls for attributes with this name."""
+        return False
+
+    def start_part(self, xml_file, root):
+        """Called before the walk of a part this rule applies to."""
+
+    def element(self, xml_file, elem, local, in_alternate_content):
+        """Called for each element whose tag this rule wants."""
+
+    def attribute(self, xml_file, elem, local, value):
+        """Called for each attribute whose name this rule wants."""
+
+    def end_part(self, xml_file):
+        """Called after the walk of a part this rule applies to."""
+
+    def part_failed(self, xml_file, error):
+        """Called instead of the walk when a part cannot be parsed."""
+        self.errors.append(f"  {self.relative(xml_file)}: Error: {error}")
+
+    def relative(self, xml_file):
+        return xml_file.relative_to(self.validator.unpacked_dir)
+
+
+class RuleEngine:
+    """Walks every element of each part once and dispatches to interested rules."""
+
+    def __init__(self, validator, rules):
+        self.validator = validator
+        self.rules = rules
+        self._element_rules = {}
+        self._attribute_rules = {}
+        self.parts_examined = {rule.name: 0 for rule in rules}
+
+    def run(self, xml_files):
+        """Run all rules over xml_files.
+
+        Returns:
+            dict: rule name -> list of error strings
+        """
+        mc_alternate = f"{{{self.validator.MC_NAMESPACE}}}AlternateContent"
+
+        for xml_file in xml_files:
+            unchanged = self.validator.is_unchanged(xml_file)
+            active = [
+                rule
+                for rule in self.rules
+                if rule.applies_to(xml_file)
+                and not (unchanged and rule.skips_unchanged(xml_file))
+            ]
+            if not active:
+                continue
+            for rule in active:
+                self.parts_examined[rule.name] += 1
+
+            try:
+                root = self.validator.trees.getroot(xml_file)
+            except Exception as e:
+                for rule in active:
+                    rule.part_failed(xml_file, e)
+                continue
+
+            for rule in active:
+                rule.start_part(xml_file, root)
+
+            # Elements inside mc:AlternateContent are flagged so rules can skip them
+            alternate = set()
+            for alt in root.iter(mc_alternate):
+                alternate.add(alt)
+                alternate.update(alt.iterdescendants())
+
+            active_ids = {id(rule) for rule in active}
+            for elem in root.iter():
+                tag = elem.tag
+                if not isinstance(tag, str):
+                    continue  # Comments and processing instructions
+
+                element_rules = self._element_rules.get(tag)
+                if element_rules is None:
+                    element_rules = self._rules_for_element(tag)
+                if element_rules:
+                    local = local_name(tag)
+                    in_alternate = elem in alternate
+                    for rule in element_rules:
+                        if id(rule) in active_ids:
+                            rule.element(xml_file, elem, local, in_alternate)
+
+                for attr, value in elem.attrib.items():
+                    attribute_rules = self._attribute_rules.get(attr)
+                    if attribute_rules is None:
+                        attribute_rules = self._rules_for_attribute(attr)
+                    if attribute_rules:
+                        local = local_name(attr)
+                        for rule in attribute_rules:
+                            if id(rule) in active_ids:
+                                rule.attribute(xml_file, elem, local, value)
+
+            for rule in active:
+                rule.end_part(xml_file)
+
+        return {rule.name: rule.errors for rule in self.rules}
+
+    def _rules_for_element(self, tag):
+        local = local_name(tag)
+        rules = [rule for rule in self.rules if rule.wants_element(tag, local)]
+        self._element_rules[tag] = rules
+        return rules
+
+    def _rules_for_attribute(self, attr):
+        local = local_name(attr)
+        rules = [rule for rule in self.rules if rule.wants_attribute(attr, local)]
+        self._attribute_rules[attr] = rules
+        return rules
+
+
+class UniqueIdRule(Rule):
+    """IDs must be unique according to UNIQUE_ID_REQUIREMENTS (mc:AlternateContent excluded)."""
+
+    name = "unique_ids"
+
+    def __init__(self, validator):
+        super().__init__(validator)
+        self.requirements = validator.UNIQUE_ID_REQUIREMENTS
+        self.global_ids = {}  # Track globally unique IDs across all files
+        self.file_ids = {}
+        self.part_unchanged = False
+
+    def wants_element(self, tag, local):
+        return local.lower() in self.requirements
+
+    def skips_unchanged(self, xml_file):
+        # Global IDs in unchanged parts can still collide with edited parts
+        return False
+
+    def start_part(self, xml_file, root):
+        self.file_ids = {}  # Track IDs that must be unique within this file
+        self.part_unchanged = self.validator.is_unchanged(xml_file)
+
+    def element(self, xml_file, elem, local, in_alternate_content):
+        if in_alternate_content:
+            return
+
+        tag = local.lower()
+        attr_name, scope = self.requirements[tag]
+        if scope == "file" and self.part_unchanged:
+            return
+
+        # Look for the specified attribute
+        id_value = None
+        for attr, value in elem.attrib.items():
+            if local_name(attr).lower() == attr_name:
+                id_value = value
+                break
+        if id_value is None:
+            return
+
+        if scope == "global":
+            # Check global uniqueness
+            if id_value in self.global_ids:
+                prev_file, prev_line, prev_tag = self.global_ids[id_value]
+                self.errors.append(
+                    f"  {self.relative(xml_file)}: "
+                    f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
+                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                )
+            else:
+                self.global_ids[id_value] = (
+                    self.relative(xml_file),
+                    elem.sourceline,
+                    tag,
+                )
+        elif scope == "file":
+            # Check file-level uniqueness
+            seen = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in seen:
+                self.errors.append(
+                    f"  {self.relative(xml_file)}: "
+                    f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                    f"(first occurrence at line {seen[id_value]})"
+                )
+            else:
+                seen[id_value] = elem.sourceline
+
+
+class RelationshipIdRule(Rule):
+    """r:id attributes must reference existing IDs (of the expected type) in the part's .rels."""
+
+    name = "relationship_ids"
+
+    def __init__(self, validator):
+        super().__init__(validator)
+        self.rid_attr = f"{{{validator.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+        self.rid_to_type = {}
+
+    def _rels_part(self, xml_file):
+        # For dir/file.xml, it's dir/_rels/file.xml.rels
+        return rels_part_for(self.validator.package_graph.part_name(xml_file))
+
+    def applies_to(self, xml_file):
+        # Skip .rels files themselves, and parts without a .rels file (that's okay)
+        return xml_file.suffix != ".rels" and self.validator.package_graph.has_part(
+            self._rels_part(xml_file)
+        )
+
+    def skips_unchanged(self, xml_file):
+        # References are only stable if the part's .rels is unchanged too
+        graph = self.validator.package_graph
+        return self.validator.is_unchanged(graph.path(self._rels_part(xml_file)))
+
+    def wants_attribute(self, attr, local):
+        return attr == self.rid_attr
+
+    def start_part(self, xml_file, root):
+        # Valid relationship IDs and their types, from the package graph
+        rels_part = self._rels_part(xml_file)
+        self.rid_to_type = {}
+        try:
+            relationships = self.validator.package_graph.relationships(rels_part)
+        except Exception as e:
+            self.rid_to_type = None
+            self.errors.append(f"  Error processing {self.relative(xml_file)}: {e}")
+            return
+
+        for rel in relationships:
+            if rel.id:
+                # Check for duplicate rIds
+                if rel.id in self.rid_to_type:
+                    self.errors.append(
+                        f"  {rels_part}: Line {rel.line}: "
+                        f"Duplicate relationship ID '{rel.id}' (IDs must be unique)"
+                    )
+                self.rid_to_type[rel.id] = rel.type_name
+
+    def attribute(self, xml_file, elem, local, rid):
+        if not rid or self.rid_to_type is None:
+            return
+
+        rid_to_type = self.rid_to_type
+        elem_name = local_name(elem.tag)
+
+        # Check if the ID exists
+        if rid not in rid_to_type:
+            self.errors.append(
+                f"  {self.relative(xml_file)}: Line {elem.sourceline}: "
+                f"<{elem_name}> references non-existent relationship '{rid}' "
+                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+            )
+        # Check if we have type expectations for this element
+        elif self.validator.ELEMENT_RELATIONSHIP_TYPES:
+            expected_type = self.validator._get_expected_relationship_type(elem_name)
+            if expected_type:
+                actual_type = rid_to_type[rid]
+                # Check if the actual type matches or contains the expected type
+                if expected_type not in actual_type.lower():
+                    self.errors.append(
+                        f"  {self.relative(xml_file)}: Line {elem.sourceline}: "
+                        f"<{elem_name}> references '{rid}' which points to '{actual_type}' "
+                        f"but should point to a '{expected_type}' relationship"
+                    )
+
+    def part_failed(self, xml_file, error):
+        self.errors.append(f"  Error processing {self.relative(xml_file)}: {error}")
+
+
+class WhitespacePreservationRule(Rule):
+    """w:t elements with leading/trailing whitespace need xml:space='preserve'."""
+
+    name = "whitespace_preservation"
+
+    def __init__(self, validator):
+        super().__init__(validator)
+        self.t_tag = f"{{{validator.WORD_2006_NAMESPACE}}}t"
+        self.xml_space_attr = f"{{{validator.XML_NAMESPACE}}}space"
+
+    def applies_to(self, xml_file):
+        # Only check document.xml files
+        return xml_file.name == "document.xml"
+
+    def wants_element(self, tag, local):
+        return tag == self.t_tag
+
+    LEADING_WHITESPACE = re.compile(r"^\s.*")
+    TRAILING_WHITESPACE = re.compile(r".*\s$")
+
+    def element(self, xml_file, elem, local, in_alternate_content):
+        text = elem.text
+        if not text:
+            return
+        # Check if text starts or ends with whitespace
+        if not (
+            self.LEADING_WHITESPACE.match(text) or self.TRAILING_WHITESPACE.match(text)
+        ):
+            return
+        if elem.get(self.xml_space_attr) == "preserve":
+            return
+
+        # Show a preview of the text
+        text_preview = repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+        self.errors.append(
+            f"  {self.relative(xml_file)}: "
+            f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+        )
+
+
+class UuidIdRule(Rule):
+    """ID attributes that look like UUIDs must contain only hex values."""
+
+    name = "uuid_ids"
+
+    # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+    UUID_PATTERN = re.compile(
+        r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+    )
+
+    def wants_attribute(self, attr, local):
+        # Check if this is an ID attribute
+        return local.lower().endswith("id")
+
+    def attribute(self, xml_file, elem, local, value):
+        # Check if value looks like a UUID (has the right length and pattern structure)
+        if self.validator._looks_like_uuid(value) and not self.UUID_PATTERN.match(
+            value
+        ):
+            self.errors.append(
+                f"  {self.relative(xml_file)}: "
+                f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+            )
@@ -0,0 +1,200 @@
+"""
+Local validation service that keeps compiled schemas and original baselines warm.
+
+validate.py pays for interpreter start, the lxml import and schema compilation
+on every run. A service started with `validate.py --serve` listens on a Unix
+socket readable only by its owner and runs validations in one long-lived
+process; validate.py sends its requests there (see client.py) while it is
+running and validates in-process otherwise.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+from pathlib import Path
+
+from .baseline import BASELINE_MEMORY
+from .budget import ValidationBudget
+from .client import (
+    PROTOCOL_VERSION,
+    code_version,
+    default_socket_path,
+    send_request,
+)
+from .docx import DOCXSchemaValidator
+from .pptx import PPTXSchemaValidator
+from .redlining import RedliningValidator
+from .xlsx import XLSXSchemaValidator
+
+# Validators run for each original file type, in order
+VALIDATORS = {
+    ".docx": [DOCXSchemaValidator, RedliningValidator],
+    ".pptx": [PPTXSchemaValidator],
+    ".xlsx": [XLSXSchemaValidator],
+}
+
+
+def run_validators(
+    document,
+    original_file,
+    verbose=False,
+    use_cache=True,
+    jobs=1,
+    incremental=True,
+    max_errors=None,
+    fail_fast=False,
+    time_budget=None,
+):
+    """Run every validator for the original's file type, printing their messages.
+
+    Args:
+        document: Unpacked document directory, or a packed file
+        original_file: Path to the original file; its extension selects the validators
+        max_errors, fail_fast, time_budget: Limits of the ValidationBudget shared
+            by all validators; once used up, remaining checks are skipped
+
+    Returns:
+        tuple: (success, reports) where reports holds each validator's report dict
+    """
+    budget = ValidationBudget(
+        max_errors=max_errors, fail_fast=fail_fast, time_budget=time_budget
+    )
+    success = True
+    reports = []
+    for V in VALIDATORS[Path(original_file).suffix.lower()]:
+        if V is RedliningValidator:
+            validator = V(document, original_file, verbose=verbose, budget=budget)
+        else:
+            validator = V(
+                document,
+                original_file,
+                verbose=verbose,
+                use_cache=use_cache,
+                jobs=jobs,
+                incremental=incremental,
+                budget=budget,
+            )
+        if not validator.validate():
+            success = False
+        reports.append(validator.report.to_dict())
+    return success, reports
+
+
+class ValidationService:
+    """Serves validation requests on a Unix socket, one request at a time.
+
+    Compiled schemas stay in SCHEMA_REGISTRY for the life of the process, and
+    the baselines of the most recently validated originals are kept in
+    BASELINE_MEMORY. Requests are handled serially because validator output is
+    captured by redirecting stdout, which is process-wide.
+    """
+
+    def __init__(self, socket_path=None, idle_timeout=1800, max_baselines=16):
+        """
+        Args:
+            socket_path: Socket to listen on (default: default_socket_path())
+            idle_timeout: Seconds without requests before the service exits
+                          (None: run until stopped)
+            max_baselines: Originals whose baselines are kept in memory
+        """
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.max_baselines = max_baselines
+        self.requests_served = 0
+        self._stopping = False
+
+    def serve(self):
+        """Listen until idle for idle_timeout seconds or asked to shut down."""
+        BASELINE_MEMORY.capacity = self.max_baselines
+        code_version()  # Of the code this process loaded, before it can change
+        server = self._bind()
+        print(f"Validation service listening on {self.socket_path}")
+        try:
+            while not self._stopping:
+                try:
+                    connection, _ = server.accept()
+                except TimeoutError:
+                    break
+                with connection:
+                    self._handle(connection)
+        finally:
+            server.close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            BASELINE_MEMORY.clear()
+        print(f"Validation service stopped after {self.requests_served} request(s)")
+
+    def handle_request(self, request):
+        """Return the response for a decoded request."""
+        if request.get("version") != PROTOCOL_VERSION:
+            return {"ok": False, "error": "Unsupported protocol version"}
+
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "result": {"pid": os.getpid()}}
+        if command == "shutdown":
+            self._stopping = True
+            return {"ok": True, "result": {}}
+        if command != "validate":
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        if request.get("code_version") != code_version():
+            return {"ok": False, "error": "Service runs a different version"}
+
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                success, reports = run_validators(
+                    request["document"], request["original"], **request["options"]
+                )
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.requests_served += 1
+        return {
+            "ok": True,
+            "result": {
+                "passed": success,
+                "validators": reports,
+                "output": output.getvalue(),
+            },
+        }
+
+    def _bind(self):
+        if self.socket_path.exists():
+            try:
+                send_request(
+                    self.socket_path, {"version": PROTOCOL_VERSION, "command": "ping"}
+                )
+            except (OSError, ValueError):
+                self.socket_path.unlink()  # Left behind by a service that died
+            else:
+                raise RuntimeError(
+                    f"A service is already running on {self.socket_path}"
+                )
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Create the socket owner-only, so other users cannot connect
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        server.settimeout(self.idle_timeout)
+        return server
+
+    def _handle(self, connection):
+        connection.settimeout(None)
+        try:
+            with connection.makefile("rb") as reader:
+                request = json.loads(reader.readline())
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object")
+            response = self.handle_request(request)
+        except ValueError as e:
+            response = {"ok": False, "error": f"Invalid request: {e}"}
+        try:
+            connection.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            pass  # Client went away; nothing to report to
@@ -8,11 +8,17 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', backend="lxml")  # Large documents
+    doc = Document.open('workspace/input.docx')  # Packed file, no unpack.py needed
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
     node = doc["word/document.xml"].get_node(tag="w:p", line_number=10)
 
+    # Find text, even when split across runs
+    match = doc["word/document.xml"].find_text("quarterly report")[0]
+    matches = doc["word/document.xml"].find_text(r"[0-9]+ days", regex=True)
+
     # Add comments
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
@@ -22,27 +28,64 @@ Usage:
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply many edits at once; all of them are undone if one fails
+    doc.apply_edits([{"op": "suggest_deletion", "node": node}, ...])
+
     # Save
     doc.save()
+    doc.save_as('workspace/output.docx')  # Packed file, no pack.py needed
 """
 
+import bisect
+import contextlib
+import copy
+import hashlib
 import html
+import itertools
+import os
 import random
+import re
 import shutil
+import stat
+import struct
 import tempfile
+import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
+from ooxml.scripts.validation.baseline import default_cache_dir
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import IdAllocator, LxmlXMLEditor, XMLEditor, replace_file
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Regex anchors whose meaning differs between a paragraph and the joined text;
+# escapes other than \A and \Z are dropped first, and "[^" is a negated class
+_ESCAPE = re.compile(r"\\[^AZ]")
+_ANCHOR = re.compile(r"\\[AZ]|(?<!\[)\^|\$")
+
+# apply_edits() operations that insert an XML fragment, and where
+_FRAGMENT_EDITS = {
+    "replace_node": "replace",
+    "insert_before": "before",
+    "insert_after": "after",
+    "append_to": "append",
+}
+_TRACKED_CHANGE_EDITS = ("suggest_deletion", "revert_insertion", "revert_deletion")
+
+# Packed originals kept in the validation cache directory for reuse by later
+# Documents; bump the version when pack_document's output changes
+_BASELINE_VERSION = 1
+_MAX_CACHED_BASELINES = 8
+
+# ZipFile internals _copy_zip_member() writes to, checked before it relies on them
+_ZIP_WRITER_ATTRS = ("fp", "filelist", "NameToInfo", "start_dir", "_didModify")
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -54,10 +97,18 @@ class DocxXMLEditor(XMLEditor):
 
     Attributes:
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+        change_ids (IdAllocator): Allocator of w:ins/w:del IDs
+        comment_ids (IdAllocator): Allocator of comment IDs, or None
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        change_ids=None,
+        comment_ids=None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,52 +117,52 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            change_ids: IdAllocator shared with the package's other editors, so
+                        tracked change IDs are unique across parts (default: one
+                        for this file only)
+            comment_ids: IdAllocator of comment IDs; w:id values of inserted
+                         w:comment elements are reported to it
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._text_index = None  # Paragraph texts for find_text(), built on first use
+        self.change_ids = change_ids if change_ids is not None else IdAllocator()
+        self.change_ids.add_source(self._change_ids_in_use)
+        self.comment_ids = comment_ids
+
+    def _change_ids_in_use(self):
+        """Return the w:id values of the tracked changes in this file."""
+        return (
+            elem.getAttribute("w:id")
+            for tag in ("w:ins", "w:del")
+            for elem in self._elements_by_tag(tag)
+        )
 
-    def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+    def _comment_ids_in_use(self):
+        """Return the w:id values of the w:comment elements in this file."""
+        return (
+            elem.getAttribute("w:id") for elem in self._elements_by_tag("w:comment")
+        )
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._ensure_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._ensure_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._ensure_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -124,6 +175,11 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        Each inserted subtree is walked once, tracking whether the current
+        element is inside a w:del, and each namespace is declared at most once
+        per call. New tracked changes are numbered after the walk, so IDs
+        written in the inserted XML are never handed out again.
+
         Args:
             nodes: List of DOM nodes to process
         """
@@ -131,10 +187,21 @@ class DocxXMLEditor(XMLEditor):
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+        undeclared = {
+            "w14": self._ensure_w14_namespace,
+            "w16du": self._ensure_w16du_namespace,
+            "w16cex": self._ensure_w16cex_namespace,
+        }
+
+        def ensure_namespace(prefix):
+            ensure = undeclared.pop(prefix, None)
+            if ensure is not None:
+                ensure()
+
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
             parent = elem.parentNode
-            while parent:
+            while parent is not None:
                 if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
                     return True
                 parent = parent.parentNode
@@ -149,15 +216,15 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidP", self.rsid)
             # Add w14:paraId and w14:textId if not present
             if not elem.hasAttribute("w14:paraId"):
-                self._ensure_w14_namespace()
+                ensure_namespace("w14")
                 elem.setAttribute("w14:paraId", _generate_hex_id())
             if not elem.hasAttribute("w14:textId"):
-                self._ensure_w14_namespace()
+                ensure_namespace("w14")
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, in_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if in_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -167,19 +234,19 @@ class DocxXMLEditor(XMLEditor):
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                elem.setAttribute("w:id", str(self.change_ids.next_id()))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
                 elem.setAttribute("w:date", timestamp)
             # Add w16du:dateUtc for tracked changes (same as w:date since we generate UTC timestamps)
-            if elem.tagName in ("w:ins", "w:del") and not elem.hasAttribute(
-                "w16du:dateUtc"
-            ):
-                self._ensure_w16du_namespace()
+            if not elem.hasAttribute("w16du:dateUtc"):
+                ensure_namespace("w16du")
                 elem.setAttribute("w16du:dateUtc", timestamp)
 
         def add_comment_attrs(elem):
+            if self.comment_ids is not None:
+                self.comment_ids.observe(elem.getAttribute("w:id"))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -190,74 +257,111 @@ class DocxXMLEditor(XMLEditor):
         def add_comment_extensible_date(elem):
             # Add w16cex:dateUtc for comment extensible elements
             if not elem.hasAttribute("w16cex:dateUtc"):
-                self._ensure_w16cex_namespace()
+                ensure_namespace("w16cex")
                 elem.setAttribute("w16cex:dateUtc", timestamp)
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
-
-        for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
-                continue
-
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
+            text = self._first_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not elem.hasAttribute("xml:space"):
+                    elem.setAttribute("xml:space", "preserve")
+
+        tracked_changes = []
+        # Depth-first, in document order: (element, inside a w:del)
+        stack = [
+            (node, is_inside_deletion(node))
+            for node in reversed(nodes)
+            if node.nodeType == node.ELEMENT_NODE
+        ]
+        while stack:
+            elem, in_deletion = stack.pop()
+            tag = elem.tagName
+            if tag == "w:p":
                 add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
+            elif tag == "w:r":
+                add_rsid_to_r(elem, in_deletion)
+            elif tag == "w:t":
                 add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
+            elif tag in ("w:ins", "w:del"):
+                if elem.hasAttribute("w:id"):
+                    self.change_ids.observe(elem.getAttribute("w:id"))
+                tracked_changes.append(elem)
+                in_deletion = in_deletion or tag == "w:del"
+            elif tag == "w:comment":
                 add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
+            elif tag == "w16cex:commentExtensible":
                 add_comment_extensible_date(elem)
 
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+            stack.extend(
+                (child, in_deletion)
+                for child in reversed(elem.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
 
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+        for elem in tracked_changes:
+            add_tracked_change_attrs(elem)
 
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+    def find_text(self, pattern, regex=False):
+        """Find text in paragraphs, including text split across runs.
+
+        Each paragraph is searched as the text of its w:t elements joined
+        together, so text Word has split into several runs is still found.
+        Matches never span paragraphs. Paragraph texts are read on the first
+        call and again only for paragraphs changed since, so repeated searches
+        are cheap.
+
+        Args:
+            pattern: Text to find, or a regular expression (string or compiled
+                     pattern) if regex is True
+            regex: Treat pattern as a regular expression
+
+        Returns:
+            list[TextMatch]: Non-overlapping matches in document order
+
+        Raises:
+            ValueError: If pattern is empty
+
+        Example:
+            match = editor.find_text("quarterly report")[0]
+            doc.add_comment(start=match.runs[0], end=match.runs[-1], text="Check")
+            for match in editor.find_text(r"within [0-9]+ days", regex=True):
+                print(match.text, match.spans)
+        """
+        if not regex and not pattern:
+            raise ValueError("find_text requires a non-empty pattern")
+        if self._text_index is None:
+            self._text_index = self._create_text_index()
+        self._dirty = True
+        return self._text_index.search(
+            re.compile(pattern) if regex else pattern, self._is_attached
+        )
+
+    def _create_text_index(self):
+        return _TextIndex(self._root_element())
 
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+    def invalidate_index(self):
+        """Discard the get_node() and find_text() indexes after changing self.dom directly.
+
+        Tracked change IDs in use are read again as well.
+        """
+        super().invalidate_index()
+        self._text_index = None
+        self.change_ids.reset()
+
+    def _forget_node(self, elem):
+        super()._forget_node(elem)
+        if self._text_index is not None:
+            self._text_index.remove(elem)
+
+    def _index_nodes(self, nodes):
+        super()._index_nodes(nodes)
+        if self._text_index is not None:
+            self._text_index.pending.extend(nodes)
+
+    def _insert_nodes(self, elem, position, nodes):
+        """Insert nodes with automatic attribute injection."""
+        super()._insert_nodes(elem, position, nodes)
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
@@ -299,6 +403,9 @@ class DocxXMLEditor(XMLEditor):
                 f"The provided element <{elem.tagName}> contains no insertions. "
             )
 
+        # The runs below change in place; index them again afterwards
+        self._forget_node(elem)
+
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
             runs = list(ins_elem.getElementsByTagName("w:r"))
@@ -306,7 +413,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._create_element("w:del")
 
             # Process each run
             for run in runs:
@@ -318,18 +425,10 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
+                    self._rename_element(t_elem, "w:delText")
 
             # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
+            self._move_children(ins_elem, del_wrapper)
 
             # Add del wrapper back to ins
             ins_elem.appendChild(del_wrapper)
@@ -337,6 +436,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+        self._index_nodes([elem])
         return [elem]
 
     def revert_deletion(self, elem):
@@ -391,7 +491,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._create_element("w:ins")
 
             for run in runs:
                 # Clone the run
@@ -399,14 +499,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                    self._rename_element(del_text, "w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
                 if new_run.hasAttribute("w:rsidDel"):
@@ -425,7 +518,7 @@ class DocxXMLEditor(XMLEditor):
                 created_insertion = nodes[0]
 
         # Return based on input type
-        if is_single_del and created_insertion:
+        if is_single_del and created_insertion is not None:
             return [elem, created_insertion]
         else:
             return [elem]
@@ -500,17 +593,11 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
 
+            self._forget_node(elem)
+
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             if elem.hasAttribute("w:rsidR"):
@@ -520,7 +607,7 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._create_element("w:del")
             parent = elem.parentNode
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
@@ -529,6 +616,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self._index_nodes([del_wrapper])
             return del_wrapper
 
         elif elem.nodeName == "w:p":
@@ -536,6 +624,8 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
                 raise ValueError("w:p element already contains tracked changes")
 
+            self._forget_node(elem)
+
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
             is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
@@ -546,28 +636,20 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
+                    rPr = self._create_element("w:rPr")
                     pPr.appendChild(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
+                del_marker = self._create_element("w:del")
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
+                ) if rPr.firstChild is not None else rPr.appendChild(del_marker)
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             for run in elem.getElementsByTagName("w:r"):
@@ -578,7 +660,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._create_element("w:del")
             for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
@@ -587,12 +669,256 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self._index_nodes([elem])
             return elem
 
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class TextMatch:
+    """A match of DocxXMLEditor.find_text() in one paragraph.
+
+    Attributes:
+        paragraph: The w:p element whose text matched
+        text: The matched text
+        start, end: Offsets of the match in the paragraph text
+        spans: (run, start, end) for each w:r holding part of the match, with
+               offsets into that run's text
+    """
+
+    def __init__(self, paragraph, text, start, end, spans):
+        self.paragraph = paragraph
+        self.text = text
+        self.start = start
+        self.end = end
+        self.spans = spans
+
+    @property
+    def runs(self):
+        """The w:r elements holding the match, in document order."""
+        return [run for run, _, _ in self.spans]
+
+    def __repr__(self):
+        return f"TextMatch({self.text!r}, start={self.start}, runs={len(self.spans)})"
+
+
+class _TextIndex:
+    """Paragraph texts of a document, for DocxXMLEditor.find_text().
+
+    paragraphs holds every w:p in document order. A paragraph's text is the
+    text of the w:t elements of its own runs (nested paragraphs, e.g. in text
+    boxes, are indexed separately); it is read on first use and dropped when
+    the paragraph changes. Inserted paragraphs are placed after the closest
+    indexed paragraph before them, so edits never force a full re-read.
+    """
+
+    def __init__(self, root):
+        self.paragraphs = list(root.getElementsByTagName("w:p"))
+        self.members = set(self.paragraphs)
+        self.texts = {}  # paragraph -> (text, run starts, [(run, start, end)])
+        self.pending = []  # Nodes inserted since the last search
+        self._joined = None  # (texts joined by "\0", paragraph start offsets)
+
+    def remove(self, node):
+        """Drop the paragraphs in node's subtree and the text of the paragraph around it."""
+        for paragraph in _paragraphs_in(node):
+            if paragraph in self.members:
+                self.paragraphs.remove(paragraph)
+                self.members.discard(paragraph)
+                self.texts.pop(paragraph, None)
+        self._touch(node.parentNode)
+
+    def search(self, pattern, is_attached):
+        """Return TextMatches of a str or compiled regex in attached paragraphs."""
+        self._add_pending(is_attached)
+        if self._joined is None:
+            texts = [self._text(paragraph)[0] for paragraph in self.paragraphs]
+            starts = [0]
+            starts.extend(itertools.accumulate(len(text) + 1 for text in texts))
+            self._joined = ("\0".join(texts), starts)
+        joined, starts = self._joined
+
+        found = []  # (paragraph index, start, end)
+        if isinstance(pattern, str):
+            # "\0" cannot occur in XML text, so matches never cross paragraphs
+            position = joined.find(pattern)
+            while position != -1:
+                i = bisect.bisect_right(starts, position) - 1
+                start = position - starts[i]
+                found.append((i, start, start + len(pattern)))
+                position = joined.find(pattern, position + len(pattern))
+        else:
+            if _ANCHOR.search(_ESCAPE.sub("", pattern.pattern)) or pattern.match(""):
+                candidates = range(len(self.paragraphs))
+            else:
+                # Without anchors a pattern matches the joined text wherever it
+                # matches a paragraph (or across paragraphs), so one scan finds
+                # the paragraphs worth searching
+                candidates = set()
+                for m in pattern.finditer(joined):
+                    first = bisect.bisect_right(starts, m.start()) - 1
+                    last = bisect.bisect_right(starts, m.end()) - 1
+                    candidates.update(range(first, last + 1))
+                candidates = sorted(candidates)
+            for i in candidates:
+                text = joined[starts[i] : starts[i + 1] - 1]
+                for m in pattern.finditer(text):
+                    if m.end() > m.start():
+                        found.append((i, m.start(), m.end()))
+
+        matches = []
+        for i, start, end in found:
+            paragraph = self.paragraphs[i]
+            if not is_attached(paragraph):
+                continue  # Removed through the DOM directly
+            text, run_starts, runs = self._text(paragraph)
+            spans = []
+            for run, run_start, run_end in runs[
+                bisect.bisect_right(run_starts, start) - 1 :
+            ]:
+                if run_start >= end:
+                    break
+                if run_end > start:
+                    spans.append(
+                        (
+                            run,
+                            max(start, run_start) - run_start,
+                            min(end, run_end) - run_start,
+                        )
+                    )
+            matches.append(TextMatch(paragraph, text[start:end], start, end, spans))
+        return matches
+
+    def _touch(self, node):
+        """Drop the text of the paragraph containing node (or node itself)."""
+        while node is not None and node.nodeType == node.ELEMENT_NODE:
+            if node.tagName == "w:p":
+                self.texts.pop(node, None)
+                break
+            node = node.parentNode
+        self._joined = None
+
+    def _add_pending(self, is_attached):
+        for node in self.pending:
+            if node.nodeType != node.ELEMENT_NODE or not is_attached(node):
+                continue
+            paragraphs = _paragraphs_in(node)
+            new = [p for p in paragraphs if p not in self.members]
+            if new and len(new) == len(paragraphs):
+                # Paragraphs of one subtree are consecutive in document order
+                self._insert(new)
+            else:
+                for paragraph in new:
+                    self._insert([paragraph])
+            self._touch(node.parentNode)
+        self.pending = []
+
+    def _insert(self, paragraphs):
+        before = self._preceding(paragraphs[0])
+        i = self.paragraphs.index(before) + 1 if before is not None else 0
+        self.paragraphs[i:i] = paragraphs
+        self.members.update(paragraphs)
+
+    def _preceding(self, paragraph):
+        """Return the closest indexed w:p starting before paragraph, or None."""
+        node = paragraph
+        while node is not None:
+            sibling = node.previousSibling
+            while sibling is not None:
+                found = self._last_member(sibling)
+                if found is not None:
+                    return found
+                sibling = sibling.previousSibling
+            node = node.parentNode
+            if node in self.members:
+                return node
+        return None
+
+    def _last_member(self, node):
+        """Return the last indexed w:p in node's subtree by document order, or None."""
+        # Walk the subtree in reverse document order: children right to left,
+        # then the node itself
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if visited:
+                if current in self.members:
+                    return current
+                continue
+            stack.append((current, True))
+            stack.extend((child, False) for child in current.childNodes)
+        return None
+
+    def _text(self, paragraph):
+        entry = self.texts.get(paragraph)
+        if entry is None:
+            parts = []
+            run_starts = []
+            runs = []
+            offset = 0
+            # Runs of this paragraph, without descending into nested paragraphs
+            stack = list(reversed(paragraph.childNodes))
+            while stack:
+                node = stack.pop()
+                if node.nodeType != node.ELEMENT_NODE or node.tagName == "w:p":
+                    continue
+                if node.tagName != "w:r":
+                    stack.extend(reversed(node.childNodes))
+                    continue
+                run_text = self._run_text(node)
+                if run_text:
+                    parts.append(run_text)
+                    run_starts.append(offset)
+                    runs.append((node, offset, offset + len(run_text)))
+                    offset += len(run_text)
+            entry = self.texts[paragraph] = ("".join(parts), run_starts, runs)
+        return entry
+
+    @staticmethod
+    def _run_text(run):
+        return "".join(
+            child.data
+            for t in run.childNodes
+            if t.nodeType == t.ELEMENT_NODE and t.tagName == "w:t"
+            for child in t.childNodes
+            if child.nodeType == child.TEXT_NODE
+        )
+
+
+class _LxmlTextIndex(_TextIndex):
+    """_TextIndex over an LxmlDocxXMLEditor tree, where text is held on elements."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._t_tag = root.qualify("w:t")
+
+    def _run_text(self, run):
+        return "".join(t.text or "" for t in run.iterchildren(self._t_tag))
+
+
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on the lxml backend; see LxmlXMLEditor.
+
+    Used by Document(..., backend="lxml") for word/document.xml. Nodes are lxml
+    elements with minidom-style names, so the tracked change methods, attribute
+    injection and find_text() are shared with DocxXMLEditor.
+    """
+
+    def _create_text_index(self):
+        return _LxmlTextIndex(self._root_element())
+
+
+def _paragraphs_in(node):
+    """Return the w:p elements of node's subtree (including node) in document order."""
+    if node.nodeType != node.ELEMENT_NODE:
+        return []
+    paragraphs = list(node.getElementsByTagName("w:p"))
+    if node.tagName == "w:p":
+        paragraphs.insert(0, node)
+    return paragraphs
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -609,8 +935,100 @@ def _generate_rsid() -> str:
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _link_or_copy(src, dst):
+    """copytree() copy function: hard link src as dst, or copy it if linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _is_copy(source, target):
+    """Whether target holds source: the same file, or one with its size and mtime."""
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    return os.path.samestat(source_stat, target_stat) or (
+        source_stat.st_size == target_stat.st_size
+        and source_stat.st_mtime_ns == target_stat.st_mtime_ns
+    )
+
+
+def _copy_file(source, target):
+    """Copy source over target atomically, keeping its permissions and mtime."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    os.close(fd)
+    try:
+        shutil.copy2(source, temp_name)
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _copy_zip_member(source, info, target):
+    """Copy a member from one open zip file to another without recompressing it.
+
+    zipfile has no public API for this, so the member's data is read from
+    behind its local header and written under a new one, as ZipFile.write()
+    would write it. If this zipfile lacks the internals used, the member is
+    decompressed and compressed again instead.
+    """
+    if not hasattr(source, "fp") or not all(
+        hasattr(target, name) for name in _ZIP_WRITER_ATTRS
+    ):
+        target.writestr(info, source.read(info.filename))
+        return
+
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(30)
+    if header[:4] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.fp.seek(name_length + extra_length, os.SEEK_CUR)
+    data = source.fp.read(info.compress_size)
+
+    member = copy.copy(info)
+    member.flag_bits &= ~0x08  # Sizes go in the local header, not a data descriptor
+    member.extra = _without_zip64_extra(info.extra)  # FileHeader() adds its own
+    member.header_offset = target.fp.tell()
+    target.fp.write(member.FileHeader())
+    target.fp.write(data)
+    target.filelist.append(member)
+    target.NameToInfo[member.filename] = member
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def _without_zip64_extra(extra):
+    """Return a zip extra field without its zip64 record (header ID 1)."""
+    records = []
+    while len(extra) >= 4:
+        header_id, size = struct.unpack("<HH", extra[:4])
+        if header_id != 0x0001:
+            records.append(extra[: 4 + size])
+        extra = extra[4 + size :]
+    return b"".join(records)
+
+
+def _directory_key(directory):
+    """Return a digest of a directory's path and its files' names, sizes and mtimes."""
+    digest = hashlib.sha256(f"{_BASELINE_VERSION}:{directory.resolve()}".encode())
+    for path in sorted(directory.rglob("*")):
+        if path.is_file():
+            file_stat = path.stat()
+            name = path.relative_to(directory).as_posix()
+            digest.update(
+                f"\0{name}\0{file_stat.st_size}\0{file_stat.st_mtime_ns}".encode()
+            )
+    return digest.hexdigest()
+
+
 class Document:
-    """Manages comments in unpacked Word documents."""
+    """Manages comments in Word documents, unpacked or packed (see open())."""
 
     def __init__(
         self,
@@ -619,31 +1037,58 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
         Args:
-            unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
+            unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory),
+                          or to a .docx file (see open())
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: "minidom" (default) or "lxml" for word/document.xml. lxml
+                     needs far less memory and time on large documents; its nodes
+                     are lxml elements with minidom-style names (see LxmlXMLEditor).
+                     The other parts are small and always use minidom.
         """
+        if backend not in ("minidom", "lxml"):
+            raise ValueError(f"Unknown backend: {backend} (use 'minidom' or 'lxml')")
+        self.backend = backend
         self.original_path = Path(unpacked_dir)
 
-        if not self.original_path.exists() or not self.original_path.is_dir():
+        if not self.original_path.exists():
             raise ValueError(f"Directory not found: {unpacked_dir}")
+        if not self.original_path.is_dir() and not zipfile.is_zipfile(
+            self.original_path
+        ):
+            raise ValueError(f"{unpacked_dir} is not a directory or a .docx file")
 
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
-
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        if self.original_path.is_dir():
+            # The working copy hard links the original files; parts are replaced,
+            # never overwritten in place, when they are saved, so the originals
+            # stay untouched
+            self._package = None
+            shutil.copytree(
+                self.original_path, self.unpacked_path, copy_function=_link_or_copy
+            )
+            # The validation baseline (the original packed as a .docx) is built on first use
+            self._original_key = _directory_key(self.original_path)
+            self._original_docx = None
+        else:
+            # Parts are extracted as they are, on first use (see _has_part()), and
+            # the file itself is the validation baseline
+            self._package = zipfile.ZipFile(self.original_path)
+            self._package_names = set(self._package.namelist())
+            self._extracted = {}  # Part name -> stat of the file as extracted
+            self.unpacked_path.mkdir()
+            self._original_docx = self.original_path
 
         self.word_path = self.unpacked_path / "word"
 
@@ -657,6 +1102,7 @@ class Document:
 
         # Cache for lazy-loaded editors
         self._editors = {}
+        self._batch = None  # State to roll back to while batch() is active
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -664,9 +1110,13 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
+        # IDs unique across the package, shared by all editors and read lazily:
+        # tracked changes from every part opened, comments from comments.xml
+        self.change_ids = IdAllocator()
+        self.comment_ids = IdAllocator()
+
+        # Load existing comments (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -677,6 +1127,30 @@ class Document:
         # Add author to people.xml
         self._add_author_to_people(author)
 
+    @classmethod
+    def open(cls, docx_path, **kwargs):
+        """
+        Open a packed .docx file directly, without unpack.py.
+
+        Parts are read from the file as they are needed and only edited parts
+        are serialized again; save() and save_as() copy the others into the new
+        file as they are. Files added to unpacked_path (e.g. images) are
+        included; existing media are not extracted there.
+
+        Args:
+            docx_path: Path to the .docx file
+            **kwargs: Options of Document() (rsid, author, backend, ...)
+
+        Example:
+            doc = Document.open("input.docx", author="John Doe")
+            doc.add_comment(start=node, end=node, text="Comment text")
+            doc.save_as("output.docx")
+        """
+        docx_path = Path(docx_path)
+        if not docx_path.is_file() or not zipfile.is_zipfile(docx_path):
+            raise ValueError(f"Not a .docx file: {docx_path}")
+        return cls(docx_path, **kwargs)
+
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
         Get or create a DocxXMLEditor for the specified XML file.
@@ -702,14 +1176,30 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
-            if not file_path.exists():
+            if not self._has_part(file_path):
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+            editor_class = DocxXMLEditor
+            if self.backend == "lxml" and xml_path == "word/document.xml":
+                editor_class = LxmlDocxXMLEditor
+            editor = editor_class(
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                change_ids=self.change_ids,
+                comment_ids=self.comment_ids,
             )
+            if xml_path == "word/comments.xml":
+                self.comment_ids.add_source(editor._comment_ids_in_use)
+            self._editors[xml_path] = editor
         return self._editors[xml_path]
 
+    @property
+    def next_comment_id(self) -> int:
+        """The ID the next add_comment() or reply_to_comment() call will use."""
+        return self.comment_ids.peek()
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -727,7 +1217,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
+        comment_id = self.comment_ids.next_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -759,7 +1249,6 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
     def reply_to_comment(
@@ -784,7 +1273,7 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
+        comment_id = self.comment_ids.next_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -827,14 +1316,139 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
+    @contextlib.contextmanager
+    def batch(self, validate=False):
+        """
+        Group edits so that they are kept or undone together.
+
+        If the block raises, every part returns to its state when the batch
+        started and files created meanwhile (such as comments.xml) are removed.
+        Editors stay usable, but nodes fetched before a rollback must be fetched
+        again. A batch inside another batch joins the outer one.
+
+        Args:
+            validate: If True, write the parts to the working copy and run
+                      validate() when the block ends; if validation fails, the
+                      batch is rolled back and ValueError is raised
+
+        Example:
+            with doc.batch(validate=True):
+                for node in nodes:
+                    doc["word/document.xml"].suggest_deletion(node)
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = self._snapshot()
+        try:
+            yield self
+            if validate:
+                self._write_parts()
+                self.validate()
+        except BaseException:
+            self._rollback(self._batch)
+            raise
+        finally:
+            self._batch = None
+
+    def apply_edits(self, edits, validate=False) -> list:
+        """
+        Apply many edits at once, all or nothing.
+
+        All anchors are resolved and all XML fragments parsed (one parse per
+        part) before anything changes. The edits then run in order inside
+        batch(), so an edit that fails undoes the ones before it.
+
+        Each edit is a dict with an "op", its arguments and an anchor:
+            "node": an element
+            "find": get_node() arguments, e.g. {"tag": "w:p", "contains": "..."}
+            "text": text with exactly one find_text() match; anchors at the
+                    paragraph, or at the matched runs for add_comment
+            "part": part holding the anchor (default: "word/document.xml")
+
+        Operations:
+            {"op": "replace_node" | "insert_before" | "insert_after" | "append_to",
+             <anchor>, "xml": "<w:r>...</w:r>"}
+            {"op": "suggest_deletion" | "revert_insertion" | "revert_deletion", <anchor>}
+            {"op": "add_comment", <anchor>, "comment": "Text", "end": element (optional)}
+            {"op": "reply_to_comment", "parent": comment_id, "comment": "Text"}
+
+        Args:
+            edits: Iterable of edit dicts
+            validate: Validate when the edits are done (see batch())
+
+        Returns:
+            One result per edit: what the method of the same name returns
+
+        Raises:
+            ValueError: If an edit is malformed or its anchor is not found, or an
+                        earlier edit removed it; the document is left unchanged
+
+        Example:
+            doc.apply_edits([
+                {"op": "suggest_deletion", "find": {"tag": "w:r", "contains": "old"}},
+                {"op": "add_comment", "text": "within 30 days", "comment": "Check"},
+                {"op": "insert_after", "node": para, "xml": "<w:ins>...</w:ins>"},
+            ])
+        """
+        edits = list(edits)
+        anchors = []
+        for i, edit in enumerate(edits):
+            try:
+                anchors.append(self._resolve_edit(edit))
+            except ValueError as e:
+                raise ValueError(f"Edit {i} ({edit.get('op')}): {e}") from e
+
+        # Parse the fragments of each part in one wrapper document
+        by_editor = {}
+        for i, (editor, _, _) in enumerate(anchors):
+            if edits[i]["op"] in _FRAGMENT_EDITS:
+                by_editor.setdefault(editor, []).append(i)
+        parsed = {}
+        for editor, indexes in by_editor.items():
+            try:
+                fragments = editor._parse_fragments([edits[i]["xml"] for i in indexes])
+            except Exception:
+                # Parse them one at a time to name the edit at fault
+                for i in indexes:
+                    try:
+                        editor._parse_fragment(edits[i]["xml"])
+                    except Exception as e:
+                        raise ValueError(f"Edit {i} ({edits[i]['op']}): {e}") from e
+                raise
+            parsed.update(zip(indexes, fragments))
+
+        results = []
+        with self.batch(validate=validate):
+            for i, (edit, (editor, start, end)) in enumerate(zip(edits, anchors)):
+                try:
+                    results.append(
+                        self._apply_edit(edit, editor, start, end, parsed.get(i))
+                    )
+                except ValueError as e:
+                    raise ValueError(f"Edit {i} ({edit['op']}): {e}") from e
+        return results
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
+        if getattr(self, "_package", None) is not None:
+            self._package.close()
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
+    @property
+    def original_docx(self) -> Path:
+        """The original document packed as a .docx, the baseline for validate().
+
+        Built on first use and cached between Documents while the original
+        directory is unchanged. For documents opened from a .docx, the file
+        itself.
+        """
+        return self._ensure_baseline()
+
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
@@ -842,12 +1456,22 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
+        package = self.unpacked_path
+        if self._package is not None:
+            # The validators read .docx files directly; check the file save_as() would write
+            package = Path(self.temp_dir) / "validate.docx"
+            self._write_parts()
+            self._pack(package)
+        self._validate_package(package)
+
+    def _validate_package(self, package):
+        """Validate an unpacked directory or .docx file against the original."""
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            package, self.original_docx, verbose=False
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            package, self.original_docx, verbose=False
         )
 
         # Run validations
@@ -856,54 +1480,358 @@ class Document:
         if not redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
-    def save(self, destination=None, validate=True) -> None:
+    def save(self, destination=None, validate=True) -> dict:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only parts that changed are written, and only files that differ from the
+        destination's (by size and modification time) are copied, each replacing
+        the old file atomically.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
+
+        Returns:
+            dict: Save report with "destination", "written" (bytes written per
+            file path, relative to the destination), "bytes_written" and
+            "unchanged" (number of files left as they were)
+
+        Documents opened from a .docx are saved with save_as(), to the
+        destination or back to the original file.
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
-            self._ensure_comment_relationships()
-            self._ensure_comment_content_types()
+        if self._package is not None:
+            return self.save_as(destination or self.original_path, validate)
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        self._write_parts()
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy changed files from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() == self.original_path.resolve():
+            self._pin_baseline()  # Before the original changes
+        report = {
+            "destination": str(target_path),
+            "written": {},
+            "bytes_written": 0,
+            "unchanged": 0,
+        }
+        for source in sorted(self.unpacked_path.rglob("*")):
+            if not source.is_file():
+                continue
+            name = source.relative_to(self.unpacked_path).as_posix()
+            target = target_path / name
+            if _is_copy(source, target):
+                report["unchanged"] += 1
+                continue
+            _copy_file(source, target)
+            report["written"][name] = source.stat().st_size
+            report["bytes_written"] += report["written"][name]
+        return report
 
-    # ==================== Private: Initialization ====================
+    def save_as(self, docx_path, validate=True) -> dict:
+        """
+        Save the document as a packed .docx file, replacing it atomically.
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
+        For documents opened from a .docx, parts that were not edited are
+        copied into the new file still compressed; only edited and new parts
+        are compressed again. Unpacked documents are packed with pack.py's
+        pack_document().
 
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        Args:
+            docx_path: Path of the .docx file to write
+            validate: If True, validates the new file before it replaces docx_path
+                      (default: True)
+
+        Returns:
+            dict: Save report as for save(), with "written" holding the compressed
+            size of each part compressed again and "unchanged" the number of parts
+            copied as they were
+        """
+        target_path = Path(docx_path)
+        if target_path.suffix.lower() != ".docx":
+            raise ValueError(f"{docx_path} must be a .docx file")
+        self._write_parts()
+
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            dir=target_path.parent, prefix=f".{target_path.stem}.", suffix=".docx"
+        )
+        os.close(fd)
+        try:
+            report = self._pack(Path(temp_name))
+            mode = target_path.stat().st_mode if target_path.exists() else 0o644
+            os.chmod(temp_name, stat.S_IMODE(mode))
+            if validate:
+                self._validate_package(Path(temp_name))
+            if (
+                self._package is not None
+                and target_path.exists()
+                and target_path.samefile(self._original_docx)
+            ):
+                self._pin_baseline()  # Before the original is replaced
+            os.replace(temp_name, target_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        report["destination"] = str(target_path)
+        return report
+
+    # ==================== Private: Packages ====================
+
+    def _has_part(self, path):
+        """Return True if the file at path in the working copy exists.
+
+        For documents opened from a .docx, the part is extracted first if the
+        working copy does not have it yet.
+        """
+        if self._package is not None and not path.exists():
+            name = path.relative_to(self.unpacked_path).as_posix()
+            if name in self._package_names:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(self._package.read(name))
+                self._extracted[name] = path.stat()
+        return path.exists()
+
+    def _pack(self, docx_path):
+        """Write the working copy to docx_path as a .docx and return a save report."""
+        report = {
+            "destination": str(docx_path),
+            "written": {},
+            "bytes_written": 0,
+            "unchanged": 0,
+        }
+        if self._package is None:
+            pack_document(self.unpacked_path, docx_path, validate=False)
+            with zipfile.ZipFile(docx_path) as packed:
+                for info in packed.infolist():
+                    report["written"][info.filename] = info.compress_size
+                    report["bytes_written"] += info.compress_size
+            return report
+
+        files = {
+            path.relative_to(self.unpacked_path).as_posix(): path
+            for path in self.unpacked_path.rglob("*")
+            if path.is_file()
+        }
+        with zipfile.ZipFile(docx_path, "w", zipfile.ZIP_DEFLATED) as packed:
+            # Members keep their order ([Content_Types].xml first); new files follow
+            for info in self._package.infolist():
+                path = files.pop(info.filename, None)
+                extracted = self._extracted.get(info.filename)
+                if path is None or (
+                    extracted is not None
+                    and os.path.samestat(path.stat(), extracted)
+                    and path.stat().st_mtime_ns == extracted.st_mtime_ns
+                ):
+                    _copy_zip_member(self._package, info, packed)
+                    report["unchanged"] += 1
+                    continue
+                packed.write(path, info.filename)
+                compressed = packed.getinfo(info.filename).compress_size
+                report["written"][info.filename] = compressed
+                report["bytes_written"] += compressed
+            for name, path in sorted(files.items()):
+                packed.write(path, name)
+                compressed = packed.getinfo(name).compress_size
+                report["written"][name] = compressed
+                report["bytes_written"] += compressed
+        return report
+
+    # ==================== Private: Baseline ====================
+
+    def _ensure_baseline(self):
+        """Return the validation baseline, building it if it does not exist yet."""
+        if self._original_docx is None or not self._original_docx.exists():
+            self._original_docx = self._build_baseline()
+        return self._original_docx
+
+    def _pin_baseline(self):
+        """Link the validation baseline into temp_dir and use that link from now on.
+
+        Called before the original is overwritten: a cached baseline may then be
+        evicted, and can no longer be rebuilt from the original.
+        """
+        baseline = Path(self.temp_dir) / "original.docx"
+        if self._ensure_baseline() != baseline:
+            _link_or_copy(self._original_docx, baseline)
+            self._original_docx = baseline
+
+    def _build_baseline(self):
+        """Pack the original directory for validation, reusing a cached copy."""
+        if _directory_key(self.original_path) != self._original_key:
+            raise ValueError(
+                f"{self.original_path} changed after the Document was opened; "
+                "its validation baseline can no longer be built"
+            )
+
+        cache_dir = default_cache_dir() / "originals"
+        cached = cache_dir / f"original-{self._original_key}.docx"
+        if cached.exists():
+            os.utime(cached)  # Mark as recently used
+            return cached
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=cache_dir, prefix="tmp-", suffix=".docx"
+            )
+            os.close(fd)
+        except OSError:
+            # No usable cache directory: keep the baseline with the working copy
+            baseline = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, baseline, validate=False)
+            return baseline
+
+        try:
+            pack_document(self.original_path, temp_name, validate=False)
+            os.replace(temp_name, cached)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        # Drop the least recently used baselines
+        baselines = sorted(
+            cache_dir.glob("original-*.docx"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in baselines[_MAX_CACHED_BASELINES:]:
+            path.unlink(missing_ok=True)
+        return cached
+
+    # ==================== Private: Batches ====================
+
+    def _resolve_edit(self, edit):
+        """Return (editor, start, end) anchoring an apply_edits() edit.
+
+        reply_to_comment edits have no anchor: (None, None, None).
+        """
+        op = edit.get("op")
+        required = {"add_comment": "comment", "reply_to_comment": "comment"}
+        required.update(dict.fromkeys(_FRAGMENT_EDITS, "xml"))
+        if op not in required and op not in _TRACKED_CHANGE_EDITS:
+            raise ValueError(f"Unknown op: {op}")
+        if op in required and required[op] not in edit:
+            raise ValueError(f"Missing '{required[op]}'")
+        if op == "reply_to_comment":
+            if "parent" not in edit:
+                raise ValueError("Missing 'parent'")
+            return None, None, None
+
+        editor = self[edit.get("part", "word/document.xml")]
+        if op == "add_comment" and editor is not self._document:
+            raise ValueError("Comments can only be anchored in word/document.xml")
+
+        if "node" in edit:
+            start = edit["node"]
+            if not editor._is_attached(start):
+                raise ValueError("Anchor node is not part of the document")
+        elif "find" in edit:
+            start = editor.get_node(**edit["find"])
+        elif "text" in edit:
+            matches = editor.find_text(edit["text"])
+            if len(matches) != 1:
+                raise ValueError(
+                    f"Text {edit['text']!r} must match exactly once, "
+                    f"found {len(matches)} matches"
+                )
+            if op == "add_comment":
+                return editor, matches[0].runs[0], matches[0].runs[-1]
+            start = matches[0].paragraph
+        else:
+            raise ValueError("Missing anchor: give 'node', 'find' or 'text'")
+        return editor, start, edit.get("end", start)
+
+    def _apply_edit(self, edit, editor, start, end, nodes):
+        """Run one resolved apply_edits() edit and return its result."""
+        op = edit["op"]
+        if start is not None and not (
+            editor._is_attached(start) and editor._is_attached(end)
+        ):
+            raise ValueError("Its anchor was removed by an earlier edit")
+        if op in _FRAGMENT_EDITS:
+            return editor._insert_nodes(start, _FRAGMENT_EDITS[op], nodes)
+        if op in _TRACKED_CHANGE_EDITS:
+            return getattr(editor, op)(start)
+        if op == "add_comment":
+            return self.add_comment(start, end, edit["comment"])
+        return self.reply_to_comment(edit["parent"], edit["comment"])
+
+    def _snapshot(self):
+        """Record what _rollback() needs to return to the current state."""
+        return {
+            # Open parts that may have unsaved changes; the others match their files
+            "parts": {
+                xml_path: editor._serialize()
+                for xml_path, editor in self._editors.items()
+                if editor.dirty
+            },
+            "files": {path for path in self.unpacked_path.rglob("*") if path.is_file()},
+            "written": {},  # Files _write_parts() overwrote -> their earlier bytes
+            "existing_comments": {
+                comment_id: dict(info)
+                for comment_id, info in self.existing_comments.items()
+            },
+            "ids": {
+                "change": self.change_ids.mark(),
+                "comment": self.comment_ids.mark(),
+                "rid": {
+                    xml_path: editor._rids.mark()
+                    for xml_path, editor in self._editors.items()
+                },
+            },
+        }
+
+    def _rollback(self, snapshot):
+        """Return the working copy and every open editor to a _snapshot()."""
+        for path, content in snapshot["written"].items():
+            replace_file(path, content)
+        for xml_path, content in snapshot["parts"].items():
+            replace_file(self.unpacked_path / xml_path, content)
+        for path in list(self.unpacked_path.rglob("*")):
+            if path.is_file() and path not in snapshot["files"]:
+                path.unlink()
+
+        ids = snapshot["ids"]
+        for xml_path, editor in list(self._editors.items()):
+            if editor.xml_path.exists():
+                editor._reload()
+                if xml_path in ids["rid"]:
+                    editor._rids.rewind(ids["rid"][xml_path])
+            else:
+                # Opened on a file created during the batch
+                del self._editors[xml_path]
+                self.change_ids.remove_source(editor._change_ids_in_use)
+                self.comment_ids.remove_source(editor._comment_ids_in_use)
+        self.change_ids.rewind(ids["change"])
+        self.comment_ids.rewind(ids["comment"])
+        self.existing_comments = snapshot["existing_comments"]
+
+    def _write_parts(self):
+        """Complete the comment parts and write every open part to the working copy."""
+        # Only ensure comment relationships and content types if comment files exist
+        if self._has_part(self.comments_path):
+            self._ensure_comment_relationships()
+            self._ensure_comment_content_types()
+
+        # Save all modified XML files in temp directory
+        for editor in self._editors.values():
+            if self._batch is not None and editor.dirty and editor.xml_path.exists():
+                self._batch["written"].setdefault(
+                    editor.xml_path, editor.xml_path.read_bytes()
+                )
+            editor.save()
+
+    # ==================== Private: Initialization ====================
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._has_part(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
@@ -953,7 +1881,7 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._has_part(path):
             # Copy from template
             shutil.copy(TEMPLATE_DIR / "people.xml", path)
 
@@ -1069,7 +1997,7 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
+        if not self._has_part(self.comments_path):
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
@@ -1090,7 +2018,7 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
+        if not self._has_part(self.comments_extended_path):
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
             )
@@ -1106,7 +2034,7 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
+        if not self._has_part(self.comments_ids_path):
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
@@ -1117,7 +2045,7 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
+        if not self._has_part(self.comments_extensible_path):
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
             )
@@ -1183,7 +2111,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._has_part(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
@@ -0,0 +1,202 @@
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from scripts import document
+from scripts.document import Document
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>'
+        "</Relationships>"
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W}"><w:body>'
+        "<w:p><w:r><w:t>First paragraph</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>Second paragraph</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    ),
+    "word/settings.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:settings xmlns:w="{W}"/>'
+    ),
+    "word/media/image1.bin": "x" * 10000,
+}
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the docx skill root: python -m unittest scripts.document_test
+class TestSaveAs(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.source = self.dir / "in.docx"
+        with zipfile.ZipFile(self.source, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, content in PARTS.items():
+                zf.writestr(name, content)
+
+    def round_trip(self):
+        """Comment on the source with open()/save_as() and return the output path."""
+        doc = Document.open(self.source, rsid="00AB12CD")
+        editor = doc["word/document.xml"]
+        run = editor.find_text("Second paragraph")[0].runs[0]
+        doc.add_comment(start=run, end=run, text="Check this")
+        output = self.dir / "out.docx"
+        report = doc.save_as(output, validate=False)
+        self.assertIn("word/document.xml", report["written"])
+        self.assertNotIn("word/media/image1.bin", report["written"])
+        return output
+
+    def assert_valid_copy(self, output):
+        with zipfile.ZipFile(self.source) as source, zipfile.ZipFile(output) as out:
+            self.assertIsNone(out.testzip())
+            self.assertEqual(out.namelist()[0], "[Content_Types].xml")
+            self.assertIn("word/comments.xml", out.namelist())
+            for name in ("_rels/.rels", "word/media/image1.bin"):
+                self.assertEqual(out.read(name), source.read(name))
+        reopened = Document.open(output)
+        self.assertEqual(sorted(reopened.existing_comments), [0])
+
+    def test_untouched_parts_copied_compressed(self):
+        self.assert_valid_copy(self.round_trip())
+
+    def test_without_zipfile_internals(self):
+        # Falls back to recompressing members when the internals are missing
+        with mock.patch.object(document, "_ZIP_WRITER_ATTRS", ("_no_such_attr",)):
+            self.assert_valid_copy(self.round_trip())
+
+
+class TestEditing(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        source = self.dir / "in.docx"
+        with zipfile.ZipFile(source, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, content in PARTS.items():
+                zf.writestr(name, content)
+        self.doc = Document.open(source, rsid="00AB12CD")
+        self.editor = self.doc["word/document.xml"]
+
+    def paragraph(self, text):
+        return self.editor.get_node(tag="w:p", contains=text)
+
+    def test_find_text_after_insert(self):
+        self.assertEqual(self.editor.find_text("Third"), [])  # Builds the index
+        (inserted,) = self.editor.insert_after(
+            self.paragraph("Second"), "<w:p><w:r><w:t>Third paragraph</w:t></w:r></w:p>"
+        )
+        (match,) = self.editor.find_text("Third")
+        self.assertIs(match.paragraph, inserted)
+        self.assertEqual(len(self.editor.find_text("paragraph")), 3)
+
+    def test_find_text_after_replace(self):
+        self.assertEqual(len(self.editor.find_text("Second")), 1)
+        run = self.paragraph("Second").getElementsByTagName("w:r")[0]
+        self.editor.replace_node(run, "<w:r><w:t>Revised text</w:t></w:r>")
+        self.assertEqual(self.editor.find_text("Second"), [])
+        self.assertEqual(self.editor.find_text("Revised")[0].text, "Revised")
+
+    def test_find_text_after_remove(self):
+        self.assertEqual(len(self.editor.find_text("paragraph")), 2)
+        self.editor.suggest_deletion(self.paragraph("First"))
+        (match,) = self.editor.find_text("paragraph")
+        self.assertIs(match.paragraph, self.paragraph("Second"))
+
+    def test_get_node_after_replace_node(self):
+        old = self.paragraph("Second")
+        self.editor.replace_node(
+            old, "<w:p><w:r><w:t>Second paragraph, revised</w:t></w:r></w:p>"
+        )
+        new = self.paragraph("Second")
+        self.assertIsNot(new, old)
+        self.assertEqual(
+            self.editor.get_node(tag="w:t", contains="revised"),
+            new.getElementsByTagName("w:t")[0],
+        )
+
+    def test_get_node_after_revert_insertion(self):
+        self.editor.append_to(
+            self.paragraph("First"), "<w:ins><w:r><w:t>Added</w:t></w:r></w:ins>"
+        )
+        self.editor.get_node(tag="w:t", contains="Added")  # Indexes the w:t
+        self.editor.revert_insertion(self.editor.get_node(tag="w:ins"))
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="w:t", contains="Added")
+        self.editor.get_node(tag="w:delText", contains="Added")
+        self.editor.get_node(tag="w:del")
+
+    def test_ids_after_explicit_ids(self):
+        paragraph = self.paragraph("First")
+        (ins,) = self.editor.append_to(
+            paragraph, '<w:ins w:id="7"><w:r><w:t>A</w:t></w:r></w:ins>'
+        )
+        self.assertEqual(ins.getAttribute("w:id"), "7")
+        (ins,) = self.editor.append_to(
+            paragraph, "<w:ins><w:r><w:t>B</w:t></w:r></w:ins>"
+        )
+        self.assertEqual(ins.getAttribute("w:id"), "8")
+        # Parts of one Document share the allocator
+        self.assertEqual(self.doc.change_ids.peek(), 9)
+
+        rels = self.doc["word/_rels/document.xml.rels"]
+        rels.append_to(
+            rels.get_node(tag="Relationships"),
+            '<Relationship Id="rId5" Type="http://example.com/x" Target="x.xml"/>',
+        )
+        self.assertEqual(rels.get_next_rid(), "rId6")
+
+    def test_batch_rollback(self):
+        comments = self.doc.unpacked_path / "word/comments.xml"
+        first = self.paragraph("First")
+        with self.assertRaises(RuntimeError):
+            with self.doc.batch():
+                run = self.paragraph("Second").getElementsByTagName("w:r")[0]
+                self.assertEqual(self.doc.add_comment(run, run, "Check this"), 0)
+                self.editor.suggest_deletion(first)
+                self.assertTrue(comments.exists())
+                raise RuntimeError
+        # Created files are removed, editors reloaded and IDs handed out again
+        self.assertFalse(comments.exists())
+        with self.assertRaises(ValueError):
+            self.doc["word/comments.xml"]
+        self.assertEqual(len(self.editor.find_text("paragraph")), 2)
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="w:commentRangeStart")
+        run = self.paragraph("Second").getElementsByTagName("w:r")[0]
+        self.assertEqual(self.doc.add_comment(run, run, "Check this"), 0)
+
+    def test_batch_rollback_after_validation(self):
+        # batch(validate=True) writes the parts before validating; they are restored
+        document_xml = self.editor.xml_path.read_bytes()
+        with self.assertRaises(ValueError):
+            with self.doc.batch(validate=True):
+                self.editor.append_to(self.paragraph("First"), "<w:unknown/>")
+        self.assertEqual(self.editor.xml_path.read_bytes(), document_xml)
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="w:unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
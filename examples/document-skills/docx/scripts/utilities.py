@@ -28,14 +28,31 @@ Example usage:
 
     # Save changes
     editor.save()
+
+get_node() looks elements up in indexes built on its first call (elements by
+tag, by attribute value and by line). replace_node, insert_* and append_to keep
+them current; code that changes editor.dom directly calls invalidate_index().
+
+save() writes only editors that may have changed (see XMLEditor.dirty), and
+only when the serialized XML differs from the file.
+
+LxmlXMLEditor offers the same interface on an lxml tree, for large documents.
 """
 
+import bisect
+import copy
 import html
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -50,6 +67,14 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: Whether the document may differ from the file (see below)
+
+    The editor becomes dirty once its nodes are handed out (dom, get_node(),
+    the editing methods), since callers can change them directly; it stays
+    dirty after save() for the same reason.
+
+    Nodes added, moved or removed through the DOM API rather than the editing
+    methods below are not seen by get_node() until invalidate_index() is called.
     """
 
     def __init__(self, xml_path):
@@ -70,8 +95,14 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
-        parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._load()
+
+        # get_node() lookup tables, built on first use
+        self._index = None
+        self._unindexed = []  # Nodes inserted since the last lookup
+        # rIds handed out by get_next_rid(), read from the document on first use
+        self._rids = IdAllocator(start=1, prefix="rId")
+        self._rids.add_source(self._rids_in_use)
 
     def get_node(
         self,
@@ -109,40 +140,28 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        normalized_contains = None
+        if contains is not None:
+            # Normalize the search string: convert HTML entities to Unicode characters
+            # This allows searching for both "&#8220;Rowan" and ""Rowan"
+            normalized_contains = html.unescape(contains)
+
+        matches = [
+            elem
+            for elem in self._node_index().candidates(tag, attrs, line_number)
+            if self._is_attached(elem)
+            and self._node_matches(elem, attrs, line_number, normalized_contains)
+        ]
+        if not matches:
+            # Nodes changed through the DOM directly may be missing from the
+            # index; confirm with a full scan before reporting them missing
+            matches = [
+                elem
+                for elem in self._elements_by_tag(tag)
+                if self._node_matches(elem, attrs, line_number, normalized_contains)
+            ]
+            if matches:
+                self.invalidate_index()
 
         if not matches:
             # Build descriptive error message
@@ -178,8 +197,156 @@ class XMLEditor:
                 f"Multiple nodes found: <{tag}>. "
                 f"Add more filters (attrs, line_number, or contains) to narrow the search."
             )
+        self._dirty = True
         return matches[0]
 
+    def _load(self):
+        """Parse xml_path into self.dom."""
+        parser = _create_line_tracking_parser()
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dirty = False
+
+    @property
+    def dom(self):
+        """The parsed document. Accessing it marks the editor dirty."""
+        self._dirty = True
+        return self._dom
+
+    @property
+    def dirty(self):
+        """True if the document may have changed since it was loaded."""
+        return self._dirty
+
+    def _reload(self):
+        """Parse the file again, discarding unsaved changes.
+
+        Nodes taken from the old tree are no longer part of the document.
+        """
+        self._load()
+        self.invalidate_index()
+
+    def invalidate_index(self):
+        """
+        Discard the get_node() indexes after changing self.dom directly.
+
+        They are rebuilt on the next get_node() call, and get_next_rid() reads
+        the rIds in use again.
+        """
+        self._index = None
+        self._unindexed = []
+        self._rids.reset()
+
+    def _node_index(self):
+        """Return the get_node() index, building it or adding inserted nodes."""
+        if self._index is None:
+            self._index = _NodeIndex(self._elements_by_tag, self._iter_elements)
+            self._unindexed = []
+        elif self._unindexed:
+            for node in self._unindexed:
+                if node.nodeType == node.ELEMENT_NODE and self._is_attached(node):
+                    self._index.add(node)
+            self._unindexed = []
+        return self._index
+
+    def _forget_node(self, elem):
+        """Remove an element and its descendants from the index before a change.
+
+        Called while elem is still in the document.
+        """
+        if self._index is not None:
+            self._index.remove(elem)
+
+    def _index_nodes(self, nodes):
+        """Queue inserted nodes; they are indexed on the next lookup, after any
+        attributes subclasses add to them."""
+        if self._index is not None:
+            self._unindexed.extend(nodes)
+        for node in nodes:
+            if node.nodeType == node.ELEMENT_NODE and node.tagName == "Relationship":
+                self._rids.observe(node.getAttribute("Id"))
+
+    def _is_attached(self, node):
+        """Return True if node is (still) part of this document's tree."""
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self._dom
+
+    def _root_element(self):
+        return self._dom.documentElement
+
+    def _elements_by_tag(self, tag):
+        """Return the elements with a tag name (e.g. "w:p") in document order."""
+        return self._dom.getElementsByTagName(tag)
+
+    @staticmethod
+    def _iter_elements(node):
+        return _iter_elements(node)
+
+    def _create_element(self, tag):
+        """Create a detached element with a prefixed tag name (e.g. "w:del")."""
+        return self._dom.createElement(tag)
+
+    def _rename_element(self, elem, tag):
+        """Replace elem by an element named tag with its attributes and children."""
+        renamed = self._dom.createElement(tag)
+        # Copy ALL child nodes (not just firstChild) to handle entities
+        while elem.firstChild:
+            renamed.appendChild(elem.firstChild)
+        # Preserve attributes like xml:space
+        for i in range(elem.attributes.length):
+            attr = elem.attributes.item(i)
+            renamed.setAttribute(attr.name, attr.value)
+        elem.parentNode.replaceChild(renamed, elem)
+        return renamed
+
+    def _move_children(self, source, target):
+        """Move all child nodes of source to the end of target."""
+        while source.firstChild:
+            target.appendChild(source.firstChild)
+
+    def _first_text(self, elem):
+        """Return the text before elem's first child element, or None."""
+        child = elem.firstChild
+        if child is not None and child.nodeType == child.TEXT_NODE:
+            return child.data
+        return None
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
+        root = self._dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+
+    def _node_matches(self, elem, attrs, line_number, contains):
+        """Return True if elem passes the get_node() filters that are set."""
+        # Check line_number filter
+        if line_number is not None:
+            parse_pos = getattr(elem, "parse_position", (None,))
+            elem_line = parse_pos[0]
+
+            # Handle both single line number and range
+            if isinstance(line_number, range):
+                if elem_line not in line_number:
+                    return False
+            else:
+                if elem_line != line_number:
+                    return False
+
+        # Check attrs filter
+        if attrs is not None:
+            if not all(
+                elem.getAttribute(attr_name) == attr_value
+                for attr_name, attr_value in attrs.items()
+            ):
+                return False
+
+        # Check contains filter
+        if contains is not None:
+            if contains not in self._get_element_text(elem):
+                return False
+
+        return True
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -217,12 +384,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._insert_nodes(elem, "replace", self._parse_fragment(new_content))
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +400,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._insert_nodes(elem, "after", self._parse_fragment(xml_content))
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +416,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._insert_nodes(elem, "before", self._parse_fragment(xml_content))
 
     def append_to(self, elem, xml_content):
         """
@@ -282,32 +432,81 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        return self._insert_nodes(elem, "append", self._parse_fragment(xml_content))
+
+    def _insert_nodes(self, elem, position, nodes):
+        """
+        Place parsed nodes relative to elem and record them for get_node().
+
+        Args:
+            elem: Element the nodes are placed at
+            position: "replace", "before", "after", or "append" (as children)
+            nodes: Nodes returned by _parse_fragment() or _parse_fragments()
+
+        Returns:
+            nodes
+        """
+        self._dirty = True
+        if position == "replace":
+            self._forget_node(elem)
+        self._place_nodes(elem, position, nodes)
+        self._index_nodes(nodes)
         return nodes
 
+    def _place_nodes(self, elem, position, nodes):
+        parent = elem.parentNode
+        if position == "append":
+            for node in nodes:
+                elem.appendChild(node)
+        elif position == "after":
+            next_sibling = elem.nextSibling
+            for node in nodes:
+                if next_sibling:
+                    parent.insertBefore(node, next_sibling)
+                else:
+                    parent.appendChild(node)
+        else:
+            for node in nodes:
+                parent.insertBefore(node, elem)
+            if position == "replace":
+                parent.removeChild(elem)
+
     def get_next_rid(self):
-        """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        """Get the next available rId for relationships files.
+
+        Each call reserves a new rId. rIds in XML inserted through the editing
+        methods are taken into account, so they are never handed out again.
+        """
+        return f"rId{self._rids.next_id()}"
+
+    def _rids_in_use(self):
+        return (
+            elem.getAttribute("Id") for elem in self._elements_by_tag("Relationship")
+        )
 
     def save(self):
         """
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). Clean editors are
+        not serialized, and the file is only replaced (see replace_file()) when
+        its content changes.
+
+        Returns:
+            int: Bytes written, 0 if the file was left as it was
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        if not self._dirty:
+            return 0
+        content = self._serialize()
+        if self.xml_path.exists() and self.xml_path.read_bytes() == content:
+            return 0
+        replace_file(self.xml_path, content)
+        return len(content)
+
+    def _serialize(self):
+        """Return the document as bytes, in the original encoding."""
+        return self._dom.toxml(encoding=self.encoding)
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,8 +521,24 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, contents):
+        """
+        Parse several XML fragments in a single wrapper document.
+
+        Args:
+            contents: Strings containing XML fragments
+
+        Returns:
+            One list of imported nodes per fragment, as _parse_fragment() returns
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+            ValueError: If a fragment is not well-formed on its own
+        """
         # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
+        root_elem = self._dom.documentElement
         namespaces = []
         if root_elem and root_elem.attributes:
             for i in range(root_elem.attributes.length):
@@ -332,15 +547,553 @@ class XMLEditor:
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        items = "".join(f"<fragment>{content}</fragment>" for content in contents)
+        wrapper = f"<root {ns_decl}>{items}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
-        return nodes
+        items = fragment_doc.documentElement.childNodes  # type: ignore
+        _check_fragment_count(items, contents)
+
+        parsed = []
+        for item in items:
+            nodes = [
+                self._dom.importNode(child, deep=True) for child in item.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            parsed.append(nodes)
+        return parsed
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml instead of minidom.
+
+    lxml keeps a large document in a fraction of the memory minidom needs and
+    parses it in C. get_node, replace_node, insert_before/after and append_to
+    behave as in XMLEditor, and line numbers come from the parser's own
+    sourceline. Inserted elements have no line number, as in XMLEditor.
+
+    sourceline is the line where a start tag ends, so for a start tag spread
+    over several lines it differs from XMLEditor's line; columns are None.
+
+    The parser does not load DTDs, expand entities or access the network, and
+    documents declaring entities are rejected, like defusedxml does.
+
+    Elements are lxml elements that also answer the minidom names the editors
+    use (tagName, parentNode, previousSibling, childNodes, getAttribute,
+    setAttribute, hasAttribute, removeAttribute, getElementsByTagName, toxml).
+    Text is held in .text and .tail; there are no text nodes.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        dom: Parsed lxml.etree._ElementTree
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist or declares entities
+        """
+        self._parser = _create_secure_lxml_parser()
+        super().__init__(xml_path)
+
+    def _load(self):
+        """Parse xml_path into self.dom."""
+        self._dom = lxml.etree.parse(str(self.xml_path), self._parser)
+        _forbid_entities(self._dom, self.xml_path)
+        self._root = self._dom.getroot()
+        self._dirty = False
+
+    def _place_nodes(self, elem, position, nodes):
+        if position == "append":
+            for node in nodes:
+                elem.append(node)
+        elif position == "after":
+            anchor = elem
+            for node in nodes:
+                anchor.addnext(node)
+                anchor = node
+        else:
+            for node in nodes:
+                elem.addprevious(node)
+            if position == "replace":
+                # Keep the whitespace that followed the replaced element
+                previous = elem.getprevious()
+                if elem.tail and previous is not None:
+                    previous.tail = (previous.tail or "") + elem.tail
+                elem.getparent().remove(elem)
+
+    def _serialize(self):
+        """Return the document as bytes, in the original encoding and standalone
+        declaration."""
+        # Written like minidom's declaration (lxml quotes with '), so the
+        # encoding is detected again when the file is reopened. libxml2 reports
+        # an absent standalone as False, so only "yes" is written back.
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"'
+        if self._dom.docinfo.standalone:
+            declaration += ' standalone="yes"'
+        body = lxml.etree.tostring(
+            self._dom, encoding=self.encoding, xml_declaration=False
+        )
+        return f"{declaration}?>\n".encode(self.encoding) + body
+
+    def _is_attached(self, node):
+        """Return True if node is (still) part of this document's tree."""
+        parent = node.getparent()
+        while parent is not None:
+            node, parent = parent, parent.getparent()
+        return node is self._root
+
+    def _root_element(self):
+        return self._root
+
+    def _elements_by_tag(self, tag):
+        """Return the elements with a tag name (e.g. "w:p") in document order."""
+        qualified = self._root._qualify(tag)
+        # With an undeclared prefix no element can have the tag
+        return list(self._root.iter(qualified)) if qualified else []
+
+    @staticmethod
+    def _iter_elements(node):
+        return node.iter(lxml.etree.Element)
+
+    def _get_element_text(self, elem):
+        """
+        Extract all text content from an element.
+
+        Skips text that contains only whitespace (spaces, tabs, newlines),
+        which typically represents XML formatting rather than document content.
+        """
+        return "".join(text for text in elem.itertext() if text.strip())
+
+    def _create_element(self, tag):
+        """Create a detached element with a prefixed tag name (e.g. "w:del")."""
+        prefix = tag.rpartition(":")[0]
+        return self._root.makeelement(
+            self._root.qualify(tag),
+            nsmap={prefix or None: self._root.nsmap[prefix or None]},
+        )
+
+    def _rename_element(self, elem, tag):
+        """Rename elem in place; attributes and children stay."""
+        elem.tag = self._root.qualify(tag)
+        return elem
+
+    def _move_children(self, source, target):
+        """Move all child nodes (and text) of source to the end of target."""
+        if source.text:
+            if len(target):
+                target[-1].tail = (target[-1].tail or "") + source.text
+            else:
+                target.text = (target.text or "") + source.text
+            source.text = None
+        target.extend(list(source))
+
+    def _first_text(self, elem):
+        """Return the text before elem's first child element, or None."""
+        return elem.text
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
+        if prefix not in self._root.nsmap:
+            # lxml cannot add a declaration to an existing element; declare it
+            # on a temporary child and let cleanup_namespaces move it to the
+            # root. Keep every existing declaration, since mc:Ignorable names
+            # prefixes that no element uses.
+            probe = lxml.etree.SubElement(
+                self._root, f"{{{uri}}}probe", nsmap={prefix: uri}
+            )
+            lxml.etree.cleanup_namespaces(
+                self._root,
+                top_nsmap={prefix: uri},
+                keep_ns_prefixes=[p for p in self._root.nsmap if p],
+            )
+            self._root.remove(probe)
+
+    def _parse_fragments(self, contents):
+        """
+        Parse several XML fragments with the document's namespaces, in a
+        single wrapper document.
+
+        Args:
+            contents: Strings containing XML fragments
+
+        Returns:
+            One list of lxml nodes (elements, comments) per fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+            ValueError: If a fragment is not well-formed on its own
+        """
+        namespaces = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self._root.nsmap.items()
+        )
+        items = "".join(f"<fragment>{content}</fragment>" for content in contents)
+        wrapper = lxml.etree.fromstring(
+            f"<root {namespaces}>{items}</root>", self._parser
+        )
+        _check_fragment_count(wrapper, contents)
+
+        parsed = []
+        for item in wrapper:
+            nodes = list(item)
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            for elem in elements:
+                for descendant in elem.iter():
+                    descendant.sourceline = 0  # No line in the original file
+            parsed.append(nodes)
+        return parsed
+
+
+class _MinidomNames:
+    """minidom names for lxml nodes, so code written for XMLEditor runs on both."""
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    COMMENT_NODE = 8
+
+    @property
+    def parentNode(self):
+        return self.getparent()
+
+    @property
+    def previousSibling(self):
+        return self.getprevious()
+
+    @property
+    def nextSibling(self):
+        return self.getnext()
+
+    @property
+    def childNodes(self):
+        return list(self)
+
+    @property
+    def firstChild(self):
+        return self[0] if len(self) else None
+
+    def appendChild(self, node):
+        self.append(node)
+        return node
+
+    def insertBefore(self, node, reference):
+        reference.addprevious(node)
+        return node
+
+    def removeChild(self, node):
+        self.remove(node)
+        return node
+
+    def replaceChild(self, node, old):
+        self.replace(old, node)
+        return old
+
+    def cloneNode(self, deep):
+        return copy.deepcopy(self) if deep else self.makeelement(self.tag, self.attrib)
+
+
+class _LxmlElement(_MinidomNames, lxml.etree.ElementBase):
+    """lxml element with minidom-style names; see LxmlXMLEditor."""
+
+    nodeType = _MinidomNames.ELEMENT_NODE
+
+    @property
+    def tagName(self):
+        tag = self.tag
+        local = tag[tag.find("}") + 1 :]
+        return f"{self.prefix}:{local}" if self.prefix else local
+
+    nodeName = tagName
+
+    @property
+    def parse_position(self):
+        """(line, None) in the original file; (None, None) for inserted elements."""
+        # Inserted elements carry sourceline 0 (see LxmlXMLEditor._parse_fragments)
+        return (self.sourceline or None, None)
+
+    def qualify(self, name):
+        """Return the {namespace}local name for a prefixed name like "w:id".
+
+        Raises:
+            ValueError: If the prefix is not declared
+        """
+        qualified = self._qualify(name)
+        if qualified is None:
+            raise ValueError(f"Namespace prefix not declared: {name}")
+        return qualified
+
+    def _qualify(self, name):
+        prefix, _, local = name.rpartition(":")
+        if not prefix:
+            return name
+        if prefix == "xml":
+            return f"{{{XML_NAMESPACE}}}{local}"
+        uri = self.nsmap.get(prefix)
+        return f"{{{uri}}}{local}" if uri is not None else None
+
+    # As in minidom, names with an undeclared prefix are simply not present
+    def getAttribute(self, name):
+        qualified = self._qualify(name)
+        return self.get(qualified, "") if qualified else ""
+
+    def hasAttribute(self, name):
+        qualified = self._qualify(name)
+        return qualified is not None and self.get(qualified) is not None
+
+    def setAttribute(self, name, value):
+        self.set(self.qualify(name), value)
+
+    def removeAttribute(self, name):
+        qualified = self._qualify(name)
+        if qualified:
+            self.attrib.pop(qualified, None)
+
+    def getElementsByTagName(self, name):
+        qualified = self._qualify(name)
+        return list(self.iterdescendants(qualified)) if qualified else []
+
+    def toxml(self):
+        return lxml.etree.tostring(self, encoding="unicode", with_tail=False)
+
+
+class _LxmlComment(_MinidomNames, lxml.etree.CommentBase):
+    nodeType = _MinidomNames.COMMENT_NODE
+    nodeName = "#comment"
+
+
+class _LxmlProcessingInstruction(_MinidomNames, lxml.etree.PIBase):
+    nodeType = 7  # PROCESSING_INSTRUCTION_NODE
+
+
+class IdAllocator:
+    """
+    Hands out increasing integer IDs without rescanning the document each time.
+
+    The IDs already in use are read once from the sources added with
+    add_source(), on the first allocation after the source was added. IDs that
+    callers write themselves are reported with observe(), so later IDs stay
+    above them. Editors of the same package can share one allocator to keep
+    IDs unique across parts.
+
+    Example:
+        ids = IdAllocator(start=1, prefix="rId")
+        ids.add_source(lambda: (e.getAttribute("Id") for e in rels))
+        ids.next_id()  # 1 more than the highest rIdN in rels
+    """
+
+    def __init__(self, start=0, prefix=""):
+        """
+        Args:
+            start: Lowest ID handed out
+            prefix: Prefix of the ID strings (e.g. "rId"); others are ignored
+        """
+        self.start = start
+        self.prefix = prefix
+        self._next = start
+        self._sources = []  # Callables returning the ID strings in use
+        self._unread = []  # Sources not read since they were added or reset()
+
+    def add_source(self, ids_in_use):
+        """Add a callable returning ID strings in use; it is read lazily."""
+        self._sources.append(ids_in_use)
+        self._unread.append(ids_in_use)
+
+    def remove_source(self, ids_in_use):
+        """Stop reading a source added with add_source(), if it was added."""
+        for sources in (self._sources, self._unread):
+            if ids_in_use in sources:
+                sources.remove(ids_in_use)
+
+    def observe(self, value):
+        """Record an ID in use (int or ID string); IDs not in the format are ignored."""
+        if isinstance(value, str):
+            if not value.startswith(self.prefix):
+                return
+            try:
+                value = int(value[len(self.prefix) :])
+            except ValueError:
+                return
+        self._next = max(self._next, value + 1)
+
+    def peek(self):
+        """Return the ID next_id() would return, without reserving it."""
+        while self._unread:
+            for value in self._unread.pop()():
+                self.observe(value)
+        return self._next
+
+    def next_id(self):
+        """Reserve and return the next free ID."""
+        value = self.peek()
+        self._next = value + 1
+        return value
+
+    def reset(self):
+        """Read every source again on next use, e.g. after direct DOM changes.
+
+        IDs already handed out stay reserved, whether or not they are in use yet.
+        """
+        self._unread = list(self._sources)
+
+    def mark(self):
+        """Return a value rewind() can return the allocator to."""
+        return self._next
+
+    def rewind(self, mark):
+        """Hand out IDs from a mark() again, e.g. after the edits using them were undone.
+
+        The sources are read again, so IDs still in use are not handed out.
+        """
+        self._next = mark
+        self.reset()
+
+
+class _NodeIndex:
+    """
+    Lookup tables over the elements of a document, for XMLEditor.get_node().
+
+    Elements are kept per tag name in insertion-ordered dicts used as sets, so
+    adding and removing subtrees is cheap. A tag's table is filled from the
+    document the first time it is looked up; attribute-value tables and sorted
+    line tables are built per tag the same way. Candidates are a superset of
+    the matches: callers still apply the filters.
+    """
+
+    def __init__(self, find_elements, iter_elements):
+        """
+        Args:
+            find_elements: Callable returning the elements with a tag name, in
+                           document order
+            iter_elements: Callable yielding a node and its descendant elements
+        """
+        self.find_elements = find_elements
+        self.iter_elements = iter_elements
+        self.by_tag = {}  # tag -> {element: None}
+        self.by_attr = {}  # tag -> {attr: {value: {element: None}}}
+        self.by_line = {}  # tag -> (sorted start lines, elements)
+
+    def add(self, node):
+        """Add an element and its descendants to the tags indexed so far."""
+        for elem in self.iter_elements(node):
+            tag = elem.tagName
+            elements = self.by_tag.get(tag)
+            if elements is None:
+                continue  # Read from the document when first looked up
+            elements[elem] = None
+            for attr, values in self.by_attr.get(tag, {}).items():
+                values.setdefault(elem.getAttribute(attr), {})[elem] = None
+
+    def remove(self, node):
+        """Remove an element and its descendants.
+
+        Line tables are left alone; their entries only count while the element
+        is in by_tag.
+        """
+        for elem in self.iter_elements(node):
+            tag = elem.tagName
+            self.by_tag.get(tag, {}).pop(elem, None)
+            for attr, values in self.by_attr.get(tag, {}).items():
+                values.get(elem.getAttribute(attr), {}).pop(elem, None)
+
+    def candidates(self, tag, attrs, line_number):
+        """Return elements that may match, in document order when parsed."""
+        elements = self.by_tag.get(tag)
+        if elements is None:
+            elements = self.by_tag[tag] = dict.fromkeys(self.find_elements(tag))
+        if not elements:
+            return []
+
+        if line_number is not None:
+            lines, line_elements = self._lines(tag)
+            if isinstance(line_number, range):
+                if not line_number:
+                    return []
+                lo = bisect.bisect_left(lines, min(line_number))
+                hi = bisect.bisect_right(lines, max(line_number))
+            else:
+                lo = bisect.bisect_left(lines, line_number)
+                hi = bisect.bisect_right(lines, line_number)
+            return [elem for elem in line_elements[lo:hi] if elem in elements]
+
+        if attrs:
+            attr, value = next(iter(attrs.items()))
+            return list(self._values(tag, attr).get(value, ()))
+
+        return list(elements)
+
+    def _values(self, tag, attr):
+        attrs = self.by_attr.setdefault(tag, {})
+        values = attrs.get(attr)
+        if values is None:
+            values = attrs[attr] = {}
+            for elem in self.by_tag[tag]:
+                values.setdefault(elem.getAttribute(attr), {})[elem] = None
+        return values
+
+    def _lines(self, tag):
+        # Only parsed elements have a line; inserted ones never match a line filter
+        table = self.by_line.get(tag)
+        if table is None:
+            positioned = sorted(
+                (
+                    (line, i, elem)
+                    for i, elem in enumerate(self.by_tag[tag])
+                    if (line := getattr(elem, "parse_position", (None,))[0]) is not None
+                ),
+                key=lambda entry: entry[:2],
+            )
+            table = self.by_line[tag] = (
+                [line for line, _, _ in positioned],
+                [elem for _, _, elem in positioned],
+            )
+        return table
+
+
+def replace_file(path, content):
+    """Replace path with content (bytes) atomically, through a renamed temporary file.
+
+    Readers see either the old or the new file, and hard links to the old file
+    keep its content. The file's permissions are kept.
+    """
+    path = Path(path)
+    mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else 0o644
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _iter_elements(node):
+    """Yield node (if an element) and its descendant elements in document order."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.nodeType == node.ELEMENT_NODE:
+            yield node
+            stack.extend(reversed(node.childNodes))
+
+
+def _check_fragment_count(items, contents):
+    """Make sure every fragment parsed into exactly one wrapper item.
+
+    A fragment that closes its item and opens another one is well-formed
+    inside the wrapper but not on its own.
+    """
+    if len(items) != len(contents):
+        raise ValueError("Each XML fragment must be well-formed on its own")
 
 
 def _create_line_tracking_parser():
@@ -372,3 +1125,38 @@ def _create_line_tracking_parser():
     orig_set_content_handler = parser.setContentHandler
     parser.setContentHandler = set_content_handler  # type: ignore
     return parser
+
+
+def _create_secure_lxml_parser():
+    """
+    Create an lxml parser with the protections defusedxml gives minidom.
+
+    DTDs are not loaded, entities are not expanded and nothing is fetched from
+    the network. Nodes are created as _LxmlElement (and friends), which answer
+    the minidom names used by the editors.
+
+    Returns:
+        lxml.etree.XMLParser: Configured parser
+    """
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False,
+        load_dtd=False,
+        no_network=True,
+        huge_tree=False,
+        remove_blank_text=False,
+    )
+    parser.set_element_class_lookup(
+        lxml.etree.ElementDefaultClassLookup(
+            element=_LxmlElement,
+            comment=_LxmlComment,
+            pi=_LxmlProcessingInstruction,
+        )
+    )
+    return parser
+
+
+def _forbid_entities(tree, xml_path):
+    """Reject documents declaring entities, as defusedxml does (billion laughs)."""
+    dtd = tree.docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise ValueError(f"Entity declarations are not allowed: {xml_path}")
@@ -0,0 +1,935 @@
+#!/usr/bin/env python3
+"""
+Benchmark the unpack/pack/validate pipeline, Document and inventory.py on synthetic files.
+
+Fixtures are generated at the requested scale, every stage runs in its own
+process (so peak memory is per stage) and the results are written as JSON
+that can be compared against a baseline from another commit.
+
+Usage:
+    python benchmark.py --output baseline.json
+    python benchmark.py --paragraphs 1000,10000,100000 --slides 10,100,1000 --output big.json
+    python benchmark.py --output current.json --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import runpy
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# .../document-skills/<skill>/ooxml/scripts -> .../document-skills
+SKILLS_DIR = SCRIPTS_DIR.parents[2]
+DOCX_SKILL_DIR = SKILLS_DIR / "docx"
+PPTX_SKILL_DIR = SKILLS_DIR / "pptx"
+
+FORMAT_VERSION = 1
+
+STAGES = {
+    ".docx": ["unpack", "pack", "validate", "validate_full", "document"],
+    ".pptx": ["unpack", "pack", "validate", "validate_full", "inventory"],
+}
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+WP_NS = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+PIC_NS = "http://schemas.openxmlformats.org/drawingml/2006/picture"
+PKG_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+MS_REL_TYPE = "http://schemas.microsoft.com/office"
+
+# (part, root element, namespace declarations, relationship type, content type)
+COMMENT_PARTS = [
+    (
+        "comments.xml",
+        "w:comments",
+        f'xmlns:w="{W_NS}" xmlns:w14="{W14_NS}"',
+        "comments",
+        "wordprocessingml.comments+xml",
+    ),
+    (
+        "commentsExtended.xml",
+        "w15:commentsEx",
+        'xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"',
+        f"{MS_REL_TYPE}/2011/relationships/commentsExtended",
+        "wordprocessingml.commentsExtended+xml",
+    ),
+    (
+        "commentsIds.xml",
+        "w16cid:commentsIds",
+        'xmlns:w16cid="http://schemas.microsoft.com/office/word/2016/wordml/cid"',
+        f"{MS_REL_TYPE}/2016/09/relationships/commentsIds",
+        "wordprocessingml.commentsIds+xml",
+    ),
+    (
+        "commentsExtensible.xml",
+        "w16cex:commentsExtensible",
+        'xmlns:w16cex="http://schemas.microsoft.com/office/word/2018/wordml/cex"',
+        f"{MS_REL_TYPE}/2018/08/relationships/commentsExtensible",
+        "wordprocessingml.commentsExtensible+xml",
+    ),
+]
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+DATE = "2024-01-01T00:00:00Z"
+
+WORDS = (
+    "alpha beta gamma delta epsilon zeta theta kappa lambda sigma omega "
+    "contract clause party agreement term notice payment schedule section "
+    "shall may within days written consent provided however including"
+).split()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the OOXML pipeline on synthetic documents"
+    )
+    parser.add_argument(
+        "--paragraphs",
+        default="1000",
+        help="Comma-separated .docx sizes in paragraphs (default: 1000)",
+    )
+    parser.add_argument(
+        "--slides",
+        default="10",
+        help="Comma-separated .pptx sizes in slides (default: 10)",
+    )
+    parser.add_argument(
+        "--comments", type=int, default=50, help="Comments per .docx (default: 50)"
+    )
+    parser.add_argument(
+        "--changes",
+        type=int,
+        default=50,
+        help="Tracked changes per .docx (default: 50)",
+    )
+    parser.add_argument(
+        "--media",
+        type=int,
+        default=5,
+        help="Embedded images per fixture (default: 5)",
+    )
+    parser.add_argument(
+        "--media-size",
+        type=int,
+        default=256,
+        help="Width and height of each embedded image in pixels (default: 256)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per stage; the median is compared (default: 3)",
+    )
+    parser.add_argument(
+        "--stages",
+        help="Comma-separated stages to run: unpack, pack, validate, validate_full, "
+        "document (.docx) and inventory (.pptx) (default: all)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Fixture random seed")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON to compare the results with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown or memory growth reported as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--keep", help="Keep fixtures and stage outputs in this directory"
+    )
+    # Internal: run one stage in this process and print its measurements
+    parser.add_argument("--run-stage", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        stage, fixture, workdir = args.run_stage
+        print(json.dumps(run_stage(stage, Path(fixture), Path(workdir))))
+        return
+
+    stages = args.stages.split(",") if args.stages else None
+    with contextlib.ExitStack() as stack:
+        if args.keep:
+            workdir = Path(args.keep)
+            workdir.mkdir(parents=True, exist_ok=True)
+        else:
+            workdir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        results = run_benchmarks(args, workdir, stages)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if not compare_results(baseline, results, args.threshold):
+            sys.exit(1)
+
+
+def run_benchmarks(args, workdir, stages=None):
+    """Generate every fixture, run its stages and return the results document."""
+    fixtures = []
+    for paragraphs in parse_sizes(args.paragraphs):
+        path = workdir / f"docx-{paragraphs}p.docx"
+        generate_docx(
+            path,
+            paragraphs,
+            comments=args.comments,
+            changes=args.changes,
+            media=args.media,
+            media_size=args.media_size,
+            seed=args.seed,
+        )
+        fixtures.append(path)
+    for slides in parse_sizes(args.slides):
+        path = workdir / f"pptx-{slides}s.pptx"
+        generate_pptx(
+            path, slides, media=args.media, media_size=args.media_size, seed=args.seed
+        )
+        fixtures.append(path)
+
+    results = []
+    for fixture in fixtures:
+        fixture_dir = workdir / fixture.stem
+        fixture_dir.mkdir(exist_ok=True)
+        for stage in STAGES[fixture.suffix]:
+            if stages is not None and stage not in stages:
+                continue
+            print(f"{fixture.stem}: {stage}...", end=" ", flush=True)
+            result = benchmark_stage(stage, fixture, fixture_dir, args.repeat)
+            results.append(result)
+            if result["status"] == "ok":
+                print(
+                    f"{result['seconds']['median']:.3f}s, "
+                    f"peak {result['peak_rss_mb']:.1f} MB"
+                )
+            else:
+                print(f"{result['status']} ({result['error']})")
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "environment": environment_info(),
+        "config": {
+            "paragraphs": parse_sizes(args.paragraphs),
+            "slides": parse_sizes(args.slides),
+            "comments": args.comments,
+            "changes": args.changes,
+            "media": args.media,
+            "media_size": args.media_size,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "fixtures": {
+            fixture.stem: {"bytes": fixture.stat().st_size} for fixture in fixtures
+        },
+        "results": results,
+    }
+
+
+def parse_sizes(value):
+    return [int(size) for size in value.split(",") if size.strip()]
+
+
+def environment_info():
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": None,
+    }
+    try:
+        import lxml.etree
+
+        info["lxml"] = ".".join(str(v) for v in lxml.etree.LXML_VERSION)
+    except ImportError:
+        info["lxml"] = None
+    try:
+        info["commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=SCRIPTS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return info
+
+
+# ==================== Stages ====================
+
+
+def benchmark_stage(stage, fixture, fixture_dir, repeat):
+    """Run a stage `repeat` times, each in a fresh process, and summarize the runs."""
+    result = {"fixture": fixture.stem, "stage": stage, "status": "ok", "error": None}
+    runs = []
+    for _ in range(max(repeat, 1)):
+        process = subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--run-stage",
+                stage,
+                str(fixture),
+                str(fixture_dir),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        try:
+            run = json.loads(process.stdout.strip().splitlines()[-1])
+        except (IndexError, json.JSONDecodeError):
+            stderr = process.stderr.strip().splitlines()
+            run = {"status": "error", "error": stderr[-1] if stderr else "no output"}
+        if run["status"] != "ok":
+            result["status"] = run["status"]
+            result["error"] = run["error"]
+            return result
+        runs.append(run)
+
+    seconds = [run["seconds"] for run in runs]
+    result["runs"] = len(runs)
+    result["seconds"] = {
+        "min": round(min(seconds), 6),
+        "median": round(statistics.median(seconds), 6),
+        "max": round(max(seconds), 6),
+    }
+    result["peak_rss_mb"] = round(max(run["peak_rss_mb"] for run in runs), 2)
+    result["stage_rss_mb"] = round(max(run["stage_rss_mb"] for run in runs), 2)
+    result["passed"] = all(run["passed"] for run in runs)
+    return result
+
+
+def run_stage(stage, fixture, workdir):
+    """Run one stage in this process and return its measurements.
+
+    Setup (imports, copying inputs) happens before the clock starts. Peak RSS
+    is the process high-water mark, so stage_rss_mb is the growth during the
+    stage itself and peak_rss_mb includes the interpreter and imports.
+    """
+    import resource
+
+    try:
+        body = STAGE_SETUP[stage](fixture, workdir)
+    except ImportError as e:
+        return {"status": "skipped", "error": f"missing dependency: {e.name}"}
+
+    before = _max_rss_mb(resource)
+    start = time.perf_counter()
+    try:
+        # Stage output is not part of the measurement
+        with contextlib.redirect_stdout(io.StringIO()):
+            passed = body()
+    except Exception as e:
+        return {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    seconds = time.perf_counter() - start
+    peak = _max_rss_mb(resource)
+
+    return {
+        "status": "ok",
+        "error": None,
+        "seconds": seconds,
+        "peak_rss_mb": peak,
+        "stage_rss_mb": peak - before,
+        "passed": passed is not False,
+    }
+
+
+def _max_rss_mb(resource):
+    # ru_maxrss survives exec on Linux, so it can report the parent's peak;
+    # the VmHWM of this process's own address space does not
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _run_script(script, *argv):
+    """Run a script's __main__ in this process; returns False on a non-zero exit."""
+    saved_argv = sys.argv
+    sys.argv = [str(script), *map(str, argv)]
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        return e.code in (None, 0)
+    finally:
+        sys.argv = saved_argv
+    return True
+
+
+def _unpacked(fixture, workdir):
+    """The unpacked fixture, unpacked (untimed) if the unpack stage has not run."""
+    unpacked = workdir / "unpacked"
+    if not unpacked.is_dir():
+        # In a separate process, so it does not count towards this stage's peak
+        subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPTS_DIR / "unpack.py"),
+                str(fixture),
+                str(unpacked),
+            ],
+            capture_output=True,
+            check=True,
+        )
+    return unpacked
+
+
+def setup_unpack(fixture, workdir):
+    import defusedxml.minidom  # noqa: F401
+
+    output = workdir / "unpacked"
+    shutil.rmtree(output, ignore_errors=True)
+    return lambda: _run_script(SCRIPTS_DIR / "unpack.py", fixture, output)
+
+
+def setup_pack(fixture, workdir):
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from pack import pack_document
+
+    unpacked = _unpacked(fixture, workdir)
+    output = workdir / f"packed{fixture.suffix}"
+    return lambda: pack_document(unpacked, output, validate=False)
+
+
+def _setup_validate(fixture, workdir, *flags):
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import validation.service  # noqa: F401
+
+    # Validate an edited copy, as after a typical editing session
+    edited = workdir / "edited"
+    if not edited.is_dir():
+        shutil.copytree(_unpacked(fixture, workdir), edited)
+        edit_fixture(edited, fixture.suffix)
+    return lambda: _run_script(
+        SCRIPTS_DIR / "validate.py", edited, "--original", fixture, "--no-cache", *flags
+    )
+
+
+def setup_validate(fixture, workdir):
+    return _setup_validate(fixture, workdir)
+
+
+def setup_validate_full(fixture, workdir):
+    return _setup_validate(fixture, workdir, "--full")
+
+
+def setup_document(fixture, workdir):
+    sys.path.insert(0, str(DOCX_SKILL_DIR))
+    from scripts.document import Document
+
+    target = workdir / "document"
+    shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(_unpacked(fixture, workdir), target)
+
+    def body():
+        doc = Document(target, author="Claude", initials="C")
+        editor = doc["word/document.xml"]
+        first = editor.get_node(tag="w:p", contains="Paragraph 1:")
+        doc.add_comment(start=first, end=first, text="Benchmark comment")
+        run = editor.get_node(tag="w:r", contains="Paragraph 2:")
+        editor.suggest_deletion(run)
+        doc.save(validate=True)
+
+    return body
+
+
+def setup_inventory(fixture, workdir):
+    sys.path.insert(0, str(PPTX_SKILL_DIR / "scripts"))
+    from inventory import extract_text_inventory
+
+    return lambda: extract_text_inventory(fixture)
+
+
+STAGE_SETUP = {
+    "unpack": setup_unpack,
+    "pack": setup_pack,
+    "validate": setup_validate,
+    "validate_full": setup_validate_full,
+    "document": setup_document,
+    "inventory": setup_inventory,
+}
+
+
+def edit_fixture(unpacked, suffix):
+    """Make a small valid edit to the first content part of an unpacked fixture."""
+    if suffix == ".docx":
+        # A tracked insertion by Claude, so redlining has something to check
+        path = unpacked / "word" / "document.xml"
+        marker = "Paragraph 1:"
+        insertion = (
+            f'<w:ins w:id="999999" w:author="Claude" w:date="{DATE}">'
+            '<w:r><w:t xml:space="preserve">Edited </w:t></w:r></w:ins>'
+        )
+    else:
+        path = unpacked / "ppt" / "slides" / "slide1.xml"
+        marker = "Slide 1 title"
+        insertion = None
+
+    content = path.read_text(encoding="utf-8")
+    index = content.index(marker)
+    if insertion is None:
+        content = content.replace(marker, "Slide 1 edited title", 1)
+    else:
+        # Insert before the run holding the marker
+        run_start = content.rindex("<w:r>", 0, index)
+        content = content[:run_start] + insertion + content[run_start:]
+    path.write_text(content, encoding="utf-8")
+
+
+# ==================== Comparison ====================
+
+
+def compare_results(baseline, results, threshold):
+    """Print per-stage changes against a baseline; returns False on regressions."""
+    previous = {
+        (r["fixture"], r["stage"]): r
+        for r in baseline.get("results", [])
+        if r["status"] == "ok"
+    }
+    commits = (
+        baseline.get("environment", {}).get("commit"),
+        results.get("environment", {}).get("commit"),
+    )
+    print(
+        f"\nComparison with baseline ({commits[0] or 'unknown'} -> {commits[1] or 'unknown'}):"
+    )
+    print(
+        f"  {'fixture':<16} {'stage':<14} {'seconds':>18} {'change':>8} "
+        f"{'peak MB':>18} {'change':>8}"
+    )
+
+    regressions = []
+    for result in results["results"]:
+        key = (result["fixture"], result["stage"])
+        old = previous.get(key)
+        if result["status"] != "ok" or old is None:
+            status = result["status"] if result["status"] != "ok" else "new"
+            print(f"  {key[0]:<16} {key[1]:<14} {status:>18}")
+            continue
+
+        old_seconds, new_seconds = old["seconds"]["median"], result["seconds"]["median"]
+        old_memory, new_memory = old["peak_rss_mb"], result["peak_rss_mb"]
+        time_change = _relative_change(old_seconds, new_seconds)
+        memory_change = _relative_change(old_memory, new_memory)
+        flag = ""
+        if time_change > threshold or memory_change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(
+            f"  {key[0]:<16} {key[1]:<14} "
+            f"{old_seconds:>8.3f} -> {new_seconds:<7.3f} {time_change:>+8.1%} "
+            f"{old_memory:>8.1f} -> {new_memory:<7.1f} {memory_change:>+8.1%}{flag}"
+        )
+
+    if regressions:
+        print(
+            f"FAILED - {len(regressions)} stage(s) regressed by more than {threshold:.0%}"
+        )
+        return False
+    print("PASSED - No regressions")
+    return True
+
+
+def _relative_change(old, new):
+    return (new - old) / old if old else 0.0
+
+
+# ==================== Fixtures ====================
+
+
+def generate_docx(
+    path, paragraphs, comments=0, changes=0, media=0, media_size=256, seed=0
+):
+    """Write a synthetic .docx with body text, comments, tracked changes and images.
+
+    Comments, tracked changes (by "Reviewer") and images are spread evenly over
+    the paragraphs. Paragraph i always contains the text "Paragraph i:".
+    """
+    rng = random.Random(seed)
+    comment_at = _spread(comments, paragraphs)
+    change_at = _spread(changes, paragraphs)
+    media_at = _spread(media, paragraphs)
+
+    body = []
+    change_id = comments  # Comment and change IDs share one sequence
+    for i in range(1, paragraphs + 1):
+        text = f"Paragraph {i}: {_sentence(rng)}"
+        runs = [f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>']
+        if i in change_at:
+            change_id += 1
+            extra = _sentence(rng, 4)
+            if change_id % 2:
+                runs.append(
+                    f'<w:ins w:id="{change_id}" w:author="Reviewer" w:date="{DATE}">'
+                    f'<w:r><w:t xml:space="preserve"> {extra}</w:t></w:r></w:ins>'
+                )
+            else:
+                runs.append(
+                    f'<w:del w:id="{change_id}" w:author="Reviewer" w:date="{DATE}">'
+                    f'<w:r><w:delText xml:space="preserve"> {extra}</w:delText></w:r></w:del>'
+                )
+        if i in comment_at:
+            cid = comment_at[i]
+            runs = (
+                [f'<w:commentRangeStart w:id="{cid}"/>']
+                + runs
+                + [
+                    f'<w:commentRangeEnd w:id="{cid}"/>',
+                    f'<w:r><w:commentReference w:id="{cid}"/></w:r>',
+                ]
+            )
+        if i in media_at:
+            runs.append(_docx_drawing(media_at[i] + 1))
+        body.append(f"<w:p>{''.join(runs)}</w:p>")
+
+    document = (
+        f'{XML_DECLARATION}<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}" '
+        f'xmlns:wp="{WP_NS}" xmlns:a="{A_NS}" xmlns:pic="{PIC_NS}"><w:body>'
+        + "".join(body)
+        + '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/><w:pgMar w:top="1440" '
+        'w:right="1440" w:bottom="1440" w:left="1440" w:header="720" '
+        'w:footer="720" w:gutter="0"/></w:sectPr></w:body></w:document>'
+    )
+
+    # Word keeps each comment in four parts, linked by paragraph and durable IDs
+    comment_parts = {name: [] for name, *_ in COMMENT_PARTS}
+    for cid in range(comments):
+        para_id = f"{0x10000000 + cid:08X}"
+        durable_id = f"{0x20000000 + cid:08X}"
+        comment_parts["comments.xml"].append(
+            f'<w:comment w:id="{cid}" w:author="Reviewer" w:date="{DATE}" w:initials="R">'
+            f'<w:p w14:paraId="{para_id}" w14:textId="77777777"><w:r>'
+            f'<w:t xml:space="preserve">Comment {cid}: {_sentence(rng, 6)}</w:t>'
+            "</w:r></w:p></w:comment>"
+        )
+        comment_parts["commentsExtended.xml"].append(
+            f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
+        )
+        comment_parts["commentsIds.xml"].append(
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        )
+        comment_parts["commentsExtensible.xml"].append(
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}" w16cex:dateUtc="{DATE}"/>'
+        )
+
+    relationships = [
+        ("rId1", "styles", "styles.xml"),
+        ("rId2", "settings", "settings.xml"),
+    ]
+    overrides = [
+        ("/word/document.xml", "wordprocessingml.document.main+xml"),
+        ("/word/styles.xml", "wordprocessingml.styles+xml"),
+        ("/word/settings.xml", "wordprocessingml.settings+xml"),
+    ]
+    parts = {
+        "word/document.xml": document,
+        "word/styles.xml": (
+            f'{XML_DECLARATION}<w:styles xmlns:w="{W_NS}">'
+            '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+            '<w:name w:val="Normal"/></w:style></w:styles>'
+        ),
+        "word/settings.xml": (
+            f'{XML_DECLARATION}<w:settings xmlns:w="{W_NS}">'
+            '<w:defaultTabStop w:val="720"/>'
+            '<w:characterSpacingControl w:val="doNotCompress"/>'
+            "</w:settings>"
+        ),
+    }
+    if comments:
+        for name, root, namespaces, rel_type, content_type in COMMENT_PARTS:
+            parts[f"word/{name}"] = (
+                f"{XML_DECLARATION}<{root} {namespaces}>"
+                + "".join(comment_parts[name])
+                + f"</{root}>"
+            )
+            relationships.append((f"rId{len(relationships) + 1}", rel_type, name))
+            overrides.append((f"/word/{name}", content_type))
+    for k in range(1, media + 1):
+        relationships.append((f"rIdImage{k}", "image", f"media/image{k}.png"))
+
+    parts["word/_rels/document.xml.rels"] = _relationships_xml(relationships)
+    parts["_rels/.rels"] = _relationships_xml(
+        [("rId1", "officeDocument", "word/document.xml")]
+    )
+    parts["[Content_Types].xml"] = _content_types_xml(overrides)
+
+    images = {
+        f"word/media/image{k}.png": _png(media_size, rng) for k in range(1, media + 1)
+    }
+    _write_zip(path, parts, images)
+
+
+def generate_pptx(path, slides, media=0, media_size=256, seed=0):
+    """Write a synthetic .pptx with one master and layout and text-heavy slides.
+
+    Slide i has a title "Slide i title" and a body text box with several
+    paragraphs; images are spread evenly over the slides.
+    """
+    rng = random.Random(seed)
+    media_at = _spread(media, slides)
+    namespaces = f'xmlns:a="{A_NS}" xmlns:r="{R_NS}" xmlns:p="{P_NS}"'
+
+    parts = {}
+    images = {}
+    overrides = [
+        ("/ppt/presentation.xml", "presentationml.presentation.main+xml"),
+        ("/ppt/slideMasters/slideMaster1.xml", "presentationml.slideMaster+xml"),
+        ("/ppt/slideLayouts/slideLayout1.xml", "presentationml.slideLayout+xml"),
+        ("/ppt/theme/theme1.xml", "theme+xml"),
+    ]
+    presentation_rels = [
+        ("rId1", "slideMaster", "slideMasters/slideMaster1.xml"),
+        ("rId2", "theme", "theme/theme1.xml"),
+    ]
+    slide_ids = []
+
+    for i in range(1, slides + 1):
+        shapes = [
+            _pptx_text_shape(
+                2, "Title", [f"Slide {i} title"], 457200, 274638, 8229600, 1143000
+            ),
+            _pptx_text_shape(
+                3,
+                "Body",
+                [_sentence(rng) for _ in range(5)],
+                457200,
+                1600200,
+                8229600,
+                4525963,
+            ),
+        ]
+        slide_rels = [("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml")]
+        if i in media_at:
+            k = media_at[i] + 1
+            images[f"ppt/media/image{k}.png"] = _png(media_size, rng)
+            slide_rels.append(("rId2", "image", f"../media/image{k}.png"))
+            shapes.append(_pptx_picture(4, "rId2"))
+        parts[f"ppt/slides/slide{i}.xml"] = (
+            f"{XML_DECLARATION}<p:sld {namespaces}><p:cSld>"
+            + _pptx_shape_tree(shapes)
+            + "</p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+        )
+        parts[f"ppt/slides/_rels/slide{i}.xml.rels"] = _relationships_xml(slide_rels)
+        overrides.append((f"/ppt/slides/slide{i}.xml", "presentationml.slide+xml"))
+        presentation_rels.append((f"rId{i + 2}", "slide", f"slides/slide{i}.xml"))
+        slide_ids.append(f'<p:sldId id="{255 + i}" r:id="rId{i + 2}"/>')
+
+    parts["ppt/presentation.xml"] = (
+        f'{XML_DECLARATION}<p:presentation {namespaces} saveSubsetFonts="1">'
+        '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+        f"<p:sldIdLst>{''.join(slide_ids)}</p:sldIdLst>"
+        '<p:sldSz cx="9144000" cy="6858000" type="screen4x3"/>'
+        '<p:notesSz cx="6858000" cy="9144000"/></p:presentation>'
+    )
+    parts["ppt/slideMasters/slideMaster1.xml"] = (
+        f"{XML_DECLARATION}<p:sldMaster {namespaces}><p:cSld>"
+        + _pptx_shape_tree([])
+        + '</p:cSld><p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" '
+        'accent1="accent1" accent2="accent2" accent3="accent3" accent4="accent4" '
+        'accent5="accent5" accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+        '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/>'
+        "</p:sldLayoutIdLst></p:sldMaster>"
+    )
+    parts["ppt/slideMasters/_rels/slideMaster1.xml.rels"] = _relationships_xml(
+        [
+            ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+            ("rId2", "theme", "../theme/theme1.xml"),
+        ]
+    )
+    parts["ppt/slideLayouts/slideLayout1.xml"] = (
+        f'{XML_DECLARATION}<p:sldLayout {namespaces} type="blank" preserve="1">'
+        '<p:cSld name="Blank">'
+        + _pptx_shape_tree([])
+        + "</p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>"
+    )
+    parts["ppt/slideLayouts/_rels/slideLayout1.xml.rels"] = _relationships_xml(
+        [("rId1", "slideMaster", "../slideMasters/slideMaster1.xml")]
+    )
+    parts["ppt/theme/theme1.xml"] = _theme_xml()
+    parts["ppt/_rels/presentation.xml.rels"] = _relationships_xml(presentation_rels)
+    parts["_rels/.rels"] = _relationships_xml(
+        [("rId1", "officeDocument", "ppt/presentation.xml")]
+    )
+    parts["[Content_Types].xml"] = _content_types_xml(overrides)
+
+    _write_zip(path, parts, images)
+
+
+def _spread(count, total):
+    """Map `count` evenly spaced positions in 1..total to their sequence number."""
+    count = min(count, total)
+    if count <= 0:
+        return {}
+    step = total / count
+    return {int(n * step) + 1: n for n in range(count)}
+
+
+def _sentence(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + "."
+
+
+def _write_zip(path, parts, binaries):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        # [Content_Types].xml goes first, as Office writes it
+        zf.writestr("[Content_Types].xml", parts.pop("[Content_Types].xml"))
+        for name, content in parts.items():
+            zf.writestr(name, content)
+        for name, content in binaries.items():
+            zf.writestr(name, content)
+
+
+def _relationships_xml(relationships):
+    entries = []
+    for rid, rel_type, target in relationships:
+        if "://" not in rel_type:
+            rel_type = f"{REL_TYPE}/{rel_type}"
+        entries.append(
+            f'<Relationship Id="{rid}" Type="{rel_type}" Target="{target}"/>'
+        )
+    entries = "".join(entries)
+    return f'{XML_DECLARATION}<Relationships xmlns="{PKG_RELS_NS}">{entries}</Relationships>'
+
+
+def _content_types_xml(overrides):
+    entries = "".join(
+        f'<Override PartName="{name}" '
+        f'ContentType="application/vnd.openxmlformats-officedocument.{content_type}"/>'
+        for name, content_type in overrides
+    )
+    return (
+        f'{XML_DECLARATION}<Types xmlns="{CT_NS}">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        f"{entries}</Types>"
+    )
+
+
+def _png(size, rng):
+    """A size x size RGB PNG of noise (incompressible, like photos)."""
+    raw = b"".join(b"\x00" + rng.randbytes(size * 3) for _ in range(size))
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _picture_xml(prefix, shape_id, rid):
+    """The pic:pic / p:pic body shared by Word drawings and slide pictures."""
+    return (
+        f'<{prefix}:nvPicPr><{prefix}:cNvPr id="{shape_id}" name="Picture {shape_id}"/>'
+        f"<{prefix}:cNvPicPr/>{'<p:nvPr/>' if prefix == 'p' else ''}</{prefix}:nvPicPr>"
+        f'<{prefix}:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch>'
+        f'</{prefix}:blipFill><{prefix}:spPr><a:xfrm><a:off x="0" y="0"/>'
+        '<a:ext cx="914400" cy="914400"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/>'
+        f"</a:prstGeom></{prefix}:spPr>"
+    )
+
+
+def _docx_drawing(k):
+    return (
+        '<w:r><w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0">'
+        f'<wp:extent cx="914400" cy="914400"/><wp:docPr id="{k}" name="Picture {k}"/>'
+        f'<a:graphic><a:graphicData uri="{PIC_NS}"><pic:pic>'
+        + _picture_xml("pic", k, f"rIdImage{k}")
+        + "</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r>"
+    )
+
+
+def _pptx_shape_tree(shapes):
+    return (
+        '<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        "</p:nvGrpSpPr><p:grpSpPr/>" + "".join(shapes) + "</p:spTree>"
+    )
+
+
+def _pptx_text_shape(shape_id, name, paragraphs, x, y, cx, cy):
+    text = "".join(
+        f'<a:p><a:r><a:rPr lang="en-US" dirty="0"/><a:t>{p}</a:t></a:r></a:p>'
+        for p in paragraphs
+    )
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="{name} {shape_id}"/>'
+        '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="square"/><a:lstStyle/>{text}</p:txBody></p:sp>'
+    )
+
+
+def _pptx_picture(shape_id, rid):
+    return f"<p:pic>{_picture_xml('p', shape_id, rid)}</p:pic>"
+
+
+def _theme_xml():
+    colors = "".join(
+        f'<a:{name}><a:srgbClr val="{value}"/></a:{name}>'
+        for name, value in [
+            ("dk1", "000000"),
+            ("lt1", "FFFFFF"),
+            ("dk2", "1F497D"),
+            ("lt2", "EEECE1"),
+            ("accent1", "4F81BD"),
+            ("accent2", "C0504D"),
+            ("accent3", "9BBB59"),
+            ("accent4", "8064A2"),
+            ("accent5", "4BACC6"),
+            ("accent6", "F79646"),
+            ("hlink", "0000FF"),
+            ("folHlink", "800080"),
+        ]
+    )
+    fonts = '<a:latin typeface="Calibri"/><a:ea typeface=""/><a:cs typeface=""/>'
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    line = f'<a:ln w="9525">{fill}</a:ln>'
+    effect = "<a:effectStyle><a:effectLst/></a:effectStyle>"
+    return (
+        f'{XML_DECLARATION}<a:theme xmlns:a="{A_NS}" name="Benchmark">'
+        f'<a:themeElements><a:clrScheme name="Benchmark">{colors}</a:clrScheme>'
+        f'<a:fontScheme name="Benchmark"><a:majorFont>{fonts}</a:majorFont>'
+        f"<a:minorFont>{fonts}</a:minorFont></a:fontScheme>"
+        f'<a:fmtScheme name="Benchmark"><a:fillStyleLst>{fill * 3}</a:fillStyleLst>'
+        f"<a:lnStyleLst>{line * 3}</a:lnStyleLst>"
+        f"<a:effectStyleLst>{effect * 3}</a:effectStyleLst>"
+        f"<a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst></a:fmtScheme>"
+        "</a:themeElements></a:theme>"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,24 @@
 """
 Validation modules for Word document processing.
+
+Validators are imported on first use, so importing the package (e.g. for the
+lightweight validation.client) does not load lxml and the schema machinery.
 """
 
-from .base import BaseSchemaValidator
-from .docx import DOCXSchemaValidator
-from .pptx import PPTXSchemaValidator
-from .redlining import RedliningValidator
-
-__all__ = [
-    "BaseSchemaValidator",
-    "DOCXSchemaValidator",
-    "PPTXSchemaValidator",
-    "RedliningValidator",
-]
+import importlib
+
+_EXPORTS = {
+    "BaseSchemaValidator": ".base",
+    "DOCXSchemaValidator": ".docx",
+    "PPTXSchemaValidator": ".pptx",
+    "RedliningValidator": ".redlining",
+    "XLSXSchemaValidator": ".xlsx",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
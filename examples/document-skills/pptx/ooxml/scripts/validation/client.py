@@ -0,0 +1,115 @@
+"""
+Client side of the validation service, kept free of lxml and validator imports.
+
+validate.py imports only this module when a service is running, so a request
+costs little more than interpreter start.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+# Bump when requests or responses change shape
+PROTOCOL_VERSION = 1
+
+# Seconds to wait for the service to accept a connection, and then for its
+# response; on a timeout the caller validates in-process instead
+CONNECT_TIMEOUT = 2
+RESPONSE_TIMEOUT = 600
+
+
+def default_socket_path():
+    """Return the service socket path ($OOXML_VALIDATION_SOCKET overrides it)."""
+    env_path = os.environ.get("OOXML_VALIDATION_SOCKET")
+    if env_path:
+        return Path(env_path)
+    return Path(tempfile.gettempdir()) / f"ooxml-validation-{os.getuid()}.sock"
+
+
+_code_version = None
+
+
+def code_version():
+    """Digest of the validation package sources (memoized per process).
+
+    Requests carry it so a service started before the code changed is not used.
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(str(PROTOCOL_VERSION).encode())
+        for source in sorted(Path(__file__).parent.glob("*.py")):
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def request_validation(document, original_file, socket_path=None, **options):
+    """Validate through a running service.
+
+    Args:
+        document: Unpacked document directory, or a packed file
+        original_file: Path to the original file
+        socket_path: Service socket (default: default_socket_path())
+        **options: verbose, use_cache, jobs and incremental, as for run_validators()
+
+    Returns:
+        dict: {"passed", "validators", "output"} from the service, or None if no
+              usable service is running (the caller then validates in-process)
+    """
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    try:
+        # Only talk to a socket created by this user
+        if socket_path.stat().st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+
+    request = {
+        "version": PROTOCOL_VERSION,
+        "code_version": code_version(),
+        "command": "validate",
+        # The service does not share our working directory
+        "document": str(Path(document).resolve()),
+        "original": str(Path(original_file).resolve()),
+        "options": options,
+    }
+    try:
+        response = send_request(socket_path, request)
+    except (OSError, ValueError):
+        return None
+    if not response.get("ok"):
+        return None
+    return response["result"]
+
+
+def stop_service(socket_path=None):
+    """Ask a running service to exit. Returns False if none was running."""
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    try:
+        response = send_request(
+            socket_path, {"version": PROTOCOL_VERSION, "command": "shutdown"}
+        )
+    except (OSError, ValueError):
+        return False
+    return bool(response.get("ok"))
+
+
+def send_request(socket_path, request):
+    """Send one request to the service and return its decoded response.
+
+    Raises:
+        TimeoutError: If the service does not accept the connection within
+            CONNECT_TIMEOUT seconds or respond within RESPONSE_TIMEOUT seconds
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CONNECT_TIMEOUT)
+        client.connect(str(socket_path))
+        client.settimeout(RESPONSE_TIMEOUT)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("rb") as reader:
+            return json.loads(reader.readline())
@@ -2,13 +2,10 @@
 Validator for Word document XML files against XSD schemas.
 """
 
-import re
-import tempfile
-import zipfile
-
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .rules import WhitespacePreservationRule
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -24,94 +21,64 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
-        if not self.validate_xml():
+        if not self.run_check(self.validate_xml):
             return False
 
         # Test 1: Namespace declarations
         all_valid = True
-        if not self.validate_namespaces():
+        if not self.run_check(self.validate_namespaces):
             all_valid = False
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
+        if not self.run_check(self.validate_unique_ids):
             all_valid = False
 
         # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
+        if not self.run_check(self.validate_file_references):
             all_valid = False
 
         # Test 4: Content type declarations
-        if not self.validate_content_types():
+        if not self.run_check(self.validate_content_types):
             all_valid = False
 
-        # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
+        # Test 5: Whitespace preservation
+        if not self.run_check(self.validate_whitespace_preservation):
             all_valid = False
 
-        # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
+        # Test 6: Deletion validation
+        if not self.run_check(self.validate_deletions):
             all_valid = False
 
-        # Test 7: Deletion validation
-        if not self.validate_deletions():
+        # Test 7: Insertion validation
+        if not self.run_check(self.validate_insertions):
             all_valid = False
 
-        # Test 8: Insertion validation
-        if not self.validate_insertions():
+        # Test 8: Relationship ID reference validation
+        if not self.run_check(self.validate_all_relationship_ids):
             all_valid = False
 
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
+        # Test 9: XSD schema validation (the most expensive check, so it runs last)
+        if not self.run_check(self.validate_against_xsd):
             all_valid = False
 
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
+        self.print_parse_stats()
         return all_valid
 
+    def create_rules(self):
+        """Add Word-specific rules to the shared tree walk."""
+        return super().create_rules() + [WhitespacePreservationRule(self)]
+
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = self._rule_errors(WhitespacePreservationRule.name)
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
             for error in errors:
                 print(error)
@@ -134,7 +101,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.getroot(xml_file)
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -161,6 +128,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 )
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
             for error in errors:
                 print(error)
@@ -180,7 +148,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.getroot(xml_file)
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,19 +162,15 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Read document.xml straight from the original zip
+            data = self.baseline.read("word/document.xml")
+            if data is None:
+                raise FileNotFoundError("word/document.xml not found in original")
+            root = lxml.etree.fromstring(data)
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -225,7 +189,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.trees.getroot(xml_file)
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -251,6 +215,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 )
 
         if errors:
+            self.report.record_errors(errors)
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
             for error in errors:
                 print(error)
@@ -0,0 +1,192 @@
+"""
+Index of the parts, content types and relationships of a package, built once per run.
+"""
+
+import fnmatch
+import os
+import posixpath
+
+from .package import PackagePath
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+
+def rels_part_for(part):
+    """Return the .rels part holding part's relationships ("" is the package)."""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def source_part_for(rels_part):
+    """Return the part whose relationships rels_part holds (word/_rels/x.xml.rels -> word/x.xml)."""
+    rels_dir, name = posixpath.split(rels_part)
+    return posixpath.join(posixpath.dirname(rels_dir), name.removesuffix(".rels"))
+
+
+class Relationship:
+    """A Relationship element of a .rels part, with its target resolved to a part name."""
+
+    def __init__(self, rels_part, elem):
+        self.rels_part = rels_part
+        self.source = source_part_for(rels_part)
+        self.id = elem.get("Id")
+        self.type = elem.get("Type", "")
+        self.target = elem.get("Target")
+        self.line = elem.sourceline
+        self.target_part = self._resolve(self.target)
+
+    @property
+    def type_name(self):
+        """Last segment of the relationship type URL (e.g. "image")."""
+        return self.type.split("/")[-1] if "/" in self.type else self.type
+
+    def _resolve(self, target):
+        # External URLs (and empty targets) do not point into the package
+        if not target or target.startswith(("http", "mailto:")):
+            return None
+        if target.startswith("/"):
+            return posixpath.normpath(target.lstrip("/"))
+        # Targets are relative to the source part's folder; the package root
+        # for _rels/.rels, word/ for word/_rels/document.xml.rels
+        base = posixpath.dirname(self.source)
+        return posixpath.normpath(posixpath.join(base, target))
+
+
+class PackageGraph:
+    """Parts, content types and relationships of a package, indexed once per run.
+
+    The package is listed with a single walk, so checks look parts up in a set
+    instead of statting the file system. .rels parts and [Content_Types].xml are
+    parsed through the run's TreeRegistry the first time they are asked for.
+
+    Part names are package-relative POSIX paths without a leading slash, e.g.
+    "word/document.xml"; the package itself is "".
+    """
+
+    def __init__(self, root, trees):
+        """
+        Args:
+            root: Package root from open_package() (Path or PackagePath)
+            trees: TreeRegistry of the validation run
+        """
+        self.root = root
+        self.trees = trees
+        self.parts = self._list_parts(root)  # Walk order for directories
+        self.part_set = set(self.parts)
+        self._by_dir = {}
+        for part in self.parts:
+            self._by_dir.setdefault(posixpath.dirname(part), []).append(part)
+
+        self._relationships = {}  # .rels part -> [Relationship]
+        self._rels_errors = {}  # .rels part -> parse error
+        self._incoming = None  # target part -> [Relationship]
+        self._content_types = None
+
+    @staticmethod
+    def _list_parts(root):
+        if isinstance(root, PackagePath):
+            return sorted(root.package.files)
+        parts = []
+        for dirpath, _, filenames in os.walk(root):
+            directory = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            prefix = "" if directory == "." else f"{directory}/"
+            parts.extend(prefix + name for name in filenames)
+        return parts
+
+    @property
+    def rels_parts(self):
+        """All .rels parts, in walk order."""
+        return [part for part in self.parts if part.endswith(".rels")]
+
+    def has_part(self, part):
+        return part in self.part_set
+
+    def path(self, part):
+        """Return the path of a part below the package root."""
+        return self.root / part
+
+    def part_name(self, path):
+        """Return the part name of a path below the package root."""
+        return path.relative_to(self.root).as_posix()
+
+    def glob(self, pattern):
+        """Return parts matching pattern; "*" only matches within the last segment."""
+        directory, name = posixpath.split(pattern)
+        return [
+            part
+            for part in self._by_dir.get(directory, [])
+            if fnmatch.fnmatchcase(posixpath.basename(part), name)
+        ]
+
+    def relationships(self, rels_part):
+        """Return the Relationships of a .rels part, in document order.
+
+        Raises:
+            Exception: The error parsing the .rels part (raised again on every call)
+        """
+        relationships = self._relationships.get(rels_part)
+        if relationships is not None:
+            return relationships
+        if rels_part in self._rels_errors:
+            raise self._rels_errors[rels_part]
+
+        try:
+            root = self.trees.getroot(self.path(rels_part))
+        except Exception as e:
+            self._rels_errors[rels_part] = e
+            raise
+        relationships = [
+            Relationship(rels_part, elem)
+            for elem in root.iter(f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship")
+        ]
+        self._relationships[rels_part] = relationships
+        return relationships
+
+    def outgoing(self, part):
+        """Return the Relationships whose source is part ([] without a .rels part)."""
+        rels_part = rels_part_for(part)
+        if rels_part not in self.part_set:
+            return []
+        return self.relationships(rels_part)
+
+    def incoming(self, part):
+        """Return the Relationships targeting part, from every .rels that parses."""
+        if self._incoming is None:
+            self._incoming = {}
+            for rels_part in self.rels_parts:
+                try:
+                    relationships = self.relationships(rels_part)
+                except Exception:
+                    continue  # Reported by the checks that read the .rels part
+                for rel in relationships:
+                    if rel.target_part is not None:
+                        self._incoming.setdefault(rel.target_part, []).append(rel)
+        return self._incoming.get(part, [])
+
+    def content_types(self):
+        """Return (defaults, overrides) declared in [Content_Types].xml.
+
+        defaults maps lower-case extensions and overrides maps part names to
+        their content types.
+
+        Raises:
+            Exception: If [Content_Types].xml is missing or cannot be parsed
+        """
+        if self._content_types is None:
+            root = self.trees.getroot(self.path(CONTENT_TYPES_PART))
+            defaults = {}
+            overrides = {}
+            for override in root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+                part_name = override.get("PartName")
+                if part_name is not None:
+                    overrides[part_name.lstrip("/")] = override.get("ContentType")
+            for default in root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+                extension = default.get("Extension")
+                if extension is not None:
+                    defaults[extension.lower()] = default.get("ContentType")
+            self._content_types = (defaults, overrides)
+        return self._content_types
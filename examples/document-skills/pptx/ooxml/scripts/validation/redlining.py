@@ -2,117 +2,105 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
+import difflib
+import hashlib
+import itertools
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+from .package import open_package
+from .results import ValidationReport
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir)
+    def __init__(self, unpacked_dir, original_docx, verbose=False, budget=None):
+        # Unpacked directory, or a packed .docx read straight from the zip
+        self.unpacked_dir = open_package(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
+        self.report = ValidationReport(type(self).__name__, budget=budget)
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
+        return self.report.run_check("tracked_changes", self.validate_tracked_changes)
+
+    def validate_tracked_changes(self):
+        """Validate that removing Claude's tracked changes restores the original text."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
         if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
+            self._fail(f"Modified document.xml not found at {modified_file}")
             return False
+        if self.report.current is not None:
+            self.report.current.parts_examined = 1
+
+        def open_modified():
+            return modified_file.open("rb")
+
+        def open_original():
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                return zip_ref.open("word/document.xml")
 
-        # First, check if there are any tracked changes by Claude to validate
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified = self._stream_paragraphs(open_modified)
+        except lxml.etree.XMLSyntaxError as e:
+            self._fail(f"Error parsing XML files: {e}")
+            return False
 
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not modified.has_claude_changes:
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
-    def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        # Stream the original document.xml straight from the original docx
+        try:
+            original = self._stream_paragraphs(open_original)
+        except KeyError:
+            self._fail(f"Original document.xml not found in {self.original_docx}")
+            return False
+        except lxml.etree.XMLSyntaxError as e:
+            self._fail(f"Error parsing XML files: {e}")
+            return False
+        except Exception as e:
+            self._fail(f"Error unpacking original docx: {e}")
+            return False
+
+        if modified.hashes != original.hashes:
+            # Only paragraphs whose hashes differ are read again for their text
+            matcher = difflib.SequenceMatcher(
+                None, original.hashes, modified.hashes, autojunk=False
+            )
+            opcodes = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+            original_wanted = {i for _, i1, i2, _, _ in opcodes for i in range(i1, i2)}
+            modified_wanted = {j for _, _, _, j1, j2 in opcodes for j in range(j1, j2)}
+            original_texts = self._stream_paragraphs(
+                open_original, original_wanted
+            ).texts
+            modified_texts = self._stream_paragraphs(
+                open_modified, modified_wanted
+            ).texts
+
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(
+                opcodes, original_texts, modified_texts
+            )
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _generate_detailed_diff(self, opcodes, original_texts, modified_texts):
+        """Generate detailed character-level differences between the two texts."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +115,218 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show character diff of the changed paragraphs
+        diff = self._get_character_diff(opcodes, original_texts, modified_texts)
+        for line in diff.splitlines():
+            self.report.add_error(line, part="word/document.xml")
+        if diff:
+            error_parts.extend(["Differences:", "============", diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate diff (only whitespace differs)")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+    def _fail(self, message):
+        """Print a failure and record it in the report."""
+        self.report.add_error(message)
+        print(f"FAILED - {message}")
+
+    def _get_character_diff(self, opcodes, original_texts, modified_texts):
+        """Generate a character-level diff of changed paragraphs, one per line.
+
+        Args:
+            opcodes: Non-equal difflib opcodes aligning original and modified paragraphs
+            original_texts: Paragraph index -> text for changed original paragraphs
+            modified_texts: Paragraph index -> text for changed modified paragraphs
+
+        Only paragraphs that differ are compared character by character. Output
+        uses git's plain word-diff markers: [-removed-] and {+added+}.
+        """
+        lines = []
+        for _, i1, i2, j1, j2 in opcodes:
+            removed = [original_texts[i] for i in range(i1, i2)]
+            added = [modified_texts[j] for j in range(j1, j2)]
+
+            # Pair changed paragraphs in order; any surplus is wholly removed/added
+            paired = min(len(removed), len(added))
+            for original, modified in zip(removed[:paired], added[:paired]):
+                lines.append(self._diff_paragraph(original, modified))
+            lines.extend(f"[-{p}-]" for p in removed[paired:])
+            lines.extend(f"{{+{p}+}}" for p in added[paired:])
+
+        return "\n".join(line for line in lines if line.strip())
+
+    def _diff_paragraph(self, original, modified):
+        """Mark character-level changes between two versions of a paragraph."""
+        parts = []
+        matcher = difflib.SequenceMatcher(None, original, modified, autojunk=False)
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                parts.append(original[i1:i2])
+                continue
+            if op in ("delete", "replace"):
+                parts.append(f"[-{original[i1:i2]}-]")
+            if op in ("insert", "replace"):
+                parts.append(f"{{+{modified[j1:j2]}+}}")
+        return "".join(parts)
+
+    def _stream_paragraphs(self, open_source, wanted=None):
+        """Stream document.xml and hash the text of each paragraph.
+
+        Tracked changes authored by Claude are resolved on the fly: text inside
+        Claude's w:ins is dropped and w:delText inside Claude's w:del counts as
+        regular text, as if the changes had been rejected. Empty paragraphs are
+        skipped to avoid false positives when tracked insertions add only
+        structural elements without text content.
+
+        The parser only reports the end of paragraphs and tracked changes. Each
+        top-level paragraph is resolved once it ends and then dropped (with
+        everything before it), so memory stays flat however large the document is.
+
+        Args:
+            open_source: Callable returning a binary file object for document.xml
+            wanted: Paragraph indexes whose text should be kept in the result
+
+        Returns:
+            ParagraphStream with hashes, texts (for wanted) and has_claude_changes
+        """
+        w = self.namespaces["w"]
+        p_tag = f"{{{w}}}p"
+        ins_tag = f"{{{w}}}ins"
+        del_tag = f"{{{w}}}del"
+        author_attr = f"{{{w}}}author"
+
+        result = ParagraphStream()
+        wanted = wanted or set()
+        last_wanted = max(wanted) if wanted else None
+
+        with open_source() as source:
+            for _, elem in lxml.etree.iterparse(
+                source, events=("end",), tag=(p_tag, ins_tag, del_tag)
+            ):
+                if elem.tag != p_tag:
+                    if elem.get(author_attr) == "Claude":
+                        result.has_claude_changes = True
+                    continue
+
+                # Nested paragraphs are resolved with their top-level paragraph
+                if next(elem.iterancestors(p_tag), None) is not None:
+                    continue
+
+                for text in self._paragraph_texts(elem):
+                    if not text:
+                        continue
+                    index = len(result.hashes)
+                    result.hashes.append(
+                        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+                    )
+                    if index in wanted:
+                        result.texts[index] = text
+                if last_wanted is not None and len(result.hashes) > last_wanted:
+                    break  # Every wanted paragraph has been read
+
+                # Drop the finished paragraph and everything before it
+                elem.clear()
+                for node in itertools.chain([elem], elem.iterancestors()):
+                    parent = node.getparent()
+                    while parent is not None and node.getprevious() is not None:
+                        del parent[0]
+
+        return result
+
+    def _paragraph_texts(self, p_elem):
+        """Return the texts of a top-level paragraph and its nested paragraphs.
+
+        A nested paragraph (e.g. in a text box) contributes its text to the
+        enclosing paragraph as well, and texts are returned in document order of
+        the paragraphs' start tags.
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        w = self.namespaces["w"]
+        p_tag = f"{{{w}}}p"
+        t_tag = f"{{{w}}}t"
+        deltext_tag = f"{{{w}}}delText"
+        ins_tag = f"{{{w}}}ins"
+        del_tag = f"{{{w}}}del"
+        author_attr = f"{{{w}}}author"
+
+        claude_ins_depth = 0
+        claude_del_depth = 0
+        for ancestor in p_elem.iterancestors(ins_tag, del_tag):
+            if ancestor.get(author_attr) == "Claude":
+                if ancestor.tag == ins_tag:
+                    claude_ins_depth += 1
+                else:
+                    claude_del_depth += 1
+
+        # Paragraphs inside Claude's insertions disappear entirely
+        if claude_ins_depth:
+            return []
+
+        # Without nested paragraphs, each text element is resolved from its ancestors
+        if p_elem.find(f".//{p_tag}") is None:
+            parts = []
+            for elem in p_elem.iter(t_tag, deltext_tag):
+                if not elem.text:
+                    continue
+                in_claude_del = claude_del_depth > 0
+                for ancestor in elem.iterancestors(ins_tag, del_tag):
+                    if ancestor.get(author_attr) == "Claude":
+                        if ancestor.tag == ins_tag:
+                            break
+                        in_claude_del = True
+                else:
+                    if elem.tag == t_tag or in_claude_del:
+                        parts.append(elem.text)
+            return ["".join(parts)]
+
+        open_paragraphs = []  # Text parts of each open paragraph, or None if dropped
+        paragraphs = []  # Text parts of every kept paragraph, in start order
+        for event, elem in lxml.etree.iterwalk(
+            p_elem,
+            events=("start", "end"),
+            tag=(p_tag, t_tag, deltext_tag, ins_tag, del_tag),
+        ):
+            tag = elem.tag
+            is_claude_change = (
+                tag in (ins_tag, del_tag) and elem.get(author_attr) == "Claude"
+            )
+
+            if event == "start":
+                if is_claude_change:
+                    if tag == ins_tag:
+                        claude_ins_depth += 1
+                    else:
+                        claude_del_depth += 1
+                elif tag == p_tag:
+                    if claude_ins_depth:
+                        open_paragraphs.append(None)
+                    else:
+                        parts = []
+                        paragraphs.append(parts)
+                        open_paragraphs.append(parts)
+            elif tag == t_tag or (tag == deltext_tag and claude_del_depth):
+                if elem.text and not claude_ins_depth:
+                    for parts in open_paragraphs:
+                        if parts is not None:
+                            parts.append(elem.text)
+            elif tag == p_tag:
+                open_paragraphs.pop()
+            elif is_claude_change:
+                if tag == ins_tag:
+                    claude_ins_depth -= 1
+                else:
+                    claude_del_depth -= 1
+
+        return ["".join(parts) for parts in paragraphs]
+
+
+class ParagraphStream:
+    """Per-paragraph text hashes of a document.xml, from _stream_paragraphs."""
+
+    def __init__(self):
+        self.hashes = []
+        self.texts = {}
+        self.has_claude_changes = False
 
 
 if __name__ == "__main__":
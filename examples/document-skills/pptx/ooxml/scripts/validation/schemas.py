@@ -0,0 +1,81 @@
+"""
+Process-wide registry of compiled XSD schemas.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import lxml.etree
+
+
+class SchemaRegistry:
+    """Compiles each XSD schema once per process and times schema usage.
+
+    Compiling wml.xsd or pml.xsd pulls in the whole import graph under
+    ooxml/schemas, which costs far more than validating a single part. All
+    validators in a process share one registry so every schema is compiled
+    at most once, no matter how many parts or documents are validated.
+    """
+
+    def __init__(self):
+        self._schemas = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset the compile/validate counters (compiled schemas are kept)."""
+        self.compile_count = 0
+        self.compile_seconds = 0.0
+        self.validate_count = 0
+        self.validate_seconds = 0.0
+        self.cache_hits = 0
+
+    def get_schema(self, schema_path):
+        """Return the compiled schema for schema_path, compiling it on first use."""
+        key = str(Path(schema_path).resolve())
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is not None:
+                self.cache_hits += 1
+                return schema
+
+            start = time.perf_counter()
+            with open(key, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+                schema = lxml.etree.XMLSchema(xsd_doc)
+            self.compile_seconds += time.perf_counter() - start
+            self.compile_count += 1
+
+            self._schemas[key] = schema
+            return schema
+
+    def validate(self, schema_path, xml_doc):
+        """Validate an lxml document against the schema at schema_path.
+
+        Returns:
+            tuple: (is_valid, errors_set) where errors_set holds the error messages
+        """
+        schema = self.get_schema(schema_path)
+        with self._lock:
+            start = time.perf_counter()
+            is_valid = schema.validate(xml_doc)
+            errors = set() if is_valid else {e.message for e in schema.error_log}
+            self.validate_seconds += time.perf_counter() - start
+            self.validate_count += 1
+        return is_valid, errors
+
+    def stats(self):
+        """Return a snapshot of the registry counters."""
+        return {
+            "schemas_compiled": self.compile_count,
+            "compile_seconds": self.compile_seconds,
+            "schema_cache_hits": self.cache_hits,
+            "parts_validated": self.validate_count,
+            "validate_seconds": self.validate_seconds,
+        }
+
+
+# Shared by every validator (and Document.validate()) in this process
+SCHEMA_REGISTRY = SchemaRegistry()
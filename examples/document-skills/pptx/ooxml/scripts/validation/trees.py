@@ -0,0 +1,109 @@
+"""
+Per-run registry of parsed XML trees shared by all validation checks.
+"""
+
+import copy
+import hashlib
+from pathlib import Path
+
+import lxml.etree
+
+
+def canonical_digest(root):
+    """Return a digest of an element tree that ignores formatting whitespace.
+
+    unpack.py pretty-prints every part, so the unpacked file never matches the
+    original bytes. The digest covers root namespace declarations, tags,
+    attributes, comments and text, but drops whitespace-only text between
+    elements (indentation). Text of leaf elements is kept as-is, so a change
+    to a w:t containing only a space is still detected.
+    """
+    digest = hashlib.sha256()
+    for prefix, uri in sorted(root.nsmap.items(), key=lambda item: item[0] or ""):
+        digest.update(f"xmlns:{prefix or ''}={uri}\0".encode())
+
+    events = ("start", "end", "comment", "pi")
+    for event, node in lxml.etree.iterwalk(root, events=events):
+        if event == "end":
+            digest.update(b"\2")
+        elif event == "start":
+            digest.update(f"\1{node.tag}\0".encode())
+            for name, value in sorted(node.attrib.items()):
+                digest.update(f"{name}={value}\0".encode())
+            text = node.text
+            if text and (len(node) == 0 or text.strip()):
+                digest.update(f"\3{text}\0".encode())
+        else:
+            # Comment/PI tags are factory functions, so hash the event name instead
+            target = getattr(node, "target", "")
+            digest.update(f"\4{event}:{target}:{node.text}\0".encode())
+        if event != "start" and node is not root:
+            tail = node.tail
+            if tail and tail.strip():
+                digest.update(f"\5{tail}\0".encode())
+    return digest.hexdigest()
+
+
+class TreeRegistry:
+    """Parses each XML part at most once per validation run.
+
+    Trees handed out by get() and getroot() are shared between checks and must
+    be treated as read-only. Checks that need to modify a tree (for example to
+    strip mc:AlternateContent) must work on copy(), which duplicates the
+    already-parsed tree instead of parsing the file again.
+    """
+
+    def __init__(self):
+        self._trees = {}
+        self._failures = {}
+        self.parse_counts = {}
+        self.bytes_parsed = 0
+        self.copies = 0
+        self.accessed = set()  # Keys requested since last reset (see ValidationReport)
+
+    def get(self, path):
+        """Return the parsed lxml ElementTree for path.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed (the failure
+                is remembered, so the file is not parsed again)
+        """
+        key = str(path)
+        self.accessed.add(key)
+        tree = self._trees.get(key)
+        if tree is not None:
+            return tree
+        if key in self._failures:
+            raise self._failures[key]
+
+        if isinstance(path, str):
+            path = Path(path)
+        data = path.read_bytes()
+        self.parse_counts[key] = self.parse_counts.get(key, 0) + 1
+        self.bytes_parsed += len(data)
+        try:
+            tree = lxml.etree.fromstring(data).getroottree()
+        except lxml.etree.XMLSyntaxError as e:
+            self._failures[key] = e
+            raise
+
+        self._trees[key] = tree
+        return tree
+
+    def getroot(self, path):
+        """Return the root element of the parsed tree for path."""
+        return self.get(path).getroot()
+
+    def copy(self, path):
+        """Return a private, mutable copy of the parsed tree for path."""
+        self.copies += 1
+        return copy.deepcopy(self.get(path))
+
+    def stats(self):
+        """Return parse counters for this run."""
+        return {
+            "parts_parsed": len(self.parse_counts),
+            "parses": sum(self.parse_counts.values()),
+            "bytes_parsed": self.bytes_parsed,
+            "copies": self.copies,
+        }
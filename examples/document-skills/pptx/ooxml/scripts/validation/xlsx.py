@@ -0,0 +1,413 @@
+"""
+Validator for Excel workbook XML files against XSD schemas.
+"""
+
+import lxml.etree
+
+from .base import BaseSchemaValidator
+from .rules import local_name
+
+# Largest row and column numbers Excel allows
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+
+# Column letters -> column number, shared by every worksheet in the process
+_column_numbers = {}
+
+
+def column_number(letters):
+    """Return the 1-based number of a column (A -> 1, AA -> 27), or None if invalid."""
+    number = _column_numbers.get(letters)
+    if number is not None:
+        return number
+    if not (
+        1 <= len(letters) <= 3
+        and letters.isascii()
+        and letters.isalpha()
+        and letters.isupper()
+    ):
+        return None
+    number = 0
+    for letter in letters:
+        number = number * 26 + ord(letter) - 64
+    if number > MAX_COLUMN:
+        return None
+    _column_numbers[letters] = number
+    return number
+
+
+class XLSXSchemaValidator(BaseSchemaValidator):
+    """Validator for Excel workbook XML files against XSD schemas.
+
+    Worksheets can hold hundreds of thousands of cells, so they are kept out of
+    the checks that build full trees (well-formedness, IDs, XSD, ...) and are
+    streamed by validate_worksheets() instead. Workbook, styles, shared
+    strings and the other parts are checked like in the other validators.
+    """
+
+    # Excel spreadsheet namespace
+    SPREADSHEETML_NAMESPACE = (
+        "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    )
+
+    # Excel-specific element to relationship type mappings
+    ELEMENT_RELATIONSHIP_TYPES = {}
+
+    # Worksheet elements whose r:id points into the worksheet's .rels
+    WORKSHEET_RELATIONSHIP_ELEMENTS = [
+        "hyperlink",
+        "drawing",
+        "legacyDrawing",
+        "legacyDrawingHF",
+        "picture",
+        "oleObject",
+        "control",
+        "tablePart",
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Worksheets are streamed, never parsed into full trees
+        self.worksheet_files = [
+            self.package_graph.path(part)
+            for part in self.package_graph.glob("xl/worksheets/*.xml")
+        ]
+        streamed = set(self.worksheet_files)
+        self.xml_files = [f for f in self.xml_files if f not in streamed]
+
+        # Attribute values of all cells of a row, for the fast path of _check_row
+        namespaces = {"x": self.SPREADSHEETML_NAMESPACE}
+        self._cell_refs = lxml.etree.XPath(
+            "x:c/@r", namespaces=namespaces, smart_strings=False
+        )
+        self._cell_styles = lxml.etree.XPath(
+            "x:c/@s", namespaces=namespaces, smart_strings=False
+        )
+        self._shared_string_indexes = lxml.etree.XPath(
+            "x:c[@t='s']/x:v/text()", namespaces=namespaces, smart_strings=False
+        )
+
+    def validate(self):
+        """Run all validation checks and return True if all pass."""
+        # Test 0: XML well-formedness (worksheets are checked in Test 5)
+        if not self.run_check(self.validate_xml):
+            return False
+
+        # Test 1: Namespace declarations
+        all_valid = True
+        if not self.run_check(self.validate_namespaces):
+            all_valid = False
+
+        # Test 2: Unique IDs
+        if not self.run_check(self.validate_unique_ids):
+            all_valid = False
+
+        # Test 3: Relationship and file reference validation
+        if not self.run_check(self.validate_file_references):
+            all_valid = False
+
+        # Test 4: Content type declarations
+        if not self.run_check(self.validate_content_types):
+            all_valid = False
+
+        # Test 5: Worksheet structure, streamed
+        if not self.run_check(self.validate_worksheets):
+            all_valid = False
+
+        # Test 6: Relationship ID reference validation
+        if not self.run_check(self.validate_all_relationship_ids):
+            all_valid = False
+
+        # Test 7: XSD schema validation (the most expensive check, so it runs last)
+        if not self.run_check(self.validate_against_xsd):
+            all_valid = False
+
+        self.print_parse_stats()
+        return all_valid
+
+    def validate_worksheets(self):
+        """Validate worksheets by streaming them, in constant memory.
+
+        Each worksheet must be well-formed and declared in [Content_Types].xml,
+        rows and the cells within each row must be in ascending order, cell
+        references must match their row, shared-string and style indexes must
+        be in range, and r:id attributes must exist in the worksheet's .rels.
+        Every row is dropped once checked, however large the sheet is.
+        """
+        errors = []
+
+        if not self.worksheet_files:
+            if self.verbose:
+                print("PASSED - No worksheets found")
+            return True
+
+        try:
+            shared_strings, cell_formats = self._workbook_index_bounds()
+        except Exception as e:
+            self.report.add_error(f"Error reading workbook parts: {e}")
+            print(f"FAILED - Error reading workbook parts: {e}")
+            return False
+
+        try:
+            _, declared_parts = self.package_graph.content_types()
+        except Exception:
+            declared_parts = None  # Reported by validate_content_types
+
+        checked = 0
+        for sheet_file in self.worksheet_files:
+            if self.report.stop_reason(len(errors)):
+                break
+            self._check_worksheet(
+                sheet_file, shared_strings, cell_formats, declared_parts, errors
+            )
+            checked += 1
+
+        skipped = len(self.worksheet_files) - checked
+        if skipped:
+            reason = self.report.stop_reason(len(errors))
+            if self.report.current is not None:
+                self.report.current.stopped_early = reason
+            print(
+                f"SKIPPED - {skipped} of {len(self.worksheet_files)} worksheets "
+                f"not checked: {reason}"
+            )
+        if self.report.current is not None:
+            self.report.current.parts_examined = checked
+
+        if errors:
+            self.report.record_errors(errors)
+            print(f"FAILED - Found {len(errors)} worksheet validation errors:")
+            for error in errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print(f"PASSED - All {checked} worksheets are well-structured")
+            return True
+
+    def _workbook_index_bounds(self):
+        """Return (shared string count, cell format count) of the workbook.
+
+        Both are None when the workbook has no such part, in which case any
+        index into it is out of range.
+        """
+        graph = self.package_graph
+        workbooks = [
+            rel.target_part
+            for rel in graph.outgoing("")
+            if rel.type.endswith("/officeDocument") and rel.target_part
+        ]
+        shared_strings = cell_formats = None
+        for workbook in workbooks[:1]:
+            for rel in graph.outgoing(workbook):
+                if not rel.target_part or not graph.has_part(rel.target_part):
+                    continue
+                ns = self.SPREADSHEETML_NAMESPACE
+                if rel.type.endswith("/sharedStrings"):
+                    root = self.trees.getroot(graph.path(rel.target_part))
+                    shared_strings = len(root.findall(f"{{{ns}}}si"))
+                elif rel.type.endswith("/styles"):
+                    root = self.trees.getroot(graph.path(rel.target_part))
+                    cell_formats = len(root.findall(f"{{{ns}}}cellXfs/{{{ns}}}xf"))
+        return shared_strings, cell_formats
+
+    def _check_worksheet(
+        self, sheet_file, shared_strings, cell_formats, declared_parts, errors
+    ):
+        """Stream one worksheet, appending its errors to errors.
+
+        Only the ends of rows (and of elements with an r:id) are reported by
+        the parser; cells are checked with their row, which is then dropped.
+        """
+        graph = self.package_graph
+        part = graph.part_name(sheet_file)
+        ns = self.SPREADSHEETML_NAMESPACE
+        row_tag = f"{{{ns}}}row"
+        rid_attr = f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+        relationship_tags = [
+            f"{{{ns}}}{name}" for name in self.WORKSHEET_RELATIONSHIP_ELEMENTS
+        ]
+
+        if declared_parts is not None and part not in declared_parts:
+            errors.append(
+                f"  {part}: File with <worksheet> root not declared in [Content_Types].xml"
+            )
+
+        try:
+            rel_ids = {rel.id for rel in graph.outgoing(part)}
+        except Exception as e:
+            errors.append(f"  {part}: Error parsing relationships: {e}")
+            rel_ids = None
+
+        last_row = 0  # Number of the last row in order
+        try:
+            with sheet_file.open("rb") as source:
+                context = lxml.etree.iterparse(
+                    source, events=("end",), tag=[row_tag, *relationship_tags]
+                )
+                for _, elem in context:
+                    if elem.tag != row_tag:
+                        rid = elem.get(rid_attr)
+                        if rid and rel_ids is not None and rid not in rel_ids:
+                            errors.append(
+                                f"  {part}: Line {elem.sourceline}: "
+                                f"<{local_name(elem.tag)}> references non-existent "
+                                f"relationship '{rid}'"
+                            )
+                        continue
+
+                    # Rows without r follow the previous row
+                    r = elem.get("r")
+                    number = last_row + 1 if r is None else None
+                    if r is not None and r.isdigit() and 1 <= int(r) <= MAX_ROW:
+                        number = int(r)
+                    if number is None:
+                        errors.append(
+                            f"  {part}: Line {elem.sourceline}: "
+                            f"Invalid row number '{r}'"
+                        )
+                    elif number <= last_row:
+                        errors.append(
+                            f"  {part}: Line {elem.sourceline}: Row {number} "
+                            f"is out of order (after row {last_row})"
+                        )
+                    else:
+                        last_row = number
+
+                    style = elem.get("s")
+                    if style is not None:
+                        self._check_style(
+                            part,
+                            elem,
+                            f"Row {r or number}",
+                            style,
+                            cell_formats,
+                            errors,
+                        )
+                    if not self._row_cells_valid(
+                        elem, number, shared_strings, cell_formats
+                    ):
+                        self._check_cells(
+                            part, elem, number, shared_strings, cell_formats, errors
+                        )
+
+                    # Drop the checked row and everything before it
+                    elem.clear()
+                    parent = elem.getparent()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+                root = context.root
+                if local_name(root.tag) != "worksheet":
+                    errors.append(
+                        f"  {part}: Root element is <{local_name(root.tag)}>, "
+                        "expected <worksheet>"
+                    )
+        except lxml.etree.XMLSyntaxError as e:
+            errors.append(f"  {part}: Line {e.lineno}: {e.msg}")
+        except Exception as e:
+            errors.append(f"  {part}: Error: {e}")
+
+    def _row_cells_valid(self, row, row_number, shared_strings, cell_formats):
+        """Return True if every cell of a row passes the checks of _check_cells.
+
+        This runs for every row, so it only reads attribute values (in C, with
+        XPath) and leaves it to _check_cells to find and report any problem.
+        """
+        refs = self._cell_refs(row)
+        if row_number is None or len(refs) != len(row):
+            return False  # Invalid row number, or cells without r
+
+        row_digits = str(row_number)
+        last_column = 0
+        for ref in refs:
+            split = len(ref.rstrip("0123456789"))
+            column = column_number(ref[:split])
+            if column is None or column <= last_column or ref[split:] != row_digits:
+                return False
+            last_column = column
+
+        styles = cell_formats or 1  # Style 0 is the default, even without styles
+        for style in self._cell_styles(row):
+            if not style.isdigit() or int(style) >= styles:
+                return False
+
+        for index in self._shared_string_indexes(row):
+            index = index.strip()
+            if not index.isdigit() or int(index) >= (shared_strings or 0):
+                return False
+        return True
+
+    def _check_cells(self, part, row, row_number, shared_strings, cell_formats, errors):
+        """Check the cells of one row (row_number is None if the row's r is invalid)."""
+        ns = self.SPREADSHEETML_NAMESPACE
+        value_tag = f"{{{ns}}}v"
+        last_column = 0
+        for cell in row.iterchildren(f"{{{ns}}}c"):
+            ref = cell.get("r")
+            if ref is None:
+                # Cells without r follow the previous cell
+                column = last_column + 1
+                name = f"in row {row_number}"
+            else:
+                name = ref
+                split = len(ref.rstrip("0123456789"))
+                column = column_number(ref[:split])
+                digits = ref[split:]
+                if column is None or not digits or digits[0] == "0":
+                    errors.append(
+                        f"  {part}: Line {cell.sourceline}: "
+                        f"Invalid cell reference '{ref}'"
+                    )
+                    continue
+                if row_number is not None and int(digits) != row_number:
+                    errors.append(
+                        f"  {part}: Line {cell.sourceline}: "
+                        f"Cell {ref} is in row {row_number}"
+                    )
+                if column <= last_column:
+                    errors.append(
+                        f"  {part}: Line {cell.sourceline}: "
+                        f"Cell {ref} is out of order within its row"
+                    )
+                    column = last_column
+            last_column = column
+
+            if cell.get("t") == "s":
+                value = (cell.findtext(value_tag) or "").strip()
+                if not value.isdigit():
+                    errors.append(
+                        f"  {part}: Line {cell.sourceline}: Cell {name} has "
+                        f"invalid shared string index '{value}'"
+                    )
+                elif int(value) >= (shared_strings or 0):
+                    errors.append(
+                        f"  {part}: Line {cell.sourceline}: Cell {name} references "
+                        f"shared string {value}, but the workbook has "
+                        f"{shared_strings or 0} shared strings"
+                    )
+
+            style = cell.get("s")
+            if style is not None and style != "0":
+                self._check_style(
+                    part, cell, f"Cell {name}", style, cell_formats, errors
+                )
+
+    def _check_style(self, part, elem, label, style, cell_formats, errors):
+        """Check that a style index (s attribute) points to an existing cell format."""
+        if not style.isdigit():
+            errors.append(
+                f"  {part}: Line {elem.sourceline}: {label} has "
+                f"invalid style index '{style}'"
+            )
+        elif int(style) > 0 and int(style) >= (cell_formats or 0):
+            errors.append(
+                f"  {part}: Line {elem.sourceline}: {label} uses style "
+                f"{style}, but the workbook has {cell_formats or 0} cell formats"
+            )
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")